@@ -0,0 +1,321 @@
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+from nodes import UserInputNode, LogSink, QueueLogWriter, FileLogWriter, SimulatedBackend, BatchingBackend
+from nodes.logger_node import rotation_options
+
+_worker_log_writer: Optional[QueueLogWriter] = None
+_worker_orchestrators = None
+_result_stores: Dict[str, Any] = {}
+
+
+def init_batch_worker(record_queue):
+    global _worker_log_writer
+    _worker_log_writer = QueueLogWriter(record_queue)
+
+
+def _get_worker_orchestrators():
+    global _worker_orchestrators
+    if _worker_orchestrators is None:
+        from run_debate import OrchestratorPool
+        _worker_orchestrators = OrchestratorPool()
+    return _worker_orchestrators
+
+
+def _get_result_store(memo_options: Optional[dict]):
+    if not memo_options:
+        return None
+    key = json.dumps(memo_options, sort_keys=True)
+    store = _result_stores.get(key)
+    if store is None:
+        from nodes.result_store import DebateResultStore
+        store = _result_stores[key] = DebateResultStore(**memo_options)
+    return store
+
+
+def _build_orchestrator(job: Dict[str, Any], log_sink, backend=None, metrics=None):
+    from run_debate import DebateOrchestrator
+
+    return DebateOrchestrator(
+        seed=job.get("seed"),
+        log_path=job.get("log_path"),
+        persona_config=job.get("persona_config"),
+        log_options=job.get("log_options"),
+        debate_id=job["debate_id"],
+        log_sink=log_sink,
+        topic=job["topic"],
+        backend=backend,
+        verbose=False,
+        metrics=metrics,
+        result_store=_get_result_store(job.get("memo_options")),
+        total_rounds=job.get("total_rounds"),
+        executor=job.get("executor") or "graph",
+        pipeline=bool(job.get("pipeline")),
+        **(job.get("deadline_options") or {}),
+        **(job.get("context_options") or {}),
+    )
+
+
+def _orchestrator_key(job: Dict[str, Any]) -> str:
+    return json.dumps(
+        [
+            job.get("persona_config"),
+            job.get("log_path"),
+            job.get("log_options"),
+            job.get("backend_latency"),
+            job.get("memo_options"),
+            job.get("total_rounds"),
+            job.get("executor"),
+            job.get("pipeline"),
+            job.get("deadline_options"),
+            job.get("context_options"),
+        ],
+        sort_keys=True,
+    )
+
+
+def _checkout_orchestrator(orchestrators, key: str, job: Dict[str, Any], log_sink, backend, metrics=None):
+    orchestrator = orchestrators.acquire(key, lambda: _build_orchestrator(job, log_sink, backend, metrics))
+    return orchestrator.reset(topic=job["topic"], debate_id=job["debate_id"], seed=job.get("seed"))
+
+
+def _start_record(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "index": job["index"],
+        "topic": job["topic"],
+        "debate_id": job["debate_id"],
+    }
+
+
+def _finish_record(record: Dict[str, Any], final_state: Dict[str, Any]):
+    record.update({
+        "status": "ok",
+        "winner": final_state.get("winner"),
+        "confidence": final_state.get("winner_confidence"),
+        "final_scores": final_state.get("judge_analysis", {}).get("final_scores", {}),
+    })
+
+
+def _make_backend(backend_latency: Optional[float]):
+    if backend_latency is None:
+        return None
+    return SimulatedBackend(latency=backend_latency)
+
+
+def run_single_debate(job: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    record = _start_record(job)
+    orchestrators = _get_worker_orchestrators()
+    key = _orchestrator_key(job)
+    orchestrator = None
+    try:
+        orchestrator = _checkout_orchestrator(
+            orchestrators, key, job, _worker_log_writer, _make_backend(job.get("backend_latency"))
+        )
+        final_state = orchestrator.run()
+        _finish_record(record, final_state)
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if orchestrator is not None:
+            orchestrators.release(key, orchestrator)
+    record["duration_s"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+async def arun_single_debate(
+    job: Dict[str, Any],
+    log_writer,
+    backend,
+    generation_semaphore,
+    orchestrators,
+    metrics=None,
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    record = _start_record(job)
+    key = _orchestrator_key(job)
+    orchestrator = None
+    try:
+        orchestrator = _checkout_orchestrator(orchestrators, key, job, log_writer, backend, metrics)
+        final_state = await orchestrator.arun(generation_semaphore=generation_semaphore)
+        _finish_record(record, final_state)
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if orchestrator is not None:
+            orchestrators.release(key, orchestrator)
+    record["duration_s"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def iter_topic_lines(topics_file: str) -> Iterable[str]:
+    if topics_file == "-":
+        yield from sys.stdin
+        return
+    with open(topics_file, 'r', encoding='utf-8') as f:
+        yield from f
+
+
+class _ResultsWriter:
+
+    def __init__(self, results_path: str):
+        self.results_path = results_path
+        self.counts = {"ok": 0, "error": 0, "rejected": 0}
+        self._file = None
+
+    def __enter__(self) -> "_ResultsWriter":
+        results_dir = os.path.dirname(self.results_path)
+        if results_dir and not os.path.exists(results_dir):
+            os.makedirs(results_dir, exist_ok=True)
+        self._file = open(self.results_path, 'a', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+
+    def write(self, record: Dict[str, Any]):
+        self.counts[record["status"]] += 1
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+
+
+def _iter_jobs(
+    topics: Iterable[str],
+    results: _ResultsWriter,
+    seed: Optional[int],
+    log_path: str,
+    persona_config: Optional[dict],
+    log_options: Optional[dict],
+) -> Iterator[Dict[str, Any]]:
+    user_input = UserInputNode()
+    for index, raw_topic, topic, error_msg in user_input.read_topics(topics):
+        if topic is None:
+            results.write({
+                "index": index,
+                "topic": raw_topic,
+                "status": "rejected",
+                "error": error_msg,
+            })
+            continue
+
+        yield {
+            "index": index,
+            "topic": topic,
+            "debate_id": uuid.uuid4().hex[:12],
+            "seed": seed,
+            "log_path": log_path,
+            "persona_config": persona_config,
+            "log_options": log_options,
+        }
+
+
+def run_batch(
+    topics: Iterable[str],
+    results_path: str,
+    log_path: str,
+    seed: Optional[int] = None,
+    persona_config: Optional[dict] = None,
+    log_options: Optional[dict] = None,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    backend_latency: Optional[float] = None,
+    memo_options: Optional[dict] = None,
+    total_rounds: Optional[int] = None,
+    executor: str = "graph",
+    pipeline: bool = False,
+    deadline_options: Optional[dict] = None,
+    context_options: Optional[dict] = None,
+) -> Dict[str, int]:
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    results = _ResultsWriter(results_path)
+
+    with LogSink(log_path, **rotation_options(log_options)) as sink, results:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_batch_worker,
+            initargs=(sink.queue,),
+        ) as pool:
+            pending = set()
+            for job in _iter_jobs(topics, results, seed, log_path, persona_config, log_options):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results.write(future.result())
+
+                job["backend_latency"] = backend_latency
+                job["memo_options"] = memo_options
+                job["total_rounds"] = total_rounds
+                job["executor"] = executor
+                job["pipeline"] = pipeline
+                job["deadline_options"] = deadline_options
+                job["context_options"] = context_options
+                pending.add(pool.submit(run_single_debate, job))
+
+            for future in wait(pending).done:
+                results.write(future.result())
+
+    return results.counts
+
+
+async def arun_batch(
+    topics: Iterable[str],
+    results_path: str,
+    log_path: str,
+    seed: Optional[int] = None,
+    persona_config: Optional[dict] = None,
+    log_options: Optional[dict] = None,
+    max_pending: int = 100,
+    max_in_flight: Optional[int] = None,
+    backend_latency: Optional[float] = None,
+    metrics=None,
+    memo_options: Optional[dict] = None,
+    total_rounds: Optional[int] = None,
+    executor: str = "graph",
+    pipeline: bool = False,
+    deadline_options: Optional[dict] = None,
+    context_options: Optional[dict] = None,
+    generation_batching: Optional[dict] = None,
+) -> Dict[str, int]:
+    from run_debate import OrchestratorPool
+
+    results = _ResultsWriter(results_path)
+    backend = _make_backend(backend_latency)
+    if backend is not None and generation_batching:
+        backend = BatchingBackend(backend, **generation_batching)
+    orchestrators = OrchestratorPool(max_idle_per_key=max_pending)
+    generation_semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+    try:
+        with FileLogWriter(log_path, **rotation_options(log_options)) as log_writer, results:
+            pending = set()
+            for job in _iter_jobs(topics, results, seed, log_path, persona_config, log_options):
+                if len(pending) >= max_pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        results.write(task.result())
+
+                job["memo_options"] = memo_options
+                job["total_rounds"] = total_rounds
+                job["executor"] = executor
+                job["pipeline"] = pipeline
+                job["deadline_options"] = deadline_options
+                job["context_options"] = context_options
+                pending.add(asyncio.ensure_future(
+                    arun_single_debate(job, log_writer, backend, generation_semaphore, orchestrators, metrics)
+                ))
+
+            if pending:
+                done, _ = await asyncio.wait(pending)
+                for task in done:
+                    results.write(task.result())
+    finally:
+        orchestrators.close()
+
+    return results.counts
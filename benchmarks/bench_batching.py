@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+from nodes.backends import SimulatedBackend
+from nodes.batching import BatchingBackend
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+class StandInServer(SimulatedBackend):
+
+    def __init__(self, slots: int, **kwargs):
+        super().__init__(**kwargs)
+        self.slots = slots
+        self._slots = None
+
+    async def _occupy(self, call):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.slots)
+        async with self._slots:
+            return await call
+
+    async def agenerate(self, request):
+        return await self._occupy(super().agenerate(request))
+
+    async def agenerate_batch(self, requests):
+        return await self._occupy(super().agenerate_batch(requests))
+
+
+class TimedBackend:
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.name = backend.name
+        self.deterministic = backend.deterministic
+        self.latencies = []
+
+    async def agenerate(self, request):
+        started = time.perf_counter()
+        result = await self.backend.agenerate(request)
+        self.latencies.append(time.perf_counter() - started)
+        return result
+
+
+async def run_config(batching, args, log_path: str) -> dict:
+    server = StandInServer(args.slots, latency=args.latency, batch_item_latency=args.item_latency)
+    backend = TimedBackend(BatchingBackend(server, **batching) if batching else server)
+    orchestrators = [
+        DebateOrchestrator(seed=42, log_path=log_path, topic=TOPIC, verbose=False, backend=backend)
+        for _ in range(args.debates)
+    ]
+    for index, orchestrator in enumerate(orchestrators):
+        orchestrator.reset(topic=TOPIC, debate_id=f"bench-{index}", seed=42 + index)
+    semaphore = asyncio.Semaphore(args.max_in_flight)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(orchestrator.arun(semaphore) for orchestrator in orchestrators))
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsed": elapsed,
+        "requests_per_s": server.calls / elapsed,
+        "server_calls": server.batch_calls + (server.calls if not batching else 0),
+        "mean_batch": backend.backend.mean_batch_size if batching else 1.0,
+        "p50_ms": statistics.median(backend.latencies) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generation throughput and latency with and without micro-batching")
+    parser.add_argument("--debates", type=int, default=64, help="Concurrent debates sharing one backend")
+    parser.add_argument("--max-in-flight", type=int, default=32, help="Model requests allowed in flight at once")
+    parser.add_argument("--slots", type=int, default=4, help="Server calls the stand-in server runs at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fixed cost of one server call in seconds")
+    parser.add_argument("--item-latency", type=float, default=0.002, help="Extra cost per request in a batch in seconds")
+    args = parser.parse_args()
+
+    configs = {"unbatched": None}
+    for size in (4, 8, 16, 32):
+        for wait in (0.002, 0.01):
+            configs[f"size={size} wait={wait * 1000:g}ms"] = {"max_batch_size": size, "max_wait": wait}
+
+    print(f"{'config':>22} {'elapsed s':>10} {'req/s':>8} {'server calls':>13} {'mean batch':>11} {'p50 ms':>8}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        log_path = os.path.join(work_dir, "bench_batching.jsonl")
+        for name, batching in configs.items():
+            result = asyncio.run(run_config(batching, args, log_path))
+            print(
+                f"{name:>22} {result['elapsed']:>10.3f} {result['requests_per_s']:>8.0f} {result['server_calls']:>13} "
+                f"{result['mean_batch']:>11.1f} {result['p50_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+from nodes.backends import SimulatedBackend
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+def run_policy(options: dict, args, log_path: str) -> dict:
+    backend = SimulatedBackend(
+        latency=args.latency,
+        jitter=args.latency / 2,
+        seed=7,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+    )
+    orchestrator = DebateOrchestrator(seed=42, log_path=log_path, topic=TOPIC, verbose=False, backend=backend, **options)
+    durations, fallbacks, hedges = [], 0, 0
+    for index in range(args.debates):
+        orchestrator.reset(topic=TOPIC, debate_id=f"bench-{index}", seed=42 + index)
+        started = time.perf_counter()
+        orchestrator.run()
+        durations.append(time.perf_counter() - started)
+        fallbacks += orchestrator.agent_a.fallbacks + orchestrator.agent_b.fallbacks
+        hedges += orchestrator.agent_a.hedges + orchestrator.agent_b.hedges
+    durations.sort()
+    return {
+        "p50": statistics.median(durations),
+        "max": durations[-1],
+        "fallbacks": fallbacks,
+        "hedges": hedges,
+        "calls": backend.calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Debate latency under a tail-heavy backend with and without deadlines or hedging")
+    parser.add_argument("--debates", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="Typical backend latency in seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.02, help="Fraction of calls that hit the slow tail")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="Extra latency of a slow call in seconds")
+    args = parser.parse_args()
+
+    policies = {
+        "none": {},
+        "turn-timeout": {"turn_timeout": args.latency * 5},
+        "hedge-p95": {"hedge_quantile": 0.95},
+        "hedge+timeout": {"hedge_quantile": 0.95, "turn_timeout": args.latency * 5},
+    }
+    print(f"{'policy':>14} {'p50 s':>8} {'max s':>8} {'fallbacks':>10} {'hedges':>8} {'calls':>7}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        log_path = os.path.join(work_dir, "bench_deadlines.jsonl")
+        for name, options in policies.items():
+            result = run_policy(options, args, log_path)
+            print(
+                f"{name:>14} {result['p50']:>8.3f} {result['max']:>8.3f} {result['fallbacks']:>10} "
+                f"{result['hedges']:>8} {result['calls']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
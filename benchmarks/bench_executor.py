@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+class StubAgent:
+
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.persona_name = "stub"
+
+    def __call__(self, state):
+        return {"current_agent": self.agent_id, "current_argument": "stub argument", "node_execution": {}}
+
+    def reset(self):
+        pass
+
+
+def debates_per_second(executor: str, debates: int, rounds, stub_agents: bool) -> float:
+    orchestrator = DebateOrchestrator(
+        seed=42,
+        log_path=os.devnull,
+        topic=TOPIC,
+        verbose=False,
+        total_rounds=rounds,
+        executor=executor,
+    )
+    if stub_agents:
+        orchestrator.agent_a = StubAgent("AgentA")
+        orchestrator.agent_b = StubAgent("AgentB")
+    orchestrator.run()
+
+    started = time.perf_counter()
+    for index in range(debates):
+        orchestrator.reset(topic=TOPIC, debate_id=f"bench-{index}", seed=42).run()
+    return debates / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Debate throughput of the LangGraph graph versus the plain-loop executor")
+    parser.add_argument("--debates", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=None, help="Turns per debate (default: 8)")
+    parser.add_argument("--stub-agents", action="store_true",
+                        help="Replace both agents with constant stubs to isolate orchestration overhead")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'executor':>10} {'debates/s':>12} {'ms/debate':>12}")
+    for executor in DebateOrchestrator.EXECUTORS:
+        rate = results[executor] = debates_per_second(executor, args.debates, args.rounds, args.stub_agents)
+        print(f"{executor:>10} {rate:>12.1f} {1000 / rate:>12.3f}")
+    print(f"\nloop speedup: {results['loop'] / results['graph']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+def run_long_debate(rounds: int, long_debate):
+    stamps = []
+    orchestrator = DebateOrchestrator(
+        seed=42,
+        log_path=os.devnull,
+        topic=TOPIC,
+        verbose=False,
+        total_rounds=rounds,
+        long_debate=long_debate,
+        on_event=lambda event: stamps.append(time.perf_counter()),
+    )
+    started = time.perf_counter()
+    orchestrator.run()
+    return time.perf_counter() - started, stamps
+
+
+def per_round_by_decile(stamps) -> list:
+    size = len(stamps) // 10
+    if size < 2:
+        return []
+    return [(stamps[(i + 1) * size - 1] - stamps[i * size]) / (size - 1) * 1e3 for i in range(10)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-round cost of long debates, by decile of the debate")
+    parser.add_argument("--rounds", type=str, default="100,1000,10000")
+    parser.add_argument("--full-history", action="store_true",
+                        help="Disable long-debate mode to compare against the unbounded per-turn analysis")
+    args = parser.parse_args()
+
+    long_debate = False if args.full_history else None
+    print(f"{'rounds':>8} {'total s':>10} {'ms/round':>10}   ms/round by decile")
+    for rounds in (int(r) for r in args.rounds.split(",")):
+        elapsed, stamps = run_long_debate(rounds, long_debate)
+        deciles = " ".join(f"{value:6.2f}" for value in per_round_by_decile(stamps))
+        print(f"{rounds:>8} {elapsed:>10.2f} {elapsed / rounds * 1e3:>10.2f}   {deciles}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes import AgentNode, MemoryNode, CoordinatorNode, JudgeNode, LoggerNode
+
+TOPIC = "The role of artificial intelligence in society"
+DEFAULT_SIZES = [8, 100, 1000, 10000, 100000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "bench_nodes.json")
+
+
+def synthetic_memory(turns: int, seed: int = 42) -> list:
+    agents = [AgentNode("AgentA", "scientist", seed=seed), AgentNode("AgentB", "philosopher", seed=seed)]
+    memory = []
+    for turn in range(turns):
+        agent = agents[turn % 2]
+        text = agent._template_based_generation(TOPIC, "", turn + 1)
+        memory.append({
+            "round": turn + 1,
+            "agent": agent.agent_id,
+            "text": f"{text} Turn {turn + 1}.",
+            "timestamp": "2024-01-01T00:00:00",
+            "meta": {"argument_length": len(text)},
+        })
+    return memory
+
+
+def case_agent_generate_argument(memory: list):
+    agent = AgentNode("AgentA", "scientist", seed=42)
+    memory_slice = [e for e in memory if e["agent"] != "AgentA"][-5:]
+    previous = [e["text"] for e in memory if e["agent"] == "AgentA"]
+    round_num = len(memory) + 1
+    return lambda: agent.generate_argument(TOPIC, memory_slice, round_num, previous_arguments=list(previous))
+
+
+def case_agent_build_context(memory: list):
+    agent = AgentNode("AgentA", "scientist", seed=42)
+    memory_slice = [e for e in memory if e["agent"] != "AgentA"]
+    agent._build_context(memory_slice)
+    return lambda: agent._build_context(memory_slice)
+
+
+def case_memory_add_entry(memory: list):
+    node = MemoryNode()
+    node.memory_store = list(memory)
+    round_num = len(memory) + 1
+    return lambda: node.add_entry(round_num, "AgentA", "Benchmark argument", {"argument_length": 18})
+
+
+def case_memory_get_slice(memory: list):
+    node = MemoryNode()
+    node.memory_store = list(memory)
+    return lambda: node.get_memory_slice("AgentA")
+
+
+def case_memory_search(memory: list):
+    node = MemoryNode()
+    node.memory_store = list(memory)
+    query = memory[-1]["text"]
+    node.search(query)
+    return lambda: node.search(query, k=5, agent_filter="AgentB")
+
+
+def case_coordinator_call(memory: list):
+    node = CoordinatorNode()
+    state = {"memory": memory, "turn_index": 0}
+    return lambda: node(state)
+
+
+def case_judge_determine_winner(memory: list):
+    node = JudgeNode(seed=42)
+    return lambda: node.determine_winner(memory)
+
+
+def case_logger_log_turn(memory: list):
+    node = LoggerNode(log_path=os.devnull, debate_id="bench")
+    latest = memory[-1]
+    data = {
+        "node": "MemoryNode",
+        "input": {"round": latest["round"], "agent": latest["agent"], "argument_length": len(latest["text"])},
+        "output": {"total_entries": len(memory), "latest_entry": latest},
+    }
+
+    def run():
+        node.log("node_execution", data)
+        node.log_entries.clear()
+    return run
+
+
+def case_logger_log_snapshot(memory: list):
+    node = LoggerNode(log_path=os.devnull, debate_id="bench")
+
+    def run():
+        node.log_memory_snapshot(memory)
+        node.log_entries.clear()
+    return run
+
+
+CASES = {
+    "agent.generate_argument": case_agent_generate_argument,
+    "agent.build_context": case_agent_build_context,
+    "memory.add_entry": case_memory_add_entry,
+    "memory.get_memory_slice": case_memory_get_slice,
+    "memory.search": case_memory_search,
+    "coordinator.__call__": case_coordinator_call,
+    "judge.determine_winner": case_judge_determine_winner,
+    "logger.log_turn": case_logger_log_turn,
+    "logger.log_snapshot": case_logger_log_snapshot,
+}
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(fn, max_calls: int, time_budget: float) -> dict:
+    durations = []
+    deadline = time.perf_counter() + time_budget
+    while len(durations) < max_calls:
+        started = time.perf_counter_ns()
+        fn()
+        durations.append((time.perf_counter_ns() - started) / 1000.0)
+        if time.perf_counter() >= deadline and len(durations) >= 3:
+            break
+    durations.sort()
+    return {
+        "calls": len(durations),
+        "mean_us": statistics.fmean(durations),
+        "p50_us": percentile(durations, 50),
+        "p90_us": percentile(durations, 90),
+        "p99_us": percentile(durations, 99),
+        "max_us": durations[-1],
+    }
+
+
+def complexity_slope(points: list) -> float:
+    points = [(math.log(n), math.log(max(t, 1e-3))) for n, t in points]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def run_case(name: str, sizes: list, memories: dict, args) -> dict:
+    results = {}
+    points = []
+    for size in sizes:
+        if points:
+            slope = max(complexity_slope(points) or 1.0, 1.0)
+            last_size, last_p50 = points[-1]
+            predicted_s = last_p50 * (size / last_size) ** slope / 1e6
+            if predicted_s > args.max_call_seconds:
+                results[str(size)] = {"skipped": f"predicted {predicted_s:.1f}s per call"}
+                continue
+
+        fn = CASES[name](memories[size])
+        fn()
+        stats = measure(fn, args.max_calls, args.time_per_size)
+        results[str(size)] = stats
+        points.append((size, stats["p50_us"]))
+        print(
+            f"{name:<26} {size:>7} {stats['p50_us']:>12.1f} {stats['p90_us']:>12.1f} "
+            f"{stats['p99_us']:>12.1f} {stats['calls']:>6}",
+            flush=True,
+        )
+
+    slope = complexity_slope(points)
+    return {"sizes": results, "slope": round(slope, 3) if slope is not None else None}
+
+
+def compare(results: dict, baseline: dict, threshold: float, slope_tolerance: float) -> list:
+    regressions = []
+    for name, current in results["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if before is None:
+            continue
+        for size, stats in current["sizes"].items():
+            old = before["sizes"].get(size, {})
+            if "p50_us" not in stats or "p50_us" not in old:
+                continue
+            ratio = stats["p50_us"] / max(old["p50_us"], 1e-3)
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    f"{name} @ {size} turns: p50 {stats['p50_us']:.1f} us vs baseline {old['p50_us']:.1f} us ({ratio:.2f}x)"
+                )
+        same_sizes = set(current["sizes"]) == set(before["sizes"])
+        if same_sizes and current["slope"] is not None and before.get("slope") is not None:
+            if current["slope"] > before["slope"] + slope_tolerance:
+                regressions.append(
+                    f"{name}: complexity slope {current['slope']:.2f} vs baseline {before['slope']:.2f}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-node latency and scaling benchmark over synthetic debates")
+    parser.add_argument("--sizes", type=str, default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated debate lengths in turns")
+    parser.add_argument("--only", action="append", default=[], choices=list(CASES),
+                        help="Run only the named case (repeatable)")
+    parser.add_argument("--max-calls", type=int, default=200, help="Maximum timed calls per case and size")
+    parser.add_argument("--time-per-size", type=float, default=0.5, help="Time budget in seconds per case and size")
+    parser.add_argument("--max-call-seconds", type=float, default=2.0,
+                        help="Skip sizes whose predicted single-call latency exceeds this")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this path")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a previous JSON result")
+    parser.add_argument("--compare", action="store_true",
+                        help=f"Compare against the committed baseline ({os.path.relpath(DEFAULT_BASELINE)})")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the committed baseline with this run")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown (default: 0.25 = 25%%)")
+    parser.add_argument("--slope-tolerance", type=float, default=0.3, help="Allowed increase in complexity slope")
+    args = parser.parse_args()
+    if args.compare and args.baseline is None:
+        args.baseline = DEFAULT_BASELINE
+    if args.update_baseline and args.output is None:
+        args.output = DEFAULT_BASELINE
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    names = args.only or list(CASES)
+    memories = {size: synthetic_memory(size) for size in sizes}
+
+    print(f"{'case':<26} {'turns':>7} {'p50 us':>12} {'p90 us':>12} {'p99 us':>12} {'calls':>6}")
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "cases": {name: run_case(name, sizes, memories, args) for name in names},
+    }
+
+    print(f"\n{'case':<26} {'slope':>6}")
+    for name, case in results["cases"].items():
+        slope = "n/a" if case["slope"] is None else f"{case['slope']:.2f}"
+        print(f"{name:<26} {slope:>6}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold, args.slope_tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+from nodes.backends import SimulatedBackend
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+def seconds_per_debate(pipeline: bool, debates: int, latency: float, rounds, log_path: str) -> float:
+    orchestrator = DebateOrchestrator(
+        seed=42,
+        log_path=log_path,
+        topic=TOPIC,
+        verbose=False,
+        backend=SimulatedBackend(latency=latency),
+        total_rounds=rounds,
+        pipeline=pipeline,
+    )
+    started = time.perf_counter()
+    for index in range(debates):
+        orchestrator.reset(topic=TOPIC, debate_id=f"bench-{index}", seed=42).run()
+    return (time.perf_counter() - started) / debates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Debate wall time with post-turn work inline versus pipelined")
+    parser.add_argument("--debates", type=int, default=5)
+    parser.add_argument("--latencies", type=str, default="0,0.005,0.02,0.05",
+                        help="Comma-separated simulated backend latencies in seconds")
+    parser.add_argument("--rounds", type=int, default=None, help="Turns per debate (default: 8)")
+    args = parser.parse_args()
+
+    print(f"{'latency s':>10} {'inline ms':>12} {'pipelined ms':>14} {'saved ms':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        log_path = os.path.join(work_dir, "bench_pipeline.jsonl")
+        for latency in (float(value) for value in args.latencies.split(",")):
+            inline = seconds_per_debate(False, args.debates, latency, args.rounds, log_path) * 1e3
+            pipelined = seconds_per_debate(True, args.debates, latency, args.rounds, log_path) * 1e3
+            print(f"{latency:>10.3f} {inline:>12.2f} {pipelined:>14.2f} {inline - pipelined:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
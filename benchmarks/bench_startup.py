@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def scenarios(work_dir: str) -> dict:
+    return {
+        "help": {
+            "argv": ["run_debate.py", "--help"],
+            "stdin": None,
+        },
+        "seeded_debate": {
+            "argv": ["run_debate.py", "--seed", "42", "--log-path", os.path.join(work_dir, "startup_debate.jsonl")],
+            "stdin": "The role of scientific evidence in policy making\n",
+        },
+        "generate_dag": {
+            "argv": [os.path.join(REPO_ROOT, "generate_dag.py")],
+            "stdin": None,
+            "cwd": work_dir,
+        },
+    }
+
+
+def parse_importtime(stderr: str, top: int) -> dict:
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "top_level": len(indent) <= 1,
+            })
+
+    top_level = [m for m in modules if m["top_level"]]
+    return {
+        "modules_imported": len(modules),
+        "total_import_us": sum(m["cumulative_us"] for m in top_level),
+        "top_imports": [
+            {"module": m["module"], "cumulative_us": m["cumulative_us"]}
+            for m in sorted(top_level, key=lambda m: m["cumulative_us"], reverse=True)[:top]
+        ],
+    }
+
+
+def run_once(argv: list, stdin: str, cwd: str, importtime: bool) -> tuple:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += argv
+
+    started = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        cwd=cwd,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited with {completed.returncode}:\n{completed.stderr[-2000:]}")
+    return elapsed, completed.stderr
+
+
+def measure(name: str, scenario: dict, repeats: int, top: int) -> dict:
+    cwd = scenario.get("cwd", REPO_ROOT)
+    wall = []
+    for _ in range(repeats):
+        elapsed, _ = run_once(scenario["argv"], scenario["stdin"], cwd, importtime=False)
+        wall.append(elapsed)
+
+    _, stderr = run_once(scenario["argv"], scenario["stdin"], cwd, importtime=True)
+    return {
+        "name": name,
+        "repeats": repeats,
+        "wall_s": {
+            "min": min(wall),
+            "median": statistics.median(wall),
+            "max": max(wall),
+        },
+        "imports": parse_importtime(stderr, top),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    previous = {r["name"]: r for r in baseline.get("scenarios", [])}
+    for result in results["scenarios"]:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+        ratio = result["wall_s"]["median"] / before["wall_s"]["median"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{result['name']}: median {result['wall_s']['median'] * 1000:.1f} ms vs "
+                f"baseline {before['wall_s']['median'] * 1000:.1f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the debate CLI")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Top-level imports to report per scenario")
+    parser.add_argument("--only", action="append", default=[], help="Run only the named scenario (repeatable)")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this path")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a previous JSON result")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        selected = {
+            name: scenario for name, scenario in scenarios(work_dir).items()
+            if not args.only or name in args.only
+        }
+        results = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scenarios": [measure(name, s, args.repeats, args.top) for name, s in selected.items()],
+        }
+
+    print(f"{'scenario':<16} {'median ms':>10} {'min ms':>10} {'imports ms':>11} {'modules':>8}")
+    for result in results["scenarios"]:
+        print(
+            f"{result['name']:<16} {result['wall_s']['median'] * 1000:>10.1f} {result['wall_s']['min'] * 1000:>10.1f} "
+            f"{result['imports']['total_import_us'] / 1000:>11.1f} {result['imports']['modules_imported']:>8}"
+        )
+        for item in result["imports"]["top_imports"][:3]:
+            print(f"{'':<16}   {item['module']:<40} {item['cumulative_us'] / 1000:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nStartup regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo startup regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
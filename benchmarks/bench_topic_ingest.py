@@ -0,0 +1,86 @@
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes import UserInputNode
+
+WORDS = ["should", "cities", "ban", "cars", "downtown", "artificial", "intelligence", "replace", "teachers",
+         "universal", "basic", "income", "space", "exploration", "worth", "the", "cost", "of", "<b>", "{x}"]
+
+
+def write_topics(path: str, count: int, seed: int = 42):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            if i % 50 == 0:
+                f.write("tiny\n")
+            elif i % 97 == 0:
+                f.write("\n")
+            else:
+                separator = " \t " if i % 7 == 0 else " "
+                f.write(separator.join(rng.choice(WORDS) for _ in range(rng.randint(3, 12))) + "\n")
+
+
+def legacy_screen(node: UserInputNode, path: str):
+    accepted = rejected = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            sanitized = ' '.join(re.sub(r'[<>{}\\]', '', line).split()).strip()
+            is_valid, _ = node.validate_topic(sanitized)
+            if is_valid:
+                accepted += 1
+            else:
+                rejected += 1
+    return accepted, rejected
+
+
+def read_only(path: str):
+    lines = 0
+    with open(path, 'r', encoding='utf-8', buffering=UserInputNode.READ_BUFFER_SIZE) as f:
+        for _ in f:
+            lines += 1
+    return lines, 0
+
+
+def streaming_screen(node: UserInputNode, path: str):
+    rejects = []
+    accepted = sum(1 for _ in node.ingest_topic_file(path, on_reject=lambda i, raw, reason: rejects.append(i)))
+    return accepted, len(rejects)
+
+
+def timed(label: str, fn, lines: int):
+    started = time.perf_counter()
+    accepted, rejected = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<20} {elapsed:>8.3f}s {lines / elapsed / 1e6:>10.2f}M lines/s  accepted={accepted} rejected={rejected}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Topic screening throughput: streaming ingestion vs the regex path")
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Candidate topics to generate")
+    args = parser.parse_args()
+
+    node = UserInputNode()
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "topics.txt")
+        write_topics(path, args.lines)
+        read_only(path)
+
+        baseline = timed("read only", lambda: read_only(path), args.lines)
+        legacy = timed("regex + validate", lambda: legacy_screen(node, path), args.lines)
+        streaming = timed("ingest_topic_file", lambda: streaming_screen(node, path), args.lines)
+
+    print(f"\nSpeedup over regex path: {legacy / streaming:.2f}x; overhead over raw read: {streaming / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
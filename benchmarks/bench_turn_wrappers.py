@@ -0,0 +1,81 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator
+
+
+class StubAgent:
+
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.persona_name = "stub"
+
+    def __call__(self, state):
+        return {"current_agent": self.agent_id, "current_argument": "stub argument", "node_execution": {}}
+
+
+class StubMemory:
+
+    def __call__(self, state):
+        return {"memory": [], "node_execution": {}}
+
+
+class StubLogger:
+
+    def __call__(self, state):
+        return {"log_path": "stub.jsonl", "node_execution": {}}
+
+    def close(self):
+        pass
+
+
+def legacy_turn(orchestrator, state):
+    result_agent = orchestrator.agent_a(state)
+    print("\n" + "=" * 80)
+    print(f"Round {state.get('current_round', '?')} - AgentA (stub):")
+    print("-" * 80)
+    print(result_agent.get("current_argument", ""))
+    print("=" * 80 + "\n")
+    state_after_agent = {**state, **result_agent}
+    result_memory = orchestrator.memory_node(state_after_agent)
+    state_after_memory = {**state_after_agent, **result_memory}
+    result_logger = orchestrator.logger_node(state_after_memory)
+    return {**state_after_memory, "log_path": result_logger.get("log_path", state.get("log_path", ""))}
+
+
+def time_per_call(fn, state, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(state)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-turn orchestration overhead versus state size")
+    parser.add_argument("--repeats", type=int, default=2000)
+    parser.add_argument("--sizes", type=str, default="16,256,4096,65536")
+    args = parser.parse_args()
+
+    orchestrator = DebateOrchestrator(seed=42, log_path=os.devnull)
+    orchestrator.agent_a = StubAgent("AgentA")
+    orchestrator.memory_node = StubMemory()
+    orchestrator.logger_node = StubLogger()
+
+    print(f"{'state keys':>12} {'legacy us/turn':>16} {'current us/turn':>16}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        state = {f"channel_{i}": i for i in range(size)}
+        state["current_round"] = 1
+        with contextlib.redirect_stdout(io.StringIO()):
+            legacy = time_per_call(lambda s: legacy_turn(orchestrator, s), state, args.repeats)
+            current = time_per_call(orchestrator._turn_a_wrapper, state, args.repeats)
+        print(f"{size:>12} {legacy:>16.2f} {current:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import json
+import re
+from typing import Dict, Any, List, Optional
+
+from nodes import CoordinatorNode, JudgeNode
+from nodes.logger_node import iter_log_lines
+
+_ENTRY_TYPE = re.compile(r'"type": "([a-z_]+)"')
+_DEBATE_ID = re.compile(r'"debate_id": ("(?:[^"\\]|\\.)*")\}\s*$')
+_SNAPSHOT_TOTAL = re.compile(r'"data": \{"total_entries": (\d+)')
+_PARSED_TYPES = ("node_execution", "final_verdict")
+
+
+class _DebateRecord:
+
+    def __init__(self, debate_id: Optional[str]):
+        self.debate_id = debate_id
+        self.topic: Optional[str] = None
+        self.turns: Dict[tuple, Dict[str, Any]] = {}
+        self.snapshot_line: Optional[str] = None
+        self.snapshot_total = 0
+        self.recorded_verdict: Optional[Dict[str, Any]] = None
+
+    def memory(self) -> List[Dict[str, Any]]:
+        if self.snapshot_total > len(self.turns):
+            for entry in json.loads(self.snapshot_line)["data"]["entries"]:
+                self.turns.setdefault((entry["round"], entry["agent"]), entry)
+        return [self.turns[key] for key in sorted(self.turns)]
+
+
+def _line_debate_id(line: str) -> Optional[str]:
+    match = _DEBATE_ID.search(line, max(0, len(line) - 256))
+    return json.loads(match.group(1)) if match else None
+
+
+def scan_log(log_path: str, debate_id: Optional[str] = None) -> Dict[Optional[str], _DebateRecord]:
+    debates: Dict[Optional[str], _DebateRecord] = {}
+
+    for line in iter_log_lines(log_path):
+        match = _ENTRY_TYPE.search(line, 0, 120)
+        if match is None:
+            continue
+        entry_type = match.group(1)
+        if entry_type != "memory_snapshot" and entry_type not in _PARSED_TYPES:
+            continue
+
+        line_debate_id = _line_debate_id(line)
+        if debate_id is not None and line_debate_id != debate_id:
+            continue
+        record = debates.get(line_debate_id)
+        if record is None:
+            record = debates[line_debate_id] = _DebateRecord(line_debate_id)
+
+        if entry_type == "memory_snapshot":
+            total = _SNAPSHOT_TOTAL.search(line, 0, 200)
+            total = int(total.group(1)) if total else 0
+            if total >= record.snapshot_total:
+                record.snapshot_line = line
+                record.snapshot_total = total
+            continue
+
+        data = json.loads(line)["data"]
+        if entry_type == "final_verdict":
+            record.recorded_verdict = data
+        elif data.get("node") == "MemoryNode":
+            latest = data.get("output", {}).get("latest_entry")
+            if latest:
+                record.turns[(latest["round"], latest["agent"])] = latest
+        elif data.get("node") == "JudgeNode":
+            record.topic = data.get("input", {}).get("topic", record.topic)
+
+    return debates
+
+
+def rebuild_state(
+    record: _DebateRecord,
+    coordinator: Optional[CoordinatorNode] = None,
+    with_warnings: bool = False,
+) -> Dict[str, Any]:
+    memory = record.memory()
+    coordinator = coordinator or CoordinatorNode(total_rounds=max(len(memory), CoordinatorNode.TOTAL_ROUNDS))
+    turn_index = len(memory)
+    status = coordinator.get_debate_status(turn_index)
+    next_turn = status["next_turn"]
+    if with_warnings:
+        repetition_warnings = coordinator.detect_repeated_arguments(memory)
+        coherence_warnings = coordinator.check_logical_coherence(memory)
+    else:
+        repetition_warnings, coherence_warnings = [], []
+
+    return {
+        "debate_id": record.debate_id,
+        "topic": record.topic or "Unknown topic",
+        "memory": memory,
+        "turn_index": turn_index,
+        "current_round": next_turn[0] if next_turn else None,
+        "next_agent": next_turn[1] if next_turn else None,
+        "debate_complete": status["is_complete"],
+        "debate_status": status,
+        "repetition_warnings": repetition_warnings,
+        "coherence_warnings": coherence_warnings,
+        "recorded_verdict": record.recorded_verdict,
+    }
+
+
+def load_debates(log_path: str, debate_id: Optional[str] = None, with_warnings: bool = False) -> List[Dict[str, Any]]:
+    debates = scan_log(log_path, debate_id)
+    return [
+        rebuild_state(record, None, with_warnings)
+        for record in debates.values()
+        if record.turns or record.snapshot_line
+    ]
+
+
+def replay_debate(state: Dict[str, Any], judge: Optional[JudgeNode] = None) -> Dict[str, Any]:
+    judge = judge or JudgeNode()
+    result = judge(state)
+    recorded = state.get("recorded_verdict")
+    return {
+        **state,
+        **result,
+        "matches_recorded": None if recorded is None else recorded.get("winner") == result["winner"],
+    }
+
+
+def replay_log(log_path: str, debate_id: Optional[str] = None, with_warnings: bool = False) -> List[Dict[str, Any]]:
+    judge = JudgeNode()
+    return [replay_debate(state, judge) for state in load_debates(log_path, debate_id, with_warnings)]
@@ -0,0 +1,372 @@
+import json
+import math
+import queue
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from nodes import UserInputNode, FileLogWriter, SimulatedBackend, BatchingBackend, DebateMetrics
+from nodes.logger_node import rotation_options
+from nodes.personas import check_personas
+from nodes.metrics import send_metrics
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class DebateJob:
+
+    def __init__(self, request: Dict[str, Any]):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.request = request
+        self.status = "queued"
+        self.events: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._condition = threading.Condition()
+
+    def add_event(self, event: Dict[str, Any]):
+        with self._condition:
+            self.events.append(event)
+            self._condition.notify_all()
+
+    def finish(self, status: str, result: Dict[str, Any] = None, error: str = None):
+        with self._condition:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def is_finished(self) -> bool:
+        return self.status in ("done", "error")
+
+    def wait(self, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(self.is_finished, timeout=timeout)
+
+    def wait_for_event(self, index: int, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self.events) > index or self.is_finished(),
+                timeout=timeout,
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "request": self.request,
+            "turns": len([e for e in self.events if e["type"] == "turn"]),
+        }
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class DebateService:
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 4,
+        queue_size: int = 64,
+        log_path: str = "debate_service_log.jsonl",
+        log_options: Optional[dict] = None,
+        backend_latency: Optional[float] = None,
+        max_finished_jobs: int = 10000,
+        orchestrator_cls=None,
+        generation_batching: Optional[dict] = None,
+        total_rounds: Optional[int] = None,
+        executor: str = "graph",
+        pipeline: bool = False,
+        deadline_options: Optional[dict] = None,
+        context_options: Optional[dict] = None,
+    ):
+        self.name = "DebateService"
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.log_path = log_path
+        self.log_options = log_options or {}
+        self.backend = SimulatedBackend(latency=backend_latency) if backend_latency is not None else None
+        if self.backend is not None and generation_batching:
+            self.backend = BatchingBackend(self.backend, **generation_batching)
+        self.max_finished_jobs = max_finished_jobs
+        self.orchestrator_options = {
+            "total_rounds": total_rounds,
+            "executor": executor,
+            "pipeline": pipeline,
+            **(deadline_options or {}),
+            **(context_options or {}),
+        }
+        self.jobs: Dict[str, DebateJob] = {}
+        self.completed = 0
+        self._queue: "queue.Queue[Optional[DebateJob]]" = queue.Queue(maxsize=queue_size)
+        self._jobs_lock = threading.Lock()
+        self._finished_order: List[str] = []
+        self._user_input = UserInputNode()
+        self._orchestrator_cls = orchestrator_cls
+        self._orchestrators = None
+        self._log_writer: Optional[FileLogWriter] = None
+        self._worker_threads: List[threading.Thread] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self.metrics = DebateMetrics()
+        self.metrics.add_gauge("debate_service_queue_depth", "Debate jobs waiting for a worker.", self.queue_depth)
+
+    def validate_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        topic, error_msg = self._user_input.prepare_topic(str(payload.get("topic", "")))
+        if topic is None:
+            raise ValueError(error_msg)
+
+        personas = payload.get("personas", ["scientist", "philosopher"])
+        if isinstance(personas, str):
+            personas = personas.split(",")
+        personas = [str(p).strip() for p in personas]
+        if len(personas) != 2 or not all(personas):
+            raise ValueError("personas must name exactly 2 personas")
+        check_personas(personas)
+
+        seed = payload.get("seed")
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise ValueError("seed must be an integer")
+
+        return {"topic": topic, "personas": personas, "seed": seed}
+
+    def submit(self, payload: Dict[str, Any]) -> DebateJob:
+        job = DebateJob(self.validate_request(payload))
+        with self._jobs_lock:
+            self.jobs[job.job_id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._jobs_lock:
+                del self.jobs[job.job_id]
+            raise QueueFullError("Debate queue is full, retry later")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[DebateJob]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run_job(self, job: DebateJob):
+        job.status = "running"
+        request = job.request
+        key = tuple(request["personas"])
+        orchestrator = None
+        try:
+            orchestrator = self._orchestrators.acquire(key, lambda: self._orchestrator_cls(
+                log_path=self.log_path,
+                persona_config={"AgentA": request["personas"][0], "AgentB": request["personas"][1]},
+                log_options=self.log_options,
+                log_sink=self._log_writer,
+                backend=self.backend,
+                verbose=False,
+                metrics=self.metrics,
+                **self.orchestrator_options,
+            ))
+            orchestrator.reset(
+                topic=request["topic"],
+                debate_id=job.job_id,
+                seed=request["seed"],
+                on_event=job.add_event,
+            )
+            final_state = orchestrator.run()
+            job.finish("done", result={
+                "winner": final_state.get("winner"),
+                "confidence": final_state.get("winner_confidence"),
+                "final_scores": final_state.get("judge_analysis", {}).get("final_scores", {}),
+                "justification": final_state.get("winner_justification"),
+                "transcript": [
+                    {"round": e["round"], "agent": e["agent"], "text": e["text"]}
+                    for e in final_state.get("memory", [])
+                ],
+            })
+        except Exception as e:
+            job.finish("error", error=f"{type(e).__name__}: {e}")
+        finally:
+            if orchestrator is not None:
+                self._orchestrators.release(key, orchestrator)
+        self._record_finished(job)
+
+    def _record_finished(self, job: DebateJob):
+        with self._jobs_lock:
+            self.completed += 1
+            self._finished_order.append(job.job_id)
+            while len(self._finished_order) > self.max_finished_jobs:
+                self.jobs.pop(self._finished_order.pop(0), None)
+
+    def _worker_loop(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    def start(self, run_workers: bool = True) -> "DebateService":
+        from run_debate import DebateOrchestrator, OrchestratorPool
+
+        if self._orchestrator_cls is None:
+            self._orchestrator_cls = DebateOrchestrator
+        self._orchestrators = OrchestratorPool(max_idle_per_key=self.workers)
+        self._log_writer = FileLogWriter(self.log_path, **rotation_options(self.log_options))
+        if run_workers:
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"{self.name}-worker-{i}", daemon=True)
+                thread.start()
+                self._worker_threads.append(thread)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self.port = self._server.server_address[1]
+        self._server_thread = threading.Thread(target=self._server.serve_forever, name=f"{self.name}-http", daemon=True)
+        self._server_thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for _ in self._worker_threads:
+            self._queue.put(None)
+        for thread in self._worker_threads:
+            thread.join()
+        self._worker_threads = []
+        if self._orchestrators is not None:
+            self._orchestrators.close()
+        if isinstance(self.backend, BatchingBackend):
+            self.backend.close()
+        if self._log_writer is not None:
+            self._log_writer.close()
+            self._log_writer = None
+
+    def serve_forever(self):
+        self.start()
+        print(f"Debate service listening on http://{self.host}:{self.port} ({self.workers} workers)")
+        try:
+            self._server_thread.join()
+        except KeyboardInterrupt:
+            print("\nShutting down debate service.")
+        finally:
+            self.stop()
+
+
+def _make_handler(service: DebateService):
+
+    class DebateRequestHandler(BaseHTTPRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if urlparse(self.path).path.rstrip("/") != "/debates":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("request body must be a JSON object")
+                job = service.submit(payload)
+            except QueueFullError as e:
+                self._send_json(429, {"error": str(e)}, headers={"Retry-After": "1"})
+                return
+            except (ValueError, json.JSONDecodeError) as e:
+                self._send_json(400, {"error": str(e)})
+                return
+
+            self._send_json(202, {
+                "job_id": job.job_id,
+                "status": job.status,
+                "queue_depth": service.queue_depth(),
+            }, headers={"Location": f"/debates/{job.job_id}"})
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+
+            if parts == ["metrics"]:
+                send_metrics(self, service.metrics)
+                return
+
+            if parts == ["health"]:
+                self._send_json(200, {
+                    "status": "ok",
+                    "workers": service.workers,
+                    "queue_depth": service.queue_depth(),
+                    "completed": service.completed,
+                })
+                return
+
+            if len(parts) < 2 or parts[0] != "debates":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            job = service.get_job(parts[1])
+            if job is None:
+                self._send_json(404, {"error": "unknown job"})
+                return
+
+            if len(parts) == 3 and parts[2] == "events":
+                self._stream_events(job)
+                return
+
+            wait = parse_qs(url.query).get("wait")
+            if wait:
+                try:
+                    timeout = float(wait[0])
+                except ValueError:
+                    timeout = math.nan
+                if math.isnan(timeout):
+                    self._send_json(400, {"error": "wait must be a number of seconds"})
+                    return
+                job.wait(timeout=min(max(timeout, 0.0), 60.0))
+            self._send_json(200, job.to_dict())
+
+        def _stream_events(self, job: DebateJob):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+
+            index = 0
+            try:
+                while True:
+                    job.wait_for_event(index, timeout=30.0)
+                    while index < len(job.events):
+                        self.wfile.write((json.dumps(job.events[index]) + "\n").encode('utf-8'))
+                        index += 1
+                    self.wfile.flush()
+                    if job.is_finished() and index >= len(job.events):
+                        break
+                self.wfile.write((json.dumps({"type": "done", **job.to_dict()}) + "\n").encode('utf-8'))
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+    return DebateRequestHandler
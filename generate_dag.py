@@ -1,107 +1,251 @@
+import argparse
+import hashlib
 import os
-from graphviz import Digraph
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 
+DEFAULT_FORMATS = ("png", "svg")
+DEFAULT_MAX_ROUNDS_SHOWN = 8
 
-def generate_dag_visualization(output_path: str = "debate_dag"):
-    dot = Digraph(comment='Multi-Agent Debate DAG', format='png')
-    dot.attr(rankdir='TB')
-    dot.attr('node', shape='box', style='rounded,filled', fillcolor='lightblue')
+NODE_STYLES = {
+    "input": ("lightgreen", "Input Node"),
+    "control": ("lightyellow", "Control Node"),
+    "agent": ("lightcoral", "Agent Turn"),
+    "evaluation": ("lightgoldenrod", "Evaluation Node"),
+    "utility": ("lavender", "Utility Node"),
+}
+
+
+def build_orchestrator(persona_config: Optional[dict] = None):
+    from run_debate import DebateOrchestrator
     
-    dot.node('UserInput', 'UserInputNode\n(Get Topic)', fillcolor='lightgreen')
-    dot.node('Coordinator', 'CoordinatorNode\n(Turn Control)', fillcolor='lightyellow')
-    dot.node('AgentA', 'AgentA Node\n(Scientist)', fillcolor='lightcoral')
-    dot.node('AgentB', 'AgentB Node\n(Philosopher)', fillcolor='lightcoral')
-    dot.node('Memory', 'MemoryNode\n(Store Arguments)', fillcolor='lightcyan')
-    dot.node('Logger', 'LoggerNode\n(Log Everything)', fillcolor='lavender')
-    dot.node('Judge', 'JudgeNode\n(Evaluate & Decide)', fillcolor='lightgoldenrod')
-    dot.node('END', 'END', shape='doublecircle', fillcolor='pink')
+    return DebateOrchestrator(persona_config=persona_config, log_path=os.devnull, verbose=False)
+
+
+def _node_style(orchestrator, node_id: str) -> Tuple[str, str]:
+    agents = {"turn_a": orchestrator.agent_a, "turn_b": orchestrator.agent_b}
+    if node_id in agents:
+        agent = agents[node_id]
+        return f"{agent.agent_id} turn ({agent.persona_name})\nAgentNode → MemoryNode → LoggerNode", "agent"
+    labels = {
+        "user_input": ("UserInputNode\n(Get Topic)", "input"),
+        "coordinator": ("CoordinatorNode\n(Turn Control)", "control"),
+        "judge": ("JudgeNode\n(Evaluate & Decide)", "evaluation"),
+        "logger": ("LoggerNode\n(Log State)", "utility"),
+        "logger_final": ("LoggerNode\n(Log Verdict)", "utility"),
+    }
+    return labels.get(node_id, (node_id, "utility"))
+
+
+def _edge_label(orchestrator, source: str, target: str, conditional: bool) -> str:
+    if conditional:
+        if target == "judge":
+            return f"after {orchestrator.coordinator_node.total_rounds} turns"
+        if target == "turn_a":
+            return f"next: {orchestrator.agent_a.agent_id}"
+        if target == "turn_b":
+            return f"next: {orchestrator.agent_b.agent_id}"
+        return ""
+    if target == "coordinator" and source in ("turn_a", "turn_b"):
+        return "next turn"
+    if source == "user_input":
+        return "topic"
+    if source == "judge":
+        return "verdict"
+    return ""
+
+
+def build_overview_dag(orchestrator):
+    from graphviz import Digraph
     
-    dot.edge('UserInput', 'Coordinator', label='topic')
-    dot.edge('Coordinator', 'AgentA', label='if AgentA turn')
-    dot.edge('Coordinator', 'AgentB', label='if AgentB turn')
-    dot.edge('Coordinator', 'Judge', label='if round 8 complete')
+    graph = orchestrator.graph.get_graph()
+    edges = sorted(graph.edges, key=lambda e: (e.source, e.target))
+    connected = {e.source for e in edges} | {e.target for e in edges}
     
-    dot.edge('AgentA', 'Memory', label='argument')
-    dot.edge('AgentB', 'Memory', label='argument')
+    dot = Digraph(comment='Multi-Agent Debate DAG')
+    dot.attr(rankdir='TB')
+    dot.attr('node', shape='box', style='rounded,filled', fillcolor='lightblue')
     
-    dot.edge('Memory', 'Logger', label='updated memory')
-    dot.edge('Logger', 'Coordinator', label='next round', constraint='false')
+    kinds = []
+    for node_id in graph.nodes:
+        if node_id not in connected:
+            continue
+        if node_id == "__start__":
+            dot.node(node_id, 'START', shape='ellipse', fillcolor='lightgreen')
+        elif node_id == "__end__":
+            dot.node(node_id, 'END', shape='doublecircle', fillcolor='pink')
+        else:
+            label, kind = _node_style(orchestrator, node_id)
+            dot.node(node_id, label, fillcolor=NODE_STYLES[kind][0])
+            if kind not in kinds:
+                kinds.append(kind)
     
-    dot.edge('Judge', 'Logger', label='verdict')
-    dot.edge('Logger', 'END', label='complete')
+    for edge in edges:
+        label = _edge_label(orchestrator, edge.source, edge.target, edge.conditional)
+        if edge.conditional:
+            dot.edge(edge.source, edge.target, label=label, style='dashed')
+        elif edge.target == "coordinator" and edge.source in ("turn_a", "turn_b"):
+            dot.edge(edge.source, edge.target, label=label, constraint='false')
+        else:
+            dot.edge(edge.source, edge.target, label=label)
     
     with dot.subgraph(name='cluster_legend') as c:
         c.attr(label='Legend', style='dashed')
-        c.node('leg1', 'Input Node', fillcolor='lightgreen')
-        c.node('leg2', 'Control Node', fillcolor='lightyellow')
-        c.node('leg3', 'Agent Node', fillcolor='lightcoral')
-        c.node('leg4', 'Storage Node', fillcolor='lightcyan')
-        c.node('leg5', 'Evaluation Node', fillcolor='lightgoldenrod')
-        c.node('leg6', 'Utility Node', fillcolor='lavender')
+        for index, kind in enumerate(kinds, 1):
+            color, description = NODE_STYLES[kind]
+            c.node(f'leg{index}', description, fillcolor=color)
+        c.node('leg_cond', 'Conditional edge', shape='plaintext', style='')
     
-    try:
-        dot.render(output_path, cleanup=True)
-        print(f"✓ DAG visualization saved to: {output_path}.png")
-        
-        dot.format = 'svg'
-        dot.render(output_path, cleanup=True)
-        print(f"✓ DAG visualization saved to: {output_path}.svg")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Error generating DAG visualization: {e}")
-        print("  Make sure Graphviz is installed: https://graphviz.org/download/")
-        return False
+    return dot
+
+
+def _turn_order(orchestrator, rounds: Optional[int]) -> List[Tuple[int, str]]:
+    coordinator = orchestrator.coordinator_node
+    if rounds is None:
+        return list(coordinator.turn_order)
+    agents = (coordinator.agent_a_id, coordinator.agent_b_id)
+    return [(round_num, agents[(round_num - 1) % 2]) for round_num in range(1, rounds + 1)]
 
 
-def generate_detailed_dag():
-    dot = Digraph(comment='Detailed Debate Flow', format='png')
+def build_detailed_dag(orchestrator, rounds: Optional[int] = None, max_rounds_shown: int = DEFAULT_MAX_ROUNDS_SHOWN):
+    from graphviz import Digraph
+    
+    order = _turn_order(orchestrator, rounds)
+    if len(order) > max_rounds_shown:
+        head = max(1, max_rounds_shown // 2)
+        tail = max(1, max_rounds_shown - head)
+        shown = order[:head] + [None] + order[-tail:]
+    else:
+        head = len(order)
+        shown = order
+    
+    dot = Digraph(comment='Detailed Debate Flow')
     dot.attr(rankdir='LR')
     dot.attr('node', shape='box', style='filled', fillcolor='lightblue')
-    
     dot.node('start', 'START\n(Get Topic)', shape='ellipse', fillcolor='lightgreen')
     
-    for round_num in range(1, 9):
-        agent = 'A' if round_num % 2 == 1 else 'B'
-        node_id = f'round{round_num}'
-        
-        label = f'Round {round_num}\nAgent{agent}\n↓\nMemory\n↓\nLogger'
-        color = 'lightcoral' if agent == 'A' else 'lightsalmon'
-        
-        dot.node(node_id, label, fillcolor=color)
-        
-        if round_num == 1:
-            dot.edge('start', node_id)
+    previous = 'start'
+    for item in shown:
+        if item is None:
+            first, last = order[head][0], order[-tail - 1][0]
+            node_id = 'collapsed'
+            label = f'Rounds {first}-{last}\n({last - first + 1} turns,\nalternating agents)'
+            dot.node(node_id, label, style='dashed,filled', fillcolor='white')
         else:
-            dot.edge(f'round{round_num-1}', node_id)
+            round_num, agent_id = item
+            node_id = f'round{round_num}'
+            label = f'Round {round_num}\n{agent_id}\n↓\nMemory\n↓\nLogger'
+            color = 'lightcoral' if agent_id == orchestrator.coordinator_node.agent_a_id else 'lightsalmon'
+            dot.node(node_id, label, fillcolor=color)
+        dot.edge(previous, node_id)
+        previous = node_id
     
     dot.node('judge', 'JudgeNode\nEvaluate\nDetermine Winner', fillcolor='lightgoldenrod')
-    dot.edge('round8', 'judge')
-    
+    dot.edge(previous, 'judge')
     dot.node('end', 'END\n(Output Results)', shape='ellipse', fillcolor='pink')
     dot.edge('judge', 'end')
+    return dot
+
+
+def dag_fingerprint(dot, formats: Sequence[str]) -> str:
+    import graphviz
     
+    digest = hashlib.sha256()
+    for part in (graphviz.__version__, dot.engine, ",".join(sorted(formats)), dot.source):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _fingerprint_path(output_path: str) -> str:
+    directory, name = os.path.split(output_path)
+    return os.path.join(directory, f".{name}.dag.sha256")
+
+
+def _is_unchanged(output_path: str, fingerprint: str, formats: Sequence[str]) -> bool:
+    if not all(os.path.exists(f"{output_path}.{fmt}") for fmt in formats):
+        return False
     try:
-        dot.render('debate_dag_detailed', cleanup=True)
-        print(f"✓ Detailed DAG visualization saved to: debate_dag_detailed.png")
-        return True
-    except Exception as e:
-        print(f"✗ Error generating detailed DAG: {e}")
+        with open(_fingerprint_path(output_path), 'r', encoding='utf-8') as f:
+            return f.read().strip() == fingerprint
+    except OSError:
         return False
 
+
+def _render(dot, output_path: str, formats: Sequence[str], fingerprint: str) -> str:
+    command = [dot.engine]
+    for fmt in formats:
+        command += [f"-T{fmt}", f"-o{output_path}.{fmt}"]
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    subprocess.run(command, input=dot.source.encode('utf-8'), check=True, capture_output=True)
+    with open(_fingerprint_path(output_path), 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+    return "rendered"
+
+
+def render_all(jobs: List[Tuple[object, str]], formats: Sequence[str] = DEFAULT_FORMATS, force: bool = False) -> Dict[str, str]:
+    results: Dict[str, str] = {}
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        for dot, output_path in jobs:
+            fingerprint = dag_fingerprint(dot, formats)
+            if not force and _is_unchanged(output_path, fingerprint, formats):
+                results[output_path] = "unchanged"
+                continue
+            pending[output_path] = (dot.engine, pool.submit(_render, dot, output_path, formats, fingerprint))
+        
+        for output_path, (engine, future) in pending.items():
+            try:
+                results[output_path] = future.result()
+            except FileNotFoundError:
+                results[output_path] = f"Graphviz executable '{engine}' not found on PATH"
+            except subprocess.CalledProcessError as e:
+                results[output_path] = e.stderr.decode('utf-8', errors='replace').strip() or str(e)
+    return results
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Render the debate DAG from the compiled LangGraph graph")
+    parser.add_argument("--output", type=str, default="debate_dag", help="Output path prefix (default: debate_dag)")
+    parser.add_argument("--formats", type=str, default=",".join(DEFAULT_FORMATS),
+                        help="Comma-separated Graphviz output formats (default: png,svg)")
+    parser.add_argument("--rounds", type=int, default=None,
+                        help="Rounds drawn in the detailed view (default: the orchestrator's total_rounds)")
+    parser.add_argument("--max-rounds-shown", type=int, default=DEFAULT_MAX_ROUNDS_SHOWN,
+                        help="Collapse the middle of the detailed view beyond this many rounds (default: 8)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if the graph is unchanged")
+    args = parser.parse_args()
+    
     print("\n" + "="*60)
     print("DAG Visualization Generator")
     print("="*60 + "\n")
     
-    success1 = generate_dag_visualization()
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    orchestrator = build_orchestrator()
+    detailed_path = f"{args.output}_detailed"
+    results = render_all(
+        [
+            (build_overview_dag(orchestrator), args.output),
+            (build_detailed_dag(orchestrator, args.rounds, args.max_rounds_shown), detailed_path),
+        ],
+        formats=formats,
+        force=args.force,
+    )
     
-    print()
-    
-    success2 = generate_detailed_dag()
+    for output_path, status in results.items():
+        files = ", ".join(f"{output_path}.{fmt}" for fmt in formats)
+        if status == "rendered":
+            print(f"✓ DAG visualization saved to: {files}")
+        elif status == "unchanged":
+            print(f"✓ DAG unchanged, kept: {files}")
+        else:
+            print(f"✗ Error generating {output_path}: {status}")
     
     print("\n" + "="*60)
-    if success1 or success2:
+    if any(status in ("rendered", "unchanged") for status in results.values()):
         print("✓ DAG generation completed!")
     else:
         print("✗ DAG generation failed. Install Graphviz:")
@@ -112,4 +256,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,9 +1,27 @@
-from .user_input_node import UserInputNode
-from .agent_node import AgentNode
-from .memory_node import MemoryNode
-from .coordinator_node import CoordinatorNode
-from .judge_node import JudgeNode
-from .logger_node import LoggerNode
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'UserInputNode': '.user_input_node',
+    'AgentNode': '.agent_node',
+    'MemoryNode': '.memory_node',
+    'CoordinatorNode': '.coordinator_node',
+    'JudgeNode': '.judge_node',
+    'LoggerNode': '.logger_node',
+    'SpanTracer': '.tracing',
+    'LogSink': '.log_sink',
+    'QueueLogWriter': '.log_sink',
+    'FileLogWriter': '.log_sink',
+    'SimulatedBackend': '.backends',
+    'NodeProfiler': '.profiling',
+    'DebateMetrics': '.metrics',
+    'MetricsServer': '.metrics',
+    'MetricsFileWriter': '.metrics',
+    'DebateResultStore': '.result_store',
+    'PostTurnWorker': '.post_turn',
+    'BatchingBackend': '.batching',
+    'ContextPacker': '.context_packer',
+    'InvertedIndex': '.memory_index',
+}
 
 __all__ = [
     'UserInputNode',
@@ -12,4 +30,31 @@ __all__ = [
     'CoordinatorNode',
     'JudgeNode',
     'LoggerNode',
+    'SpanTracer',
+    'LogSink',
+    'QueueLogWriter',
+    'FileLogWriter',
+    'SimulatedBackend',
+    'NodeProfiler',
+    'DebateMetrics',
+    'MetricsServer',
+    'MetricsFileWriter',
+    'DebateResultStore',
+    'PostTurnWorker',
+    'BatchingBackend',
+    'ContextPacker',
+    'InvertedIndex',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
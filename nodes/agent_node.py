@@ -1,16 +1,55 @@
+import asyncio
 import os
 import json
 import hashlib
 from typing import Dict, Any, List, Optional
 from difflib import SequenceMatcher
 
+from nodes.context_packer import ContextPacker
+
 
 class AgentNode:
     
-    def __init__(self, agent_id: str, persona_name: str, persona_path: Optional[str] = None, seed: Optional[int] = None):
+    def __init__(
+        self,
+        agent_id: str,
+        persona_name: str,
+        persona_path: Optional[str] = None,
+        seed: Optional[int] = None,
+        backend=None,
+        metrics=None,
+        history_window: Optional[int] = None,
+        turn_timeout: Optional[float] = None,
+        hedge_quantile: Optional[float] = None,
+        latency_tracker=None,
+        generation_pool_size: Optional[int] = None,
+        context_tokens: Optional[int] = None,
+        context_retrieval: int = 0,
+        memory_node=None,
+    ):
         self.agent_id = agent_id
         self.persona_name = persona_name
         self.seed = seed
+        self.backend = backend
+        self.metrics = metrics
+        self.history_window = history_window
+        self.turn_timeout = turn_timeout
+        self.hedge_quantile = hedge_quantile
+        self.latency_tracker = latency_tracker
+        self.generation_pool_size = generation_pool_size
+        if hedge_quantile is not None and latency_tracker is None:
+            from nodes.deadlines import LatencyTracker
+            
+            self.latency_tracker = LatencyTracker()
+        self.deadline: Optional[float] = None
+        self.fallbacks = 0
+        self.hedges = 0
+        self.context_packer = ContextPacker(
+            context_tokens or ContextPacker.DEFAULT_BUDGET,
+            context_retrieval,
+            memory=memory_node,
+        )
+        self._prompt_prefix: Optional[tuple] = None
         self.name = f"{agent_id}Node"
         self.previous_arguments = []
         
@@ -37,37 +76,185 @@ fundamental premises and explore various perspectives."""
     def _similarity_score(self, text1: str, text2: str) -> float:
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
     
-    def _is_duplicate_argument(self, new_argument: str, threshold: float = 0.7) -> bool:
-        for prev_arg in self.previous_arguments:
+    def reset(self):
+        self.previous_arguments = []
+        self.deadline = None
+        self.fallbacks = 0
+        self.hedges = 0
+        self.context_packer.reset()
+    
+    def _is_duplicate_argument(
+        self,
+        new_argument: str,
+        threshold: float = 0.7,
+        previous_arguments: Optional[List[str]] = None,
+    ) -> bool:
+        if previous_arguments is None:
+            previous_arguments = self.previous_arguments
+        if self.history_window is not None:
+            previous_arguments = previous_arguments[-self.history_window:]
+        for prev_arg in previous_arguments:
             if self._similarity_score(new_argument, prev_arg) > threshold:
                 return True
         return False
     
-    def generate_argument(self, topic: str, memory_slice: List[Dict], round_num: int) -> str:
+    def generate_argument(
+        self,
+        topic: str,
+        memory_slice: List[Dict],
+        round_num: int,
+        previous_arguments: Optional[List[str]] = None,
+    ) -> str:
+        if previous_arguments is None:
+            previous_arguments = self.previous_arguments
         context = self._build_context(memory_slice)
+        deadline = self._turn_deadline()
         
-        argument = self._template_based_generation(topic, context, round_num)
+        argument = self._generate(topic, context, round_num, deadline=deadline)
         
         attempts = 0
-        while self._is_duplicate_argument(argument) and attempts < 5:
-            argument = self._template_based_generation(topic, context, round_num, variation=attempts+1)
+        while self._is_duplicate_argument(argument, previous_arguments=previous_arguments) and attempts < 5:
+            argument = self._generate(topic, context, round_num, variation=attempts+1, deadline=deadline)
             attempts += 1
         
-        if self._is_duplicate_argument(argument):
+        return self._accept_argument(argument, round_num, previous_arguments, attempts)
+    
+    async def agenerate_argument(
+        self,
+        topic: str,
+        memory_slice: List[Dict],
+        round_num: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        previous_arguments: Optional[List[str]] = None,
+    ) -> str:
+        if previous_arguments is None:
+            previous_arguments = self.previous_arguments
+        context = self._build_context(memory_slice)
+        deadline = self._turn_deadline()
+        
+        argument = await self._agenerate(topic, context, round_num, semaphore=semaphore, deadline=deadline)
+        
+        attempts = 0
+        while self._is_duplicate_argument(argument, previous_arguments=previous_arguments) and attempts < 5:
+            argument = await self._agenerate(
+                topic, context, round_num, variation=attempts+1, semaphore=semaphore, deadline=deadline
+            )
+            attempts += 1
+        
+        return self._accept_argument(argument, round_num, previous_arguments, attempts)
+    
+    def _accept_argument(self, argument: str, round_num: int, previous_arguments: List[str], retries: int = 0) -> str:
+        if retries and self.metrics is not None:
+            self.metrics.generation_retries.inc(retries, agent=self.agent_id)
+        if self._is_duplicate_argument(argument, previous_arguments=previous_arguments):
             argument = f"{argument} (Round {round_num} perspective)"
         
-        self.previous_arguments.append(argument)
+        previous_arguments.append(argument)
         return argument
     
-    def _build_context(self, memory_slice: List[Dict]) -> str:
-        if not memory_slice:
-            return "No previous arguments."
+    def _generation_request(self, topic: str, context: str, round_num: int, variation: int) -> Dict[str, Any]:
+        return {
+            "agent_id": self.agent_id,
+            "persona_name": self.persona_name,
+            "persona": self.persona,
+            "prefix": self._prefix(topic),
+            "topic": topic,
+            "context": context,
+            "round": round_num,
+            "variation": variation,
+            "reference": self._template_based_generation(topic, context, round_num, variation),
+        }
+    
+    def _prefix(self, topic: str) -> str:
+        if self._prompt_prefix is None or self._prompt_prefix[0] != topic:
+            self._prompt_prefix = (topic, f"{self.persona}\n\nDebate topic: {topic}\n")
+        return self._prompt_prefix[1]
+    
+    def _turn_deadline(self) -> Optional[float]:
+        if self.backend is None:
+            return None
+        from nodes.deadlines import turn_deadline
+        
+        return turn_deadline(self.turn_timeout, self.deadline)
+    
+    def _hedge_delay(self) -> Optional[float]:
+        if self.hedge_quantile is None:
+            return None
+        return self.latency_tracker.quantile(self.hedge_quantile)
+    
+    def _fallback(self, request: Dict[str, Any]) -> str:
+        self.fallbacks += 1
+        if self.metrics is not None:
+            self.metrics.generation_fallbacks.inc(agent=self.agent_id)
+        return request["reference"]
+    
+    def _count_hedge(self, hedged: bool):
+        if hedged:
+            self.hedges += 1
+            if self.metrics is not None:
+                self.metrics.generation_hedges.inc(agent=self.agent_id)
+    
+    def _generate(
+        self,
+        topic: str,
+        context: str,
+        round_num: int,
+        variation: int = 0,
+        deadline: Optional[float] = None,
+    ) -> str:
+        if self.backend is None:
+            return self._template_based_generation(topic, context, round_num, variation)
+        request = self._generation_request(topic, context, round_num, variation)
+        hedge_delay = self._hedge_delay()
+        if deadline is None and self.latency_tracker is None:
+            return self.backend.generate(request)
+        from nodes.deadlines import call_with_deadline, generation_pool
+        
+        try:
+            argument, hedged = call_with_deadline(
+                lambda: self.backend.generate(request),
+                deadline,
+                hedge_delay,
+                self.latency_tracker,
+                generation_pool(self.generation_pool_size),
+            )
+        except TimeoutError:
+            return self._fallback(request)
+        self._count_hedge(hedged)
+        return argument
+    
+    async def _agenerate(
+        self,
+        topic: str,
+        context: str,
+        round_num: int,
+        variation: int = 0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        deadline: Optional[float] = None,
+    ) -> str:
+        if self.backend is None:
+            return self._template_based_generation(topic, context, round_num, variation)
+        request = self._generation_request(topic, context, round_num, variation)
+        
+        async def call():
+            if semaphore is None:
+                return await self.backend.agenerate(request)
+            async with semaphore:
+                return await self.backend.agenerate(request)
         
-        context_parts = []
-        for entry in memory_slice[-3:]:
-            context_parts.append(f"Round {entry['round']} - {entry['agent']}: {entry['text'][:100]}...")
+        if deadline is None and self.latency_tracker is None:
+            return await call()
+        from nodes.deadlines import acall_with_deadline
         
-        return "\n".join(context_parts)
+        try:
+            argument, hedged = await acall_with_deadline(call, deadline, self._hedge_delay(), self.latency_tracker)
+        except TimeoutError:
+            return self._fallback(request)
+        self._count_hedge(hedged)
+        return argument
+    
+    def _build_context(self, memory_slice: List[Dict]) -> str:
+        return self.context_packer.pack(memory_slice)
     
     def _template_based_generation(self, topic: str, context: str, round_num: int, variation: int = 0) -> str:
         if self.seed is not None:
@@ -124,15 +311,38 @@ fundamental premises and explore various perspectives."""
                 "Regarding '{topic}', historical context and contemporary relevance both inform our understanding.",
             ]
     
-    def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def _read_state(self, state: Dict[str, Any]) -> tuple:
         topic = state.get("topic", "")
         memory = state.get("memory", [])
         current_round = state.get("current_round", 1)
+        if self.history_window is not None:
+            memory = memory[-2 * self.history_window:]
         
         memory_slice = [entry for entry in memory if entry.get("agent") != self.agent_id]
+        previous_arguments = [entry["text"] for entry in memory if entry.get("agent") == self.agent_id]
+        return topic, memory_slice, current_round, previous_arguments
+    
+    def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        topic, memory_slice, current_round, previous_arguments = self._read_state(state)
         
-        argument = self.generate_argument(topic, memory_slice, current_round)
+        argument = self.generate_argument(topic, memory_slice, current_round, previous_arguments=previous_arguments)
         
+        return self._build_result(topic, memory_slice, current_round, argument)
+    
+    async def acall(self, state: Dict[str, Any], semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        topic, memory_slice, current_round, previous_arguments = self._read_state(state)
+        
+        argument = await self.agenerate_argument(
+            topic,
+            memory_slice,
+            current_round,
+            semaphore=semaphore,
+            previous_arguments=previous_arguments,
+        )
+        
+        return self._build_result(topic, memory_slice, current_round, argument)
+    
+    def _build_result(self, topic: str, memory_slice: List[Dict], current_round: int, argument: str) -> Dict[str, Any]:
         return {
             "current_agent": self.agent_id,
             "current_argument": argument,
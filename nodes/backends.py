@@ -0,0 +1,69 @@
+import asyncio
+import random
+import time
+from typing import Dict, Any, List, Optional
+
+
+class SimulatedBackend:
+    
+    deterministic = True
+    
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+        slow_rate: float = 0.0,
+        slow_latency: float = 0.0,
+        batch_item_latency: float = 0.0,
+    ):
+        self.name = "SimulatedBackend"
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.batch_item_latency = batch_item_latency
+        self.batch_calls = 0
+        self.calls = 0
+        self._rng = random.Random(seed)
+    
+    def _delay(self) -> float:
+        if self.jitter <= 0:
+            delay = self.latency
+        else:
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+        if self.slow_rate > 0 and self._rng.random() < self.slow_rate:
+            delay += self.slow_latency
+        return delay
+    
+    def _complete(self, request: Dict[str, Any]) -> str:
+        self.calls += 1
+        return request["reference"]
+    
+    def generate(self, request: Dict[str, Any]) -> str:
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        return self._complete(request)
+    
+    async def agenerate(self, request: Dict[str, Any]) -> str:
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._complete(request)
+    
+    def _batch_delay(self, size: int) -> float:
+        self.batch_calls += 1
+        return self._delay() + self.batch_item_latency * size
+    
+    def generate_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        delay = self._batch_delay(len(requests))
+        if delay:
+            time.sleep(delay)
+        return [self._complete(request) for request in requests]
+    
+    async def agenerate_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        delay = self._batch_delay(len(requests))
+        if delay:
+            await asyncio.sleep(delay)
+        return [self._complete(request) for request in requests]
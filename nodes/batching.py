@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class BatchingBackend:
+    
+    DISPATCH_WORKERS = 4
+    
+    def __init__(self, backend, max_batch_size: int = 8, max_wait: float = 0.005):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.backend = backend
+        self.name = getattr(backend, "name", type(backend).__name__)
+        self.deterministic = getattr(backend, "deterministic", False)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.requests = 0
+        self._async_pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._async_timer: Optional[asyncio.TimerHandle] = None
+        self._async_dispatches: set = set()
+        self._sync_pending: List[Tuple[Dict[str, Any], Future]] = []
+        self._sync_condition = threading.Condition()
+        self._sync_thread: Optional[threading.Thread] = None
+        self._dispatch_pool: Optional[ThreadPoolExecutor] = None
+        self._stats_lock = threading.Lock()
+        self._closed = False
+    
+    @property
+    def calls(self) -> int:
+        return getattr(self.backend, "calls", self.requests)
+    
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+    
+    def _record_batch(self, size: int):
+        with self._stats_lock:
+            self.batches += 1
+            self.requests += size
+    
+    @staticmethod
+    def _check_results(results: List[str], count: int) -> List[str]:
+        if len(results) != count:
+            raise RuntimeError(f"Backend returned {len(results)} results for {count} requests")
+        return results
+    
+    def _call_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        generate_batch = getattr(self.backend, "generate_batch", None)
+        if generate_batch is not None:
+            return generate_batch(requests)
+        return [self.backend.generate(request) for request in requests]
+    
+    async def _acall_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        agenerate_batch = getattr(self.backend, "agenerate_batch", None)
+        if agenerate_batch is not None:
+            return await agenerate_batch(requests)
+        return list(await asyncio.gather(*(self.backend.agenerate(request) for request in requests)))
+    
+    async def agenerate(self, request: Dict[str, Any]) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._async_pending.append((request, future))
+        if len(self._async_pending) >= self.max_batch_size:
+            self._flush_async()
+        elif self._async_timer is None:
+            self._async_timer = loop.call_later(self.max_wait, self._flush_async)
+        return await future
+    
+    def _flush_async(self):
+        if self._async_timer is not None:
+            self._async_timer.cancel()
+            self._async_timer = None
+        while self._async_pending:
+            batch = self._async_pending[:self.max_batch_size]
+            del self._async_pending[:self.max_batch_size]
+            task = asyncio.ensure_future(self._dispatch_async(batch))
+            self._async_dispatches.add(task)
+            task.add_done_callback(self._async_dispatches.discard)
+    
+    async def _dispatch_async(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        live = [(request, future) for request, future in batch if not future.done()]
+        if not live:
+            return
+        self._record_batch(len(live))
+        try:
+            results = self._check_results(await self._acall_batch([request for request, _ in live]), len(live))
+        except Exception as e:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(live, results):
+            if not future.done():
+                future.set_result(result)
+    
+    def generate(self, request: Dict[str, Any]) -> str:
+        future: Future = Future()
+        with self._sync_condition:
+            if self._closed:
+                raise RuntimeError("BatchingBackend is closed")
+            self._sync_pending.append((request, future))
+            if self._sync_thread is None or not self._sync_thread.is_alive():
+                if self._dispatch_pool is None:
+                    self._dispatch_pool = ThreadPoolExecutor(
+                        max_workers=self.DISPATCH_WORKERS,
+                        thread_name_prefix="BatchingBackend-dispatch",
+                    )
+                self._sync_thread = threading.Thread(target=self._sync_loop, name="BatchingBackend", daemon=True)
+                self._sync_thread.start()
+            self._sync_condition.notify()
+        return future.result()
+    
+    def _next_sync_batch(self) -> Optional[List[Tuple[Dict[str, Any], Future]]]:
+        with self._sync_condition:
+            while not self._sync_pending and not self._closed:
+                self._sync_condition.wait()
+            if not self._sync_pending:
+                return None
+            flush_at = time.monotonic() + self.max_wait
+            while len(self._sync_pending) < self.max_batch_size and not self._closed:
+                remaining = flush_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._sync_condition.wait(remaining)
+            batch = self._sync_pending[:self.max_batch_size]
+            del self._sync_pending[:self.max_batch_size]
+            return batch
+    
+    def _sync_loop(self):
+        while True:
+            batch = self._next_sync_batch()
+            if batch is None:
+                return
+            self._dispatch_pool.submit(self._dispatch_sync, batch)
+    
+    def _dispatch_sync(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        self._record_batch(len(batch))
+        try:
+            results = self._check_results(self._call_batch([request for request, _ in batch]), len(batch))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+    
+    def close(self):
+        with self._sync_condition:
+            self._closed = True
+            self._sync_condition.notify_all()
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+            self._sync_thread = None
+        if self._dispatch_pool is not None:
+            self._dispatch_pool.shutdown(wait=True)
+            self._dispatch_pool = None
@@ -0,0 +1,107 @@
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from nodes.memory_node import MemoryNode
+
+NO_CONTEXT = "No previous arguments."
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+class ContextPacker:
+    
+    DEFAULT_BUDGET = 256
+    RETRIEVAL_SHARE = 0.25
+    
+    def __init__(
+        self,
+        budget: int = DEFAULT_BUDGET,
+        retrieval: int = 0,
+        tokenizer: Optional[Callable[[str], int]] = None,
+        memory: Optional[MemoryNode] = None,
+    ):
+        if budget < 1:
+            raise ValueError("Context budget must be at least 1 token")
+        self.name = "ContextPacker"
+        self.budget = budget
+        self.retrieval = retrieval
+        self.tokenizer = tokenizer or count_tokens
+        self.counted = 0
+        self._lines: Dict[tuple, Tuple[str, int]] = {}
+        self.memory = memory
+        self._own_memory: Optional[MemoryNode] = None
+    
+    def reset(self):
+        self._lines.clear()
+        if self._own_memory is not None:
+            self._own_memory.reset()
+    
+    @staticmethod
+    def _key(entry: Dict) -> tuple:
+        return entry["round"], entry["agent"], entry["text"]
+    
+    def _measure(self, entry: Dict) -> Tuple[str, int]:
+        key = self._key(entry)
+        measured = self._lines.get(key)
+        if measured is None:
+            line = f"Round {entry['round']} - {entry['agent']}: {entry['text']}"
+            measured = (line, self.tokenizer(line) + 1)
+            self._lines[key] = measured
+            self.counted += 1
+        return measured
+    
+    def _searchable(self, entries: List[Dict]) -> MemoryNode:
+        if self.memory is not None:
+            return self.memory
+        if self._own_memory is None:
+            self._own_memory = MemoryNode()
+        self._own_memory.sync_index(entries)
+        return self._own_memory
+    
+    def _truncate(self, line: str, budget: int) -> str:
+        words = line.split(" ")
+        low, high = 1, len(words)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.tokenizer(" ".join(words[:middle]) + "...") <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        return " ".join(words[:low]) + "..."
+    
+    def _retrieve(self, entries: List[Dict], before_round: int, budget: int, skip: int) -> List[Dict]:
+        query = entries[-1]
+        chosen = []
+        for entry in self._searchable(entries).search(query["text"], self.retrieval + skip + 1, query["agent"]):
+            if len(chosen) >= self.retrieval:
+                break
+            if entry["round"] >= before_round:
+                continue
+            _, tokens = self._measure(entry)
+            if tokens <= budget:
+                chosen.append(entry)
+                budget -= tokens
+        return chosen
+    
+    def pack(self, entries: List[Dict]) -> str:
+        if not entries:
+            return NO_CONTEXT
+        reserved = int(self.budget * self.RETRIEVAL_SHARE) if self.retrieval else 0
+        remaining = self.budget - reserved
+        chosen = []
+        for entry in reversed(entries):
+            _, tokens = self._measure(entry)
+            if tokens > remaining:
+                break
+            chosen.append(entry)
+            remaining -= tokens
+        if not chosen:
+            return self._truncate(self._measure(entries[-1])[0], remaining)
+        if self.retrieval:
+            chosen += self._retrieve(entries, chosen[-1]["round"], remaining + reserved, len(chosen))
+        chosen.sort(key=lambda entry: entry["round"])
+        return "\n".join(self._measure(entry)[0] for entry in chosen)
@@ -6,16 +6,26 @@ class CoordinatorNode:
     TOTAL_ROUNDS = 8
     TURNS_PER_AGENT = 4
     
-    def __init__(self, agent_a_id: str = "AgentA", agent_b_id: str = "AgentB"):
+    def __init__(
+        self,
+        agent_a_id: str = "AgentA",
+        agent_b_id: str = "AgentB",
+        total_rounds: Optional[int] = None,
+        warning_window: Optional[int] = None,
+        analyze_each_turn: bool = True,
+    ):
         self.name = "CoordinatorNode"
         self.agent_a_id = agent_a_id
         self.agent_b_id = agent_b_id
+        self.total_rounds = total_rounds or self.TOTAL_ROUNDS
+        self.warning_window = warning_window
+        self.analyze_each_turn = analyze_each_turn
         self.turn_order = self._generate_turn_order()
         self.current_turn_index = 0
     
     def _generate_turn_order(self) -> list:
         order = []
-        for round_num in range(1, self.TOTAL_ROUNDS + 1):
+        for round_num in range(1, self.total_rounds + 1):
             if round_num % 2 == 1:
                 agent = self.agent_a_id
             else:
@@ -23,9 +33,14 @@ class CoordinatorNode:
             order.append((round_num, agent))
         return order
     
-    def get_next_agent(self) -> Optional[tuple]:
-        if self.current_turn_index < len(self.turn_order):
-            return self.turn_order[self.current_turn_index]
+    def reset(self):
+        self.current_turn_index = 0
+    
+    def get_next_agent(self, turn_index: Optional[int] = None) -> Optional[tuple]:
+        if turn_index is None:
+            turn_index = self.current_turn_index
+        if turn_index < len(self.turn_order):
+            return self.turn_order[turn_index]
         return None
     
     def advance_turn(self):
@@ -45,16 +60,20 @@ class CoordinatorNode:
         
         return True, ""
     
-    def is_debate_complete(self) -> bool:
-        return self.current_turn_index >= self.TOTAL_ROUNDS
+    def is_debate_complete(self, turn_index: Optional[int] = None) -> bool:
+        if turn_index is None:
+            turn_index = self.current_turn_index
+        return turn_index >= self.total_rounds
     
-    def get_debate_status(self) -> Dict[str, Any]:
+    def get_debate_status(self, turn_index: Optional[int] = None) -> Dict[str, Any]:
+        if turn_index is None:
+            turn_index = self.current_turn_index
         return {
-            "total_rounds": self.TOTAL_ROUNDS,
-            "completed_turns": self.current_turn_index,
-            "remaining_turns": self.TOTAL_ROUNDS - self.current_turn_index,
-            "is_complete": self.is_debate_complete(),
-            "next_turn": self.get_next_agent()
+            "total_rounds": self.total_rounds,
+            "completed_turns": turn_index,
+            "remaining_turns": self.total_rounds - turn_index,
+            "is_complete": self.is_debate_complete(turn_index),
+            "next_turn": self.get_next_agent(turn_index)
         }
     
     def detect_repeated_arguments(self, memory: list) -> list:
@@ -65,13 +84,14 @@ class CoordinatorNode:
             agent = entry["agent"]
             if agent not in agent_arguments:
                 agent_arguments[agent] = []
-            agent_arguments[agent].append(entry["text"])
+            agent_arguments[agent].append(set(entry["text"].lower().split()))
         
+        window = self.warning_window
         for agent, arguments in agent_arguments.items():
-            for i, arg1 in enumerate(arguments):
-                for j, arg2 in enumerate(arguments[i+1:], start=i+1):
-                    words1 = set(arg1.lower().split())
-                    words2 = set(arg2.lower().split())
+            for i, words1 in enumerate(arguments):
+                end = len(arguments) if window is None else min(len(arguments), i + 1 + window)
+                for j in range(i + 1, end):
+                    words2 = arguments[j]
                     
                     if len(words1) > 0 and len(words2) > 0:
                         overlap = len(words1 & words2) / min(len(words1), len(words2))
@@ -107,26 +127,37 @@ class CoordinatorNode:
         
         return warnings
     
+    def analyze(self, memory: list) -> Dict[str, list]:
+        return {
+            "repetition_warnings": self.detect_repeated_arguments(memory),
+            "coherence_warnings": self.check_logical_coherence(memory),
+        }
+    
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
         memory = state.get("memory", [])
+        turn_index = state.get("turn_index", self.current_turn_index)
+        status = self.get_debate_status(turn_index)
         
-        repetition_warnings = self.detect_repeated_arguments(memory)
-        
-        coherence_warnings = self.check_logical_coherence(memory)
-        
-        status = self.get_debate_status()
+        if self.analyze_each_turn or status["is_complete"]:
+            warnings = self.analyze(memory)
+        else:
+            warnings = state
+        repetition_warnings = warnings.get("repetition_warnings", [])
+        coherence_warnings = warnings.get("coherence_warnings", [])
         
-        next_turn = self.get_next_agent()
+        next_turn = self.get_next_agent(turn_index)
         
         if next_turn:
             next_round, next_agent = next_turn
+            turn_index += 1
         else:
             next_round, next_agent = None, None
         
         return {
             "current_round": next_round,
             "next_agent": next_agent,
-            "debate_complete": self.is_debate_complete(),
+            "turn_index": turn_index,
+            "debate_complete": status["is_complete"],
             "repetition_warnings": repetition_warnings,
             "coherence_warnings": coherence_warnings,
             "debate_status": status,
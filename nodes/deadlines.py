@@ -0,0 +1,203 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+GENERATION_POOL_SIZE = 32
+
+
+class GenerationPool:
+    
+    def __init__(self, max_workers: int = GENERATION_POOL_SIZE):
+        if max_workers < 1:
+            raise ValueError("Generation pool needs at least 1 worker")
+        self.name = "GenerationPool"
+        self.max_workers = max_workers
+        self.in_flight = 0
+        self.abandoned = 0
+        self.abandoned_total = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="generation")
+        self._abandoned_futures: set = set()
+        self._lock = threading.Lock()
+    
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.max_workers
+    
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        with self._lock:
+            self.in_flight += 1
+        future = self._executor.submit(fn)
+        future.add_done_callback(self._finished)
+        return future
+    
+    def _finished(self, future: Future):
+        with self._lock:
+            self.in_flight -= 1
+            if future in self._abandoned_futures:
+                self._abandoned_futures.discard(future)
+                self.abandoned -= 1
+    
+    def abandon(self, future: Future):
+        if future.cancel():
+            return
+        with self._lock:
+            if future.done() or future in self._abandoned_futures:
+                return
+            self._abandoned_futures.add(future)
+            self.abandoned += 1
+            self.abandoned_total += 1
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_generation_pools: Dict[int, GenerationPool] = {}
+_generation_pool_lock = threading.Lock()
+
+
+def generation_pool(size: Optional[int] = None) -> GenerationPool:
+    size = size or GENERATION_POOL_SIZE
+    with _generation_pool_lock:
+        pool = _generation_pools.get(size)
+        if pool is None:
+            pool = _generation_pools[size] = GenerationPool(size)
+        return pool
+
+
+def generation_pools() -> List[GenerationPool]:
+    with _generation_pool_lock:
+        return list(_generation_pools.values())
+
+
+def abandoned_generations() -> int:
+    return sum(pool.abandoned for pool in generation_pools())
+
+
+class LatencyTracker:
+    
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.name = "LatencyTracker"
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[index]
+
+
+def turn_deadline(turn_timeout: Optional[float], debate_deadline: Optional[float]) -> Optional[float]:
+    deadlines = [d for d in (debate_deadline, None if turn_timeout is None else time.monotonic() + turn_timeout) if d is not None]
+    return min(deadlines) if deadlines else None
+
+
+def _next_wait(started: float, deadline: Optional[float], hedge_delay: Optional[float], hedged: bool) -> Optional[float]:
+    now = time.monotonic()
+    waits = []
+    if deadline is not None:
+        waits.append(deadline - now)
+    if hedge_delay is not None and not hedged:
+        waits.append(started + hedge_delay - now)
+    return max(0.0, min(waits)) if waits else None
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def call_with_deadline(
+    fn: Callable[[], Any],
+    deadline: Optional[float] = None,
+    hedge_delay: Optional[float] = None,
+    tracker: Optional[LatencyTracker] = None,
+    pool: Optional[GenerationPool] = None,
+) -> Tuple[Any, bool]:
+    if _expired(deadline):
+        raise TimeoutError("Generation budget exhausted before the request was sent")
+    
+    def timed():
+        started = time.perf_counter()
+        result = fn()
+        if tracker is not None:
+            tracker.record(time.perf_counter() - started)
+        return result
+    
+    pool = pool or generation_pool()
+    started = time.monotonic()
+    futures = [pool.submit(timed)]
+    hedged = False
+    try:
+        while True:
+            done, _ = wait(futures, timeout=_next_wait(started, deadline, hedge_delay, hedged), return_when=FIRST_COMPLETED)
+            if done:
+                return done.pop().result(), len(futures) > 1
+            if _expired(deadline):
+                raise TimeoutError(f"Generation did not finish within its budget ({len(futures)} request(s) abandoned)")
+            if hedge_delay is not None and not hedged:
+                if not pool.saturated:
+                    futures.append(pool.submit(timed))
+                hedged = True
+    finally:
+        for future in futures:
+            pool.abandon(future)
+
+
+def _consume_result(task: "asyncio.Task"):
+    if not task.cancelled():
+        task.exception()
+
+
+async def acall_with_deadline(
+    make_call: Callable[[], Awaitable[Any]],
+    deadline: Optional[float] = None,
+    hedge_delay: Optional[float] = None,
+    tracker: Optional[LatencyTracker] = None,
+) -> Tuple[Any, bool]:
+    if _expired(deadline):
+        raise TimeoutError("Generation budget exhausted before the request was sent")
+    
+    async def timed():
+        started = time.perf_counter()
+        result = await make_call()
+        if tracker is not None:
+            tracker.record(time.perf_counter() - started)
+        return result
+    
+    def start():
+        task = asyncio.ensure_future(timed())
+        task.add_done_callback(_consume_result)
+        return task
+    
+    started = time.monotonic()
+    tasks = [start()]
+    hedged = False
+    try:
+        while True:
+            timeout = _next_wait(started, deadline, hedge_delay, hedged)
+            done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if done:
+                return done.pop().result(), hedged
+            if _expired(deadline):
+                raise TimeoutError(f"Generation did not finish within its budget ({len(tasks)} request(s) cancelled)")
+            if hedge_delay is not None and not hedged:
+                tasks.append(start())
+                hedged = True
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
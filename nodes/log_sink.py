@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from nodes.logger_node import LogRotator
+
+
+def _write_rotating(f, rotator: LogRotator, lines: List[str]):
+    for line in lines:
+        if rotator.rotate_if_needed() is not None:
+            f.close()
+            f = open(rotator.log_path, 'a', encoding='utf-8')
+        f.write(line)
+        f.flush()
+    return f
+
+
+def _sink_writer_loop(record_queue, log_path: str, batch_size: int, rotation: Optional[Dict[str, Any]] = None):
+    rotator = LogRotator(log_path, **(rotation or {}))
+    f = open(log_path, 'a', encoding='utf-8')
+    try:
+        while True:
+            line = record_queue.get()
+            if line is None:
+                return
+            
+            batch: List[str] = [line]
+            stop = False
+            while len(batch) < batch_size:
+                try:
+                    line = record_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                batch.append(line)
+            
+            if rotator.enabled:
+                f = _write_rotating(f, rotator, batch)
+            else:
+                f.write(''.join(batch))
+                f.flush()
+            if stop:
+                return
+    finally:
+        f.close()
+        rotator.close()
+
+
+class QueueLogWriter:
+    
+    def __init__(self, record_queue):
+        self.queue = record_queue
+    
+    def write(self, line: str):
+        self.queue.put(line)
+
+
+class FileLogWriter:
+    
+    def __init__(self, log_path: str, **rotation):
+        log_dir = os.path.dirname(log_path)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+        self.log_path = log_path
+        self.rotator = LogRotator(log_path, **rotation)
+        self._file = open(log_path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+    
+    def write(self, line: str):
+        with self._lock:
+            if self.rotator.enabled:
+                self._file = _write_rotating(self._file, self.rotator, [line])
+            else:
+                self._file.write(line)
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+        self.rotator.close()
+    
+    def __enter__(self) -> "FileLogWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LogSink:
+    
+    def __init__(self, log_path: str, batch_size: int = 256, max_queue: int = 10000, **rotation):
+        self.name = "LogSink"
+        self.log_path = log_path
+        self.batch_size = batch_size
+        self.rotation = rotation
+        
+        log_dir = os.path.dirname(log_path)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+        
+        self._context = multiprocessing.get_context()
+        self.queue = self._context.Queue(maxsize=max_queue)
+        self.process = None
+    
+    def start(self) -> "LogSink":
+        if self.process is None:
+            self.process = self._context.Process(
+                target=_sink_writer_loop,
+                args=(self.queue, self.log_path, self.batch_size, self.rotation),
+                name=f"{self.name}-writer",
+                daemon=True,
+            )
+            self.process.start()
+        return self
+    
+    def writer(self) -> QueueLogWriter:
+        return QueueLogWriter(self.queue)
+    
+    def stop(self):
+        if self.process is not None:
+            self.queue.put(None)
+            self.process.join()
+            self.process = None
+    
+    def __enter__(self) -> "LogSink":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -1,12 +1,233 @@
+import glob
+import gzip
 import json
 import os
-from typing import Dict, Any
+import queue
+import re
+import shutil
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
 
+def list_log_segments(log_path: str) -> List[str]:
+    root, ext = os.path.splitext(log_path)
+    pattern = re.compile(re.escape(root) + r"\.(\d+)" + re.escape(ext) + r"(\.gz)?$")
+    
+    segments = {}
+    for candidate in glob.glob(glob.escape(root) + ".*"):
+        match = pattern.match(candidate)
+        if not match:
+            continue
+        index = int(match.group(1))
+        if index not in segments or not candidate.endswith(".gz"):
+            segments[index] = candidate
+    
+    ordered = [segments[index] for index in sorted(segments)]
+    if os.path.exists(log_path):
+        ordered.append(log_path)
+    return ordered
+
+
+def iter_log_lines(log_path: str) -> Iterator[str]:
+    for segment in list_log_segments(log_path):
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield line
+
+
+def iter_log_entries(log_path: str, debate_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    for line in iter_log_lines(log_path):
+        entry = json.loads(line)
+        if debate_id is None or entry.get("debate_id") == debate_id:
+            yield entry
+
+
+ROTATION_OPTIONS = ("max_bytes", "max_entries", "rotate_interval", "compress")
+
+
+def rotation_options(log_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {key: value for key, value in (log_options or {}).items() if key in ROTATION_OPTIONS}
+
+
+class LogRotator:
+    
+    def __init__(
+        self,
+        log_path: str,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        compress: bool = False,
+    ):
+        self.name = "LogRotator"
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.enabled = any(limit is not None for limit in (max_bytes, max_entries, rotate_interval))
+        self._segment_inode: Optional[tuple] = None
+        self._segment_bytes = 0
+        self._segment_entries = 0
+        self._segment_started = time.monotonic()
+        if self.enabled:
+            self._refresh_segment()
+        self._compress_queue: Optional[queue.Queue] = None
+        self._compress_thread: Optional[threading.Thread] = None
+    
+    def _count_lines(self, start: int, end: int) -> int:
+        try:
+            with open(self.log_path, 'rb') as f:
+                f.seek(start)
+                return f.read(end - start).count(b'\n')
+        except OSError:
+            return 0
+    
+    def _refresh_segment(self):
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            stat = None
+        inode = None if stat is None else (stat.st_dev, stat.st_ino)
+        if inode != self._segment_inode:
+            self._segment_inode = inode
+            self._segment_bytes = 0
+            self._segment_entries = 0
+            self._segment_started = time.monotonic()
+        size = 0 if stat is None else stat.st_size
+        if size > self._segment_bytes:
+            if self.max_entries is not None:
+                self._segment_entries += self._count_lines(self._segment_bytes, size)
+            self._segment_bytes = size
+    
+    def _find_next_segment_index(self) -> int:
+        root, ext = os.path.splitext(self.log_path)
+        indices = [
+            int(segment[len(root) + 1:].split(".", 1)[0])
+            for segment in list_log_segments(self.log_path)
+            if segment != self.log_path
+        ]
+        return max(indices, default=0) + 1
+    
+    def should_rotate(self) -> bool:
+        self._refresh_segment()
+        if self._segment_bytes == 0:
+            return False
+        if self.max_bytes is not None and self._segment_bytes >= self.max_bytes:
+            return True
+        if self.max_entries is not None and self._segment_entries >= self.max_entries:
+            return True
+        if self.rotate_interval is not None and time.monotonic() - self._segment_started >= self.rotate_interval:
+            return True
+        return False
+    
+    def _claim_segment_path(self) -> str:
+        root, ext = os.path.splitext(self.log_path)
+        index = self._find_next_segment_index()
+        while True:
+            segment_path = f"{root}.{index:05d}{ext}"
+            index += 1
+            if os.path.exists(segment_path + ".gz"):
+                continue
+            try:
+                os.close(os.open(segment_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                continue
+            return segment_path
+    
+    def rotate(self) -> Optional[str]:
+        self._refresh_segment()
+        if self._segment_inode is None:
+            return None
+        
+        segment_path = self._claim_segment_path()
+        try:
+            stat = os.stat(self.log_path)
+            if (stat.st_dev, stat.st_ino) != self._segment_inode:
+                raise FileNotFoundError(self.log_path)
+            os.replace(self.log_path, segment_path)
+        except FileNotFoundError:
+            os.remove(segment_path)
+            self._refresh_segment()
+            return None
+        
+        self._segment_inode = None
+        self._segment_bytes = 0
+        self._segment_entries = 0
+        self._segment_started = time.monotonic()
+        
+        if self.compress:
+            self._submit_compression(segment_path)
+        return segment_path
+    
+    def _submit_compression(self, segment_path: str):
+        if self._compress_thread is None or not self._compress_thread.is_alive():
+            self._compress_queue = queue.Queue()
+            self._compress_thread = threading.Thread(
+                target=self._compression_worker,
+                name=f"{self.name}-compress",
+                daemon=True,
+            )
+            self._compress_thread.start()
+        self._compress_queue.put(segment_path)
+    
+    def _compression_worker(self):
+        while True:
+            segment_path = self._compress_queue.get()
+            try:
+                if segment_path is None:
+                    return
+                with open(segment_path, 'rb') as src, gzip.open(segment_path + ".gz", 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(segment_path)
+            except OSError:
+                pass
+            finally:
+                self._compress_queue.task_done()
+    
+    def rotate_if_needed(self) -> Optional[str]:
+        if self.enabled and self.should_rotate():
+            return self.rotate()
+        return None
+    
+    def close(self):
+        if self._compress_thread is not None and self._compress_thread.is_alive():
+            self._compress_queue.put(None)
+            self._compress_thread.join()
+        self._compress_thread = None
+
+
 class LoggerNode:
     
-    def __init__(self, log_path: str = None):
+    LEVELS = {"verdict": 0, "turns": 1, "full": 2, "debug": 3}
+    ENTRY_LEVELS = {
+        "final_verdict": "verdict",
+        "error": "verdict",
+        "timing": "verdict",
+        "node_execution": "turns",
+        "memory_snapshot": "full",
+        "warning": "full",
+        "state_transition": "debug",
+    }
+    
+    def __init__(
+        self,
+        log_path: str = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        compress: bool = False,
+        sink=None,
+        debate_id: Optional[str] = None,
+        verbosity: str = "debug",
+        sample_rates: Optional[Dict[str, int]] = None,
+        warnings_once: bool = False,
+        metrics=None,
+    ):
         self.name = "LoggerNode"
         
         if log_path is None:
@@ -16,26 +237,95 @@ class LoggerNode:
         self.log_path = log_path
         self.log_entries = []
         
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.rotator = LogRotator(log_path, max_bytes, max_entries, rotate_interval, compress)
+        self.rotation_enabled = self.rotator.enabled
+        self.sink = sink
+        self.debate_id = debate_id
+        
+        if verbosity not in self.LEVELS:
+            raise ValueError(f"Unknown verbosity '{verbosity}'. Expected one of: {', '.join(self.LEVELS)}")
+        self.verbosity = verbosity
+        self.sample_rates = {k: v for k, v in (sample_rates or {}).items() if v and v > 1}
+        self.warnings_once = warnings_once
+        self.metrics = metrics
+        self._sample_counters: Dict[str, int] = {}
+        self._seen_warnings = set()
+        
         log_dir = os.path.dirname(log_path)
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir, exist_ok=True)
     
+    
+    def reset(self, debate_id: Optional[str] = None):
+        self.debate_id = debate_id
+        self.log_entries = []
+        self._sample_counters = {}
+        self._seen_warnings = set()
+    
+    def rotate(self) -> Optional[str]:
+        return self.rotator.rotate()
+    
+    def close(self):
+        self.rotator.close()
+    
+    def get_segments(self) -> List[str]:
+        return list_log_segments(self.log_path)
+    
+    def is_enabled(self, entry_type: str) -> bool:
+        required = self.ENTRY_LEVELS.get(entry_type, "verdict")
+        return self.LEVELS[required] <= self.LEVELS[self.verbosity]
+    
+    def should_log(self, entry_type: str) -> bool:
+        if not self.is_enabled(entry_type):
+            return False
+        
+        rate = self.sample_rates.get(entry_type)
+        if rate is None:
+            return True
+        count = self._sample_counters.get(entry_type, 0)
+        self._sample_counters[entry_type] = count + 1
+        return count % rate == 0
+    
     def log(self, entry_type: str, data: Dict[str, Any]):
         entry = {
             "timestamp": datetime.now().isoformat(),
             "type": entry_type,
             "data": data
         }
+        if self.debate_id is not None:
+            entry["debate_id"] = self.debate_id
         
         self.log_entries.append(entry)
         
+        line = json.dumps(entry) + '\n'
+        if self.sink is not None:
+            self.sink.write(line)
+            if self.metrics is not None:
+                self.metrics.log_bytes.inc(len(line.encode('utf-8')))
+            return
+        
+        if self.rotation_enabled:
+            self.rotator.rotate_if_needed()
+        
         with open(self.log_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + '\n')
+            f.write(line)
+        
+        size = len(line.encode('utf-8'))
+        if self.metrics is not None:
+            self.metrics.log_bytes.inc(size)
     
     def log_node_execution(self, node_execution: Dict[str, Any]):
+        if not self.should_log("node_execution"):
+            return
         self.log(entry_type="node_execution", data=node_execution)
     
     def log_state_transition(self, from_state: Dict[str, Any], to_state: Dict[str, Any]):
+        if not self.should_log("state_transition"):
+            return
         self.log(
             entry_type="state_transition",
             data={
@@ -45,6 +335,8 @@ class LoggerNode:
         )
     
     def log_memory_snapshot(self, memory: list):
+        if not self.should_log("memory_snapshot"):
+            return
         self.log(
             entry_type="memory_snapshot",
             data={
@@ -56,6 +348,16 @@ class LoggerNode:
     def log_final_verdict(self, verdict: Dict[str, Any]):
         self.log(entry_type="final_verdict", data=verdict)
     
+    def log_timing(self, spans: List[Dict[str, Any]], summary: Dict[str, Any] = None):
+        self.log(
+            entry_type="timing",
+            data={
+                "total_spans": len(spans),
+                "spans": spans,
+                "summary": summary or {}
+            }
+        )
+    
     def log_error(self, error_type: str, message: str, details: Dict[str, Any] = None):
         self.log(
             entry_type="error",
@@ -67,6 +369,13 @@ class LoggerNode:
         )
     
     def log_warning(self, warning_type: str, message: str, details: Dict[str, Any] = None):
+        if self.warnings_once:
+            key = (warning_type, message)
+            if key in self._seen_warnings:
+                return
+            self._seen_warnings.add(key)
+        if not self.should_log("warning"):
+            return
         self.log(
             entry_type="warning",
             data={
@@ -106,15 +415,17 @@ class LoggerNode:
         if "memory" in state:
             self.log_memory_snapshot(state["memory"])
         
-        if "repetition_warnings" in state:
+        warnings_enabled = self.is_enabled("warning")
+        
+        if warnings_enabled and "repetition_warnings" in state:
             for warning in state["repetition_warnings"]:
                 self.log_warning("repetition", warning["message"], warning)
         
-        if "coherence_warnings" in state:
+        if warnings_enabled and "coherence_warnings" in state:
             for warning in state["coherence_warnings"]:
                 self.log_warning("coherence", warning["message"], warning)
         
-        if "winner" in state and "winner_justification" in state:
+        if state.get("winner") and "winner_justification" in state:
             self.log_final_verdict({
                 "winner": state["winner"],
                 "confidence": state.get("winner_confidence", 0),
@@ -0,0 +1,75 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def index_terms(text: str) -> List[str]:
+    return _TERM_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    
+    COMMON_TERM_RATIO = 0.5
+    
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_postings: Optional[int] = 2048):
+        self.name = "InvertedIndex"
+        self.k1 = k1
+        self.b = b
+        self.max_postings = max_postings
+        self.clear()
+    
+    def clear(self):
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._lengths: List[int] = []
+        self._agents: List[Optional[str]] = []
+        self._total_length = 0
+    
+    def __len__(self) -> int:
+        return len(self._lengths)
+    
+    def add(self, text: str, agent: Optional[str] = None) -> int:
+        doc_id = len(self._lengths)
+        counts = Counter(index_terms(text))
+        for term, tf in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = ([], [])
+            postings[0].append(doc_id)
+            postings[1].append(tf)
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._agents.append(agent)
+        self._total_length += length
+        return doc_id
+    
+    def _query_terms(self, query: str) -> List[str]:
+        terms = [term for term in set(index_terms(query)) if term in self._postings]
+        limit = len(self._lengths) * self.COMMON_TERM_RATIO
+        selective = [term for term in terms if len(self._postings[term][0]) <= limit]
+        if selective or not terms:
+            return selective
+        return [min(terms, key=lambda term: len(self._postings[term][0]))]
+    
+    def search(self, query: str, k: int = 5, agent_filter: Optional[str] = None) -> List[Tuple[int, float]]:
+        total = len(self._lengths)
+        if not total or k < 1:
+            return []
+        average_length = self._total_length / total or 1.0
+        base = self.k1 * (1 - self.b)
+        scale = self.k1 * self.b / average_length
+        lengths, agents = self._lengths, self._agents
+        scores: Dict[int, float] = {}
+        for term in self._query_terms(query):
+            doc_ids, tfs = self._postings[term]
+            df = len(doc_ids)
+            weight = math.log(1 + (total - df + 0.5) / (df + 0.5)) * (self.k1 + 1)
+            start = 0 if self.max_postings is None else max(0, df - self.max_postings)
+            for doc_id, tf in zip(doc_ids[start:], tfs[start:]):
+                if agent_filter is not None and agents[doc_id] != agent_filter:
+                    continue
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (tf + base + scale * lengths[doc_id])
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], item[0]))
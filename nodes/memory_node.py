@@ -1,22 +1,36 @@
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from nodes.memory_index import InvertedIndex
+
 
 class MemoryNode:
     
     def __init__(self):
         self.name = "MemoryNode"
         self.memory_store: List[Dict[str, Any]] = []
+        self.index = InvertedIndex()
+        self._indexed: List[Dict[str, Any]] = []
+        self._latest: List[Dict[str, Any]] = []
     
-    def add_entry(self, round_num: int, agent_id: str, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        entry = {
+    def reset(self):
+        self.memory_store = []
+        self.index.clear()
+        self._indexed = []
+        self._latest = []
+    
+    def _make_entry(self, round_num: int, agent_id: str, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        return {
             "round": round_num,
             "agent": agent_id,
             "text": text,
             "timestamp": datetime.now().isoformat(),
             "meta": metadata or {}
         }
+    
+    def add_entry(self, round_num: int, agent_id: str, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        entry = self._make_entry(round_num, agent_id, text, metadata)
         
         self.memory_store.append(entry)
         return entry
@@ -29,6 +43,29 @@ class MemoryNode:
         
         return other_agent_entries[-max_entries:]
     
+    def sync_index(self, memory: List[Dict[str, Any]]):
+        if not memory:
+            return
+        start = len(memory)
+        if self._indexed:
+            last = self._indexed[-1]
+            while start > 0 and memory[start - 1] != last and memory[start - 1]["round"] >= last["round"]:
+                start -= 1
+            continued = memory[start - 1] == last if start > 0 else memory[0]["round"] > last["round"]
+            if not continued:
+                self.index.clear()
+                self._indexed = []
+                start = 0
+        else:
+            start = 0
+        for entry in memory[start:]:
+            self.index.add(entry["text"], entry["agent"])
+            self._indexed.append(entry)
+    
+    def search(self, query: str, k: int = 5, agent_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+        self.sync_index(self._latest or self.memory_store)
+        return [self._indexed[doc_id] for doc_id, _ in self.index.search(query, k, agent_filter)]
+    
     def get_full_memory(self) -> List[Dict[str, Any]]:
         return self.memory_store.copy()
     
@@ -42,9 +79,10 @@ class MemoryNode:
         current_round = state.get("current_round", 1)
         current_agent = state.get("current_agent")
         current_argument = state.get("current_argument")
+        memory = list(state.get("memory", []))
         
         if current_agent and current_argument:
-            entry = self.add_entry(
+            entry = self._make_entry(
                 round_num=current_round,
                 agent_id=current_agent,
                 text=current_argument,
@@ -52,9 +90,11 @@ class MemoryNode:
                     "argument_length": len(current_argument)
                 }
             )
+            memory.append(entry)
+            self._latest = memory
             
             return {
-                "memory": self.get_full_memory(),
+                "memory": memory,
                 "node_execution": {
                     "node": self.name,
                     "input": {
@@ -63,17 +103,18 @@ class MemoryNode:
                         "argument_length": len(current_argument)
                     },
                     "output": {
-                        "total_entries": len(self.memory_store),
+                        "total_entries": len(memory),
                         "latest_entry": entry
                     }
                 }
             }
         
+        self._latest = memory
         return {
-            "memory": self.get_full_memory(),
+            "memory": memory,
             "node_execution": {
                 "node": self.name,
                 "input": state,
-                "output": {"total_entries": len(self.memory_store)}
+                "output": {"total_entries": len(memory)}
             }
         }
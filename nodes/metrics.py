@@ -0,0 +1,352 @@
+import asyncio
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _ShardedMetric:
+    
+    metric_type = ""
+    
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+    
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+    
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+    
+    def _snapshot_shards(self) -> List[dict]:
+        with self._shards_lock:
+            return [dict(shard) for shard in self._shards]
+    
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+
+
+class Counter(_ShardedMetric):
+    
+    metric_type = "counter"
+    
+    def inc(self, amount: float = 1, **labels):
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        return sum(shard.get(key, 0) for shard in self._snapshot_shards())
+    
+    def totals(self) -> Dict[Tuple[str, ...], float]:
+        totals: Dict[Tuple[str, ...], float] = {}
+        for shard in self._snapshot_shards():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+    
+    def render(self) -> List[str]:
+        lines = super().render()
+        for key, value in sorted(self.totals().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_ShardedMetric):
+    
+    metric_type = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, **labels):
+        shard = self._shard()
+        key = self._key(labels)
+        series = shard.get(key)
+        if series is None:
+            series = shard[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+    
+    def totals(self) -> Dict[Tuple[str, ...], list]:
+        totals: Dict[Tuple[str, ...], list] = {}
+        for shard in self._snapshot_shards():
+            for key, (counts, total, count) in shard.items():
+                merged = totals.setdefault(key, [[0] * (len(self.buckets) + 1), 0.0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+                merged[2] += count
+        return totals
+    
+    def render(self) -> List[str]:
+        lines = super().render()
+        for key, (counts, total, count) in sorted(self.totals().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Gauge:
+    
+    metric_type = "gauge"
+    
+    def __init__(self, name: str, help_text: str, fn: Callable[[], float]):
+        self.name = name
+        self.help_text = help_text
+        self.fn = fn
+    
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+            f"{self.name} {_format_value(self.fn())}",
+        ]
+
+
+def _abandoned_generations() -> float:
+    from nodes.deadlines import abandoned_generations
+    
+    return abandoned_generations()
+
+
+class DebateMetrics:
+    
+    def __init__(self, latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.name = "DebateMetrics"
+        self.debates = Counter("debate_debates_completed_total", "Debates finished, by status.", ("status",))
+        self.turns = Counter("debate_turns_total", "Agent turns completed.")
+        self.node_latency = Histogram(
+            "debate_node_latency_seconds",
+            "Wall-clock latency of each graph node call.",
+            ("node",),
+            latency_buckets,
+        )
+        self.generation_retries = Counter(
+            "debate_agent_generation_retries_total",
+            "Regenerations triggered by AgentNode duplicate detection.",
+            ("agent",),
+        )
+        self.generation_fallbacks = Counter(
+            "debate_agent_generation_fallbacks_total",
+            "Generations that ran past their deadline and fell back to the template generator.",
+            ("agent",),
+        )
+        self.generation_hedges = Counter(
+            "debate_agent_generation_hedges_total",
+            "Generations that sent a hedged second request after the tracked latency quantile.",
+            ("agent",),
+        )
+        self.warnings = Counter(
+            "debate_coordinator_warnings_total",
+            "Warnings reported by CoordinatorNode at the end of each debate, by type.",
+            ("type",),
+        )
+        self.log_bytes = Counter("debate_logger_bytes_total", "Bytes of JSONL written by LoggerNode.")
+        self._started = time.monotonic()
+        self._rate_lock = threading.Lock()
+        self._last_rate_sample = (self._started, 0.0)
+        self._gauges: List[Gauge] = [
+            Gauge("debate_turns_per_second", "Turns completed per second since the previous scrape.", self._turn_rate),
+            Gauge("debate_uptime_seconds", "Seconds since the metrics were created.", lambda: time.monotonic() - self._started),
+            Gauge(
+                "debate_generation_abandoned_in_flight",
+                "Timed-out sync model calls still running on a generation pool thread.",
+                _abandoned_generations,
+            ),
+        ]
+    
+    def add_gauge(self, name: str, help_text: str, fn: Callable[[], float]):
+        self._gauges.append(Gauge(name, help_text, fn))
+    
+    def _turn_rate(self) -> float:
+        now = time.monotonic()
+        turns = self.turns.value()
+        with self._rate_lock:
+            last_time, last_turns = self._last_rate_sample
+            self._last_rate_sample = (now, turns)
+        elapsed = now - last_time
+        return (turns - last_turns) / elapsed if elapsed > 0 else 0.0
+    
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        histogram = self.node_latency
+        
+        if asyncio.iscoroutinefunction(fn):
+            async def timed(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - started, node=name)
+        else:
+            def timed(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - started, node=name)
+        
+        timed.__name__ = getattr(fn, "__name__", name)
+        return timed
+    
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (
+            self.debates,
+            self.turns,
+            self.node_latency,
+            self.generation_retries,
+            self.generation_fallbacks,
+            self.generation_hedges,
+            self.warnings,
+            self.log_bytes,
+        ):
+            lines.extend(metric.render())
+        for gauge in self._gauges:
+            lines.extend(gauge.render())
+        return "\n".join(lines) + "\n"
+    
+    def write(self, path: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class MetricsFileWriter:
+    
+    def __init__(self, metrics: DebateMetrics, path: str, interval: float = 15.0):
+        self.name = "MetricsFileWriter"
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.metrics.write(self.path)
+    
+    def start(self) -> "MetricsFileWriter":
+        metrics_dir = os.path.dirname(self.path)
+        if metrics_dir and not os.path.exists(metrics_dir):
+            os.makedirs(metrics_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._loop, name=f"{self.name}-writer", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.metrics.write(self.path)
+    
+    def __enter__(self) -> "MetricsFileWriter":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class MetricsServer:
+    
+    def __init__(self, metrics: DebateMetrics, host: str = "127.0.0.1", port: int = 9100):
+        self.name = "MetricsServer"
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "MetricsServer":
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_metrics_handler(self.metrics))
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"{self.name}-http", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+    
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def send_metrics(handler: BaseHTTPRequestHandler, metrics: DebateMetrics):
+    body = metrics.render().encode('utf-8')
+    handler.send_response(200)
+    handler.send_header("Content-Type", CONTENT_TYPE)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def _make_metrics_handler(metrics: DebateMetrics):
+    
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        
+        def log_message(self, format, *args):
+            pass
+        
+        def do_GET(self):
+            if self.path.split("?", 1)[0].rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            send_metrics(self, metrics)
+    
+    return MetricsRequestHandler
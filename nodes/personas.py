@@ -0,0 +1,21 @@
+import os
+from typing import Iterable, List
+
+PERSONA_DIR = "persona_templates"
+
+
+def list_personas(persona_dir: str = PERSONA_DIR) -> List[str]:
+    if not os.path.isdir(persona_dir):
+        return []
+    return sorted(
+        os.path.splitext(name)[0]
+        for name in os.listdir(persona_dir)
+        if name.endswith(".txt")
+    )
+
+
+def check_personas(personas: Iterable[str], persona_dir: str = PERSONA_DIR):
+    available = list_personas(persona_dir)
+    unknown = [persona for persona in personas if persona not in available]
+    if unknown:
+        raise ValueError(f"unknown persona {unknown[0]!r}; available: {', '.join(available)}")
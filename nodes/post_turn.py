@@ -0,0 +1,50 @@
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+class PostTurnWorker:
+    
+    def __init__(self, name: str = "PostTurnWorker"):
+        self.name = name
+        self.submitted = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+    
+    def submit(self, fn: Callable, *args: Any):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+            self._thread.start()
+        self.submitted += 1
+        self._queue.put((fn, args))
+    
+    def _loop(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if self._error is None:
+                    fn, args = task
+                    fn(*args)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+    
+    def join(self) -> Optional[BaseException]:
+        self._queue.join()
+        error, self._error = self._error, None
+        return error
+    
+    def barrier(self):
+        error = self.join()
+        if error is not None:
+            raise error
+    
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
@@ -0,0 +1,154 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from typing import Dict, Any, Callable, List, Optional
+
+
+class NodeProfiler:
+    
+    MODES = ("cpu", "mem")
+    
+    def __init__(self, mode: str = "cpu", top_n: int = 20):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'. Expected one of: {', '.join(self.MODES)}")
+        self.name = "NodeProfiler"
+        self.mode = mode
+        self.top_n = top_n
+        self.node_stats: Dict[str, Dict[str, Any]] = {}
+        self.peak_bytes = 0
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._outside: Optional[cProfile.Profile] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._running = False
+    
+    def start(self):
+        self._running = True
+        if self.mode == "cpu":
+            self._outside = cProfile.Profile()
+            self._outside.enable()
+        else:
+            tracemalloc.start()
+    
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self.mode == "cpu":
+            self._outside.disable()
+        else:
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+            self._snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+    
+    def _stats_for(self, name: str) -> Dict[str, Any]:
+        stats = self.node_stats.get(name)
+        if stats is None:
+            stats = self.node_stats[name] = {"calls": 0, "wall_s": 0.0, "peak_bytes": 0, "net_bytes": 0}
+        return stats
+    
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        def profiled(*args, **kwargs):
+            if not self._running:
+                return fn(*args, **kwargs)
+            if self.mode == "cpu":
+                return self._call_cpu(name, fn, args, kwargs)
+            return self._call_mem(name, fn, args, kwargs)
+        
+        profiled.__name__ = getattr(fn, "__name__", name)
+        return profiled
+    
+    def _call_cpu(self, name: str, fn: Callable, args: tuple, kwargs: dict):
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._profiles[name] = cProfile.Profile()
+        stats = self._stats_for(name)
+        self._outside.disable()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            stats["wall_s"] += time.perf_counter() - started
+            stats["calls"] += 1
+            self._outside.enable()
+    
+    def _call_mem(self, name: str, fn: Callable, args: tuple, kwargs: dict):
+        stats = self._stats_for(name)
+        before, peak = tracemalloc.get_traced_memory()
+        self.peak_bytes = max(self.peak_bytes, peak)
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            self.peak_bytes = max(self.peak_bytes, peak)
+            stats["wall_s"] += time.perf_counter() - started
+            stats["calls"] += 1
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak - before)
+            stats["net_bytes"] += after - before
+    
+    def combined_stats(self) -> pstats.Stats:
+        profiles = [self._outside] + list(self._profiles.values())
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+    
+    def _top_functions(self, stats: pstats.Stats, sort_key: str, limit: int) -> str:
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(sort_key).print_stats(limit)
+        return stream.getvalue()
+    
+    def report(self) -> str:
+        lines = [f"Profile mode: {self.mode}", ""]
+        if self.mode == "cpu":
+            outside_tt = pstats.Stats(self._outside, stream=io.StringIO()).total_tt
+            lines.append(f"{'Node':<16}{'Calls':>8}{'Wall s':>12}{'CPU s':>12}")
+            for name, stats in sorted(self.node_stats.items(), key=lambda item: -item[1]["wall_s"]):
+                cpu_s = pstats.Stats(self._profiles[name], stream=io.StringIO()).total_tt
+                lines.append(f"{name:<16}{stats['calls']:>8}{stats['wall_s']:>12.4f}{cpu_s:>12.4f}")
+            lines.append(f"{'(graph runtime)':<16}{'':>8}{'':>12}{outside_tt:>12.4f}")
+            lines.append("")
+            lines.append(f"Top {self.top_n} functions by cumulative time (all nodes):")
+            lines.append(self._top_functions(self.combined_stats(), "cumulative", self.top_n))
+            for name in self.node_stats:
+                lines.append(f"--- {name}: top {min(self.top_n, 10)} by internal time ---")
+                node_stats = pstats.Stats(self._profiles[name], stream=io.StringIO())
+                lines.append(self._top_functions(node_stats, "tottime", min(self.top_n, 10)))
+        else:
+            lines.append(f"Overall peak traced memory: {self.peak_bytes / 1024:.1f} KiB")
+            lines.append("")
+            lines.append(f"{'Node':<16}{'Calls':>8}{'Peak KiB':>12}{'Net KiB':>12}{'Wall s':>12}")
+            for name, stats in sorted(self.node_stats.items(), key=lambda item: -item[1]["peak_bytes"]):
+                lines.append(
+                    f"{name:<16}{stats['calls']:>8}{stats['peak_bytes'] / 1024:>12.1f}"
+                    f"{stats['net_bytes'] / 1024:>12.1f}{stats['wall_s']:>12.4f}"
+                )
+            if self._snapshot is not None:
+                lines.append("")
+                lines.append(f"Top {self.top_n} allocation sites still live at the end of the run:")
+                for stat in self._snapshot.statistics("lineno")[:self.top_n]:
+                    lines.append(f"  {stat}")
+        return "\n".join(lines) + "\n"
+    
+    def write(self, prefix: str) -> List[str]:
+        paths = []
+        if self.mode == "cpu":
+            stats_path = f"{prefix}.pstats"
+            self.combined_stats().dump_stats(stats_path)
+            paths.append(stats_path)
+        elif self._snapshot is not None:
+            snapshot_path = f"{prefix}.tracemalloc"
+            self._snapshot.dump(snapshot_path)
+            paths.append(snapshot_path)
+        
+        report_path = f"{prefix}.txt"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(self.report())
+        paths.append(report_path)
+        return paths
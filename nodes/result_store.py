@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, List, Optional
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    global _code_version
+    if _code_version is None:
+        nodes_dir = os.path.dirname(os.path.abspath(__file__))
+        paths = sorted(
+            os.path.join(nodes_dir, name) for name in os.listdir(nodes_dir) if name.endswith(".py")
+        )
+        paths.append(os.path.join(os.path.dirname(nodes_dir), "run_debate.py"))
+        digest = hashlib.sha256()
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            digest.update(os.path.basename(path).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def debate_fingerprint(
+    topic: str,
+    personas: Dict[str, str],
+    persona_texts: Dict[str, str],
+    seed: int,
+    backend: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    payload = json.dumps(
+        {
+            "topic": topic,
+            "personas": personas,
+            "persona_texts": persona_texts,
+            "seed": seed,
+            "backend": backend,
+            "options": options or {},
+            "code_version": code_version(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DebateResultStore:
+
+    SCAN_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = 7 * 24 * 3600.0,
+    ):
+        self.name = "DebateResultStore"
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._approx_bytes = 0
+        self._approx_entries = 0
+        self._last_scan = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{fingerprint}.json")
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.max_age is not None and now - mtime > self.max_age
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        path = self._path(fingerprint)
+        try:
+            mtime = os.stat(path).st_mtime
+            if self._expired(mtime, time.time()):
+                os.remove(path)
+                self.misses += 1
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record
+
+    def put(self, fingerprint: str, final_state: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
+        record = {
+            "fingerprint": fingerprint,
+            "created": time.time(),
+            "metadata": metadata or {},
+            "final_state": final_state,
+        }
+        path = self._path(fingerprint)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, default=str)
+            size = f.tell()
+        os.replace(tmp_path, path)
+
+        self._approx_bytes += size
+        self._approx_entries += 1
+        if self._needs_scan():
+            self.evict()
+
+    def _needs_scan(self) -> bool:
+        if self._last_scan is None or time.monotonic() - self._last_scan > self.SCAN_INTERVAL:
+            return True
+        if self.max_bytes is not None and self._approx_bytes > self.max_bytes:
+            return True
+        return self.max_entries is not None and self._approx_entries > self.max_entries
+
+    def _scan(self) -> List[tuple]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        self.evicted += 1
+        return True
+
+    def evict(self) -> int:
+        now = time.time()
+        evicted_before = self.evicted
+        entries = []
+        for mtime, size, path in self._scan():
+            if self._expired(mtime, now):
+                self._remove(path)
+            else:
+                entries.append((mtime, size, path))
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        total_entries = len(entries)
+        for _, size, path in entries:
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            over_entries = self.max_entries is not None and total_entries > self.max_entries
+            if not (over_bytes or over_entries):
+                break
+            if self._remove(path):
+                total_bytes -= size
+                total_entries -= 1
+
+        self._approx_bytes = total_bytes
+        self._approx_entries = total_entries
+        self._last_scan = time.monotonic()
+        return self.evicted - evicted_before
+
+    def clear(self):
+        for _, _, path in self._scan():
+            self._remove(path)
+        self._approx_bytes = 0
+        self._approx_entries = 0
@@ -0,0 +1,121 @@
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Callable, List, Optional
+
+
+class SpanTracer:
+    
+    def __init__(self, enabled: bool = True):
+        self.name = "SpanTracer"
+        self.enabled = enabled
+        self.spans: List[Dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._stack_var: contextvars.ContextVar = contextvars.ContextVar(f"span_stack_{id(self)}", default=())
+        self._thread_ids: Dict[int, int] = {}
+        self._lock = threading.Lock()
+    
+    def _thread_id(self) -> int:
+        ident = threading.get_ident()
+        tid = self._thread_ids.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._thread_ids.setdefault(ident, len(self._thread_ids) + 1)
+        return tid
+    
+    @contextmanager
+    def _record(self, name: str, category: str, args: Dict[str, Any]):
+        stack = self._stack_var.get()
+        span = {
+            "name": name,
+            "cat": category,
+            "tid": self._thread_id(),
+            "depth": len(stack),
+            "parent": stack[-1]["name"] if stack else None,
+            "args": args,
+        }
+        token = self._stack_var.set(stack + (span,))
+        start_ns = time.perf_counter_ns()
+        try:
+            yield span
+        finally:
+            end_ns = time.perf_counter_ns()
+            self._stack_var.reset(token)
+            span["start_us"] = (start_ns - self._origin_ns) / 1000.0
+            span["duration_us"] = (end_ns - start_ns) / 1000.0
+            with self._lock:
+                self.spans.append(span)
+    
+    def span(self, name: str, category: str = "node", **args):
+        if not self.enabled:
+            return nullcontext()
+        return self._record(name, category, args)
+    
+    def wrap(
+        self,
+        name: str,
+        fn: Callable,
+        category: str = "node",
+        span_args: Optional[Callable[..., Dict[str, Any]]] = None,
+    ) -> Callable:
+        if not self.enabled:
+            return fn
+        
+        if asyncio.iscoroutinefunction(fn):
+            async def traced(*args, **kwargs):
+                with self._record(name, category, span_args(*args, **kwargs) if span_args else {}):
+                    return await fn(*args, **kwargs)
+        else:
+            def traced(*args, **kwargs):
+                with self._record(name, category, span_args(*args, **kwargs) if span_args else {}):
+                    return fn(*args, **kwargs)
+        
+        traced.__name__ = getattr(fn, "__name__", name)
+        return traced
+    
+    def get_spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return sorted(self.spans, key=lambda span: span["start_us"])
+    
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        summary: Dict[str, Dict[str, float]] = {}
+        for span in self.get_spans():
+            stats = summary.setdefault(span["name"], {"count": 0, "total_us": 0.0, "max_us": 0.0})
+            stats["count"] += 1
+            stats["total_us"] += span["duration_us"]
+            stats["max_us"] = max(stats["max_us"], span["duration_us"])
+        return summary
+    
+    def to_trace_events(self, pid: Optional[int] = None) -> List[Dict[str, Any]]:
+        pid = os.getpid() if pid is None else pid
+        return [
+            {
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": span["start_us"],
+                "dur": span["duration_us"],
+                "pid": pid,
+                "tid": span["tid"],
+                "args": span["args"],
+            }
+            for span in self.get_spans()
+        ]
+    
+    def export_chrome_trace(self, path: str) -> str:
+        trace_dir = os.path.dirname(path)
+        if trace_dir and not os.path.exists(trace_dir):
+            os.makedirs(trace_dir, exist_ok=True)
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.to_trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
+    
+    def reset(self):
+        with self._lock:
+            self.spans = []
+        self._origin_ns = time.perf_counter_ns()
@@ -1,24 +1,62 @@
-import re
-from typing import Dict, Any
+from typing import BinaryIO, Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+_STRIP_CHARS = '<>{}\\'
+_STRIP_TABLE = str.maketrans('', '', _STRIP_CHARS)
+_ASCII_STRIP_TABLE = bytes.maketrans(b'\t\r\x0b\x0c\x1c\x1d\x1e\x1f', b' ' * 8)
+_ASCII_STRIP_BYTES = _STRIP_CHARS.encode('ascii')
+
+
+def _sanitize_bytes(line: bytes) -> bytes:
+    return b' '.join(line.translate(_ASCII_STRIP_TABLE, _ASCII_STRIP_BYTES).split())
+
+
+def _sanitize(text: str) -> str:
+    if text.isascii():
+        return _sanitize_bytes(text.encode('ascii')).decode('ascii')
+    return ' '.join(text.translate(_STRIP_TABLE).split())
+
+
+def _sanitize_block(block: bytes) -> List[str]:
+    if block.isascii():
+        text = block.translate(_ASCII_STRIP_TABLE, _ASCII_STRIP_BYTES).decode('ascii')
+        return [' '.join(line.split()) if '  ' in line else line.strip(' ') for line in text.split('\n')]
+    return [_sanitize(line) for line in block.decode('utf-8', errors='replace').split('\n')]
+
+
+def _iter_line_blocks(f: BinaryIO, size: int) -> Iterator[bytes]:
+    tail = b''
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            if tail:
+                yield tail
+            return
+        chunk = tail + chunk
+        cut = chunk.rfind(b'\n')
+        if cut < 0:
+            tail = chunk
+            continue
+        tail = chunk[cut + 1:]
+        yield chunk[:cut]
 
 
 class UserInputNode:
     
     MIN_TOPIC_LENGTH = 10
     MAX_TOPIC_LENGTH = 500
+    READ_BUFFER_SIZE = 1 << 20
     
-    def __init__(self):
+    def __init__(self, topic: Optional[str] = None):
         self.name = "UserInputNode"
+        self.topic = topic
     
     def sanitize_input(self, text: str) -> str:
-        sanitized = re.sub(r'[<>{}\\]', '', text)
-        sanitized = ' '.join(sanitized.split())
-        return sanitized.strip()
+        return _sanitize(text)
     
     def validate_topic(self, topic: str) -> tuple[bool, str]:
         if topic is None or not str(topic).strip():
             return False, "Topic cannot be empty or only whitespace."
-
+        
         stripped = topic.strip()
         if len(stripped) < self.MIN_TOPIC_LENGTH:
             return False, f"Topic too short. Minimum {self.MIN_TOPIC_LENGTH} characters required."
@@ -48,8 +86,85 @@ class UserInputNode:
                 print(f"\n✗ Invalid topic: {error_msg}")
                 print("Please try again.\n")
     
+    def prepare_topic(self, raw_topic: str) -> Tuple[Optional[str], str]:
+        sanitized_topic = self.sanitize_input(raw_topic)
+        is_valid, error_msg = self.validate_topic(sanitized_topic)
+        if not is_valid:
+            return None, error_msg
+        return sanitized_topic, ""
+    
+    def _reject_messages(self) -> Tuple[str, str, str]:
+        return (
+            "Topic cannot be empty or only whitespace.",
+            f"Topic too short. Minimum {self.MIN_TOPIC_LENGTH} characters required.",
+            f"Topic too long. Maximum {self.MAX_TOPIC_LENGTH} characters allowed.",
+        )
+    
+    def read_topics(self, lines: Iterable[str]) -> Iterator[Tuple[int, str, Optional[str], str]]:
+        min_length = self.MIN_TOPIC_LENGTH
+        max_length = self.MAX_TOPIC_LENGTH
+        empty, too_short, too_long = self._reject_messages()
+        
+        for index, line in enumerate(lines):
+            raw = line.strip()
+            if not raw:
+                continue
+            topic = _sanitize(raw)
+            length = len(topic)
+            if length < min_length:
+                yield index, raw, None, too_short if topic else empty
+            elif length > max_length:
+                yield index, raw, None, too_long
+            else:
+                yield index, raw, topic, ""
+    
+    def ingest_topics(
+        self,
+        lines: Iterable[str],
+        on_reject: Optional[Callable[[int, str, str], None]] = None,
+    ) -> Iterator[str]:
+        for index, raw, topic, error_msg in self.read_topics(lines):
+            if topic is not None:
+                yield topic
+            elif on_reject is not None:
+                on_reject(index, raw, error_msg)
+    
+    def ingest_topic_file(
+        self,
+        path: str,
+        on_reject: Optional[Callable[[int, str, str], None]] = None,
+    ) -> Iterator[str]:
+        min_length = self.MIN_TOPIC_LENGTH
+        max_length = self.MAX_TOPIC_LENGTH
+        empty, too_short, too_long = self._reject_messages()
+        index = 0
+        
+        with open(path, 'rb') as f:
+            for block in _iter_line_blocks(f, self.READ_BUFFER_SIZE):
+                topics = _sanitize_block(block)
+                raw_lines = None
+                for offset, topic in enumerate(topics):
+                    length = len(topic)
+                    if min_length <= length <= max_length:
+                        yield topic
+                        continue
+                    if on_reject is None:
+                        continue
+                    if raw_lines is None:
+                        raw_lines = block.split(b'\n')
+                    raw = raw_lines[offset].decode('utf-8', errors='replace').strip()
+                    if raw:
+                        reason = too_long if length > max_length else too_short if length else empty
+                        on_reject(index + offset, raw, reason)
+                index += len(topics)
+    
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        topic = self.get_topic_from_cli()
+        if self.topic is not None:
+            topic, error_msg = self.prepare_topic(self.topic)
+            if topic is None:
+                raise ValueError(f"Invalid topic: {error_msg}")
+        else:
+            topic = self.get_topic_from_cli()
         
         return {
             "topic": topic,
@@ -1,13 +1,22 @@
 import argparse
 import os
 import sys
-from typing import TypedDict, Dict, Any
-from langgraph.graph import StateGraph, END
-from nodes import UserInputNode, AgentNode, MemoryNode, CoordinatorNode, JudgeNode, LoggerNode
+import threading
+import time
+import uuid
+from collections import ChainMap
+from datetime import datetime
+from typing import TYPE_CHECKING, TypedDict, Dict, Any
+
+if TYPE_CHECKING:
+    import asyncio
+    from nodes import AgentNode
 
 
 class DebateState(TypedDict):
+    topic: str
     current_round: int
+    turn_index: int
     next_agent: str
     current_agent: str
     current_argument: str
@@ -25,46 +34,193 @@ class DebateState(TypedDict):
     node_execution: dict
 
 
+_STATE_ORDER = tuple(DebateState.__annotations__)
+_STATE_KEYS = frozenset(_STATE_ORDER)
+
+
 class DebateOrchestrator:
-    def __init__(self, seed: int = None, log_path: str = None, persona_config: dict = None):
+    LONG_DEBATE_ROUNDS = 64
+    LONG_DEBATE_WINDOW = 16
+    EXECUTORS = ("graph", "loop")
+    LOOP_EDGES = {
+        "user_input": "coordinator",
+        "turn_a": "coordinator",
+        "turn_b": "coordinator",
+        "judge": "logger_final",
+        "logger_final": None,
+    }
+
+    def __init__(
+        self,
+        seed: int = None,
+        log_path: str = None,
+        persona_config: dict = None,
+        log_options: dict = None,
+        trace_path: str = None,
+        debate_id: str = None,
+        log_sink=None,
+        topic: str = None,
+        backend=None,
+        verbose: bool = True,
+        on_event=None,
+        profiler=None,
+        metrics=None,
+        result_store=None,
+        total_rounds: int = None,
+        long_debate: bool = None,
+        executor: str = "graph",
+        pipeline: bool = False,
+        turn_timeout: float = None,
+        debate_timeout: float = None,
+        hedge_quantile: float = None,
+        generation_pool_size: int = None,
+        context_tokens: int = None,
+        context_retrieval: int = 0,
+    ):
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Expected one of: {', '.join(self.EXECUTORS)}")
         self.seed = seed
         self.log_path = log_path
         self.persona_config = persona_config or {"AgentA": "scientist", "AgentB": "philosopher"}
+        self.log_options = log_options or {}
+        self.trace_path = trace_path
+        self.debate_id = debate_id or uuid.uuid4().hex[:12]
+        self.log_sink = log_sink
+        self.topic = topic
+        self.backend = backend
+        self.verbose = verbose
+        self.on_event = on_event
+        self.profiler = profiler
+        self.metrics = metrics
+        self.result_store = result_store
+        self._running = False
+        self._running_lock = threading.Lock()
+        self.total_rounds = total_rounds
+        self.long_debate = long_debate if long_debate is not None else (total_rounds or 0) > self.LONG_DEBATE_ROUNDS
+        self.executor = executor
+        self.turn_timeout = turn_timeout
+        self.debate_timeout = debate_timeout
+        self.hedge_quantile = hedge_quantile
+        self.generation_pool_size = generation_pool_size
+        self.context_tokens = context_tokens
+        self.context_retrieval = context_retrieval
+        self.generation_semaphore = None
+        from nodes import SpanTracer, PostTurnWorker
+
+        self.tracer = SpanTracer(enabled=trace_path is not None)
+        self.post_turn = PostTurnWorker() if pipeline else None
         self._init_nodes()
-        self.graph = self._build_graph()
+        self._graph = None if executor == "loop" else self._build_graph()
+        self._async_graph = None
+        self._loop_nodes = None
+        self._async_loop_nodes = None
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
 
     def _init_nodes(self):
+        from nodes import UserInputNode, AgentNode, MemoryNode, CoordinatorNode, JudgeNode, LoggerNode
+
         persona_a = self.persona_config.get("AgentA", "scientist")
         persona_b = self.persona_config.get("AgentB", "philosopher")
         persona_a_path = f"persona_templates/{persona_a}.txt"
         persona_b_path = f"persona_templates/{persona_b}.txt"
-        self.user_input_node = UserInputNode()
+        history_window = self.LONG_DEBATE_WINDOW if self.long_debate else None
+        latency_tracker = None
+        if self.hedge_quantile is not None:
+            from nodes.deadlines import LatencyTracker
+
+            latency_tracker = LatencyTracker()
+        self.user_input_node = UserInputNode(topic=self.topic)
+        self.memory_node = MemoryNode()
         self.agent_a = AgentNode(
             agent_id="AgentA",
             persona_name=persona_a,
             persona_path=persona_a_path if os.path.exists(persona_a_path) else None,
             seed=self.seed,
+            backend=self.backend,
+            metrics=self.metrics,
+            history_window=history_window,
+            turn_timeout=self.turn_timeout,
+            hedge_quantile=self.hedge_quantile,
+            latency_tracker=latency_tracker,
+            generation_pool_size=self.generation_pool_size,
+            context_tokens=self.context_tokens,
+            context_retrieval=self.context_retrieval,
+            memory_node=self.memory_node,
         )
         self.agent_b = AgentNode(
             agent_id="AgentB",
             persona_name=persona_b,
             persona_path=persona_b_path if os.path.exists(persona_b_path) else None,
             seed=self.seed,
+            backend=self.backend,
+            metrics=self.metrics,
+            history_window=history_window,
+            turn_timeout=self.turn_timeout,
+            hedge_quantile=self.hedge_quantile,
+            latency_tracker=latency_tracker,
+            generation_pool_size=self.generation_pool_size,
+            context_tokens=self.context_tokens,
+            context_retrieval=self.context_retrieval,
+            memory_node=self.memory_node,
         )
-        self.memory_node = MemoryNode()
-        self.coordinator_node = CoordinatorNode(agent_a_id="AgentA", agent_b_id="AgentB")
+        self.coordinator_node = CoordinatorNode(
+            agent_a_id="AgentA",
+            agent_b_id="AgentB",
+            total_rounds=self.total_rounds,
+            warning_window=history_window,
+            analyze_each_turn=not (self.long_debate or self.post_turn is not None),
+        )
+        self.total_rounds = self.coordinator_node.total_rounds
         self.judge_node = JudgeNode(seed=self.seed)
-        self.logger_node = LoggerNode(log_path=self.log_path)
+        self.logger_node = LoggerNode(
+            log_path=self.log_path,
+            sink=self.log_sink,
+            debate_id=self.debate_id,
+            metrics=self.metrics,
+            **self.log_options,
+        )
+
+    def _wrapped_nodes(self, asynchronous: bool = False) -> Dict[str, Any]:
+        if asynchronous:
+            nodes = {
+                "user_input": self._auser_input_wrapper,
+                "coordinator": self._acoordinator_wrapper,
+                "turn_a": self._aturn_a_wrapper,
+                "turn_b": self._aturn_b_wrapper,
+                "judge": self._ajudge_wrapper,
+                "logger": self._alogger_wrapper,
+                "logger_final": self._alogger_wrapper,
+            }
+        else:
+            nodes = {
+                "user_input": self._user_input_wrapper,
+                "coordinator": self._coordinator_wrapper,
+                "turn_a": self._turn_a_wrapper,
+                "turn_b": self._turn_b_wrapper,
+                "judge": self._judge_wrapper,
+                "logger": self._logger_wrapper,
+                "logger_final": self._logger_wrapper,
+            }
+        for name, wrapper in nodes.items():
+            node = self.tracer.wrap(name, wrapper, span_args=self._span_args)
+            if self.metrics is not None:
+                node = self.metrics.wrap(name, node)
+            if self.profiler is not None and not asynchronous:
+                node = self.profiler.wrap(name, node)
+            nodes[name] = node
+        return nodes
+
+    def _build_graph(self, asynchronous: bool = False):
+        from langgraph.graph import StateGraph, END
 
-    def _build_graph(self):
         workflow = StateGraph(DebateState)
-        workflow.add_node("user_input", self._user_input_wrapper)
-        workflow.add_node("coordinator", self._coordinator_wrapper)
-        workflow.add_node("turn_a", self._turn_a_wrapper)
-        workflow.add_node("turn_b", self._turn_b_wrapper)
-        workflow.add_node("judge", self._judge_wrapper)
-        workflow.add_node("logger", self._logger_wrapper)
-        workflow.add_node("logger_final", self._logger_wrapper)
+        for name, node in self._wrapped_nodes(asynchronous).items():
+            workflow.add_node(name, node)
         workflow.set_entry_point("user_input")
         workflow.add_edge("user_input", "coordinator")
         workflow.add_conditional_edges(
@@ -78,54 +234,174 @@ class DebateOrchestrator:
         workflow.add_edge("logger_final", END)
         return workflow.compile()
 
+    def reset(self, topic: str = None, debate_id: str = None, seed: int = None, on_event=None) -> "DebateOrchestrator":
+        if self._running:
+            raise RuntimeError("Cannot reset a DebateOrchestrator while it is running a debate")
+        self.topic = topic
+        self.debate_id = debate_id or uuid.uuid4().hex[:12]
+        self.seed = seed
+        self.on_event = on_event
+        self.user_input_node.topic = topic
+        for node in (self.agent_a, self.agent_b, self.judge_node):
+            node.seed = seed
+        self.agent_a.reset()
+        self.agent_b.reset()
+        self.memory_node.reset()
+        self.coordinator_node.reset()
+        self.logger_node.reset(debate_id=self.debate_id)
+        self.tracer.reset()
+        return self
+
     def _user_input_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
         return self.user_input_node(state)
 
     def _coordinator_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        result = self.coordinator_node(state)
-        if not result.get("debate_complete", False):
-            self.coordinator_node.advance_turn()
-        return result
+        return self.coordinator_node(state)
 
     def _turn_a_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        result_agent = self.agent_a(state)
-        print("\n" + "=" * 80)
-        print(f"Round {state.get('current_round', '?')} - AgentA ({self.agent_a.persona_name}):")
-        print("-" * 80)
-        print(result_agent.get("current_argument", ""))
-        print("=" * 80 + "\n")
-        state_after_agent = {**state, **result_agent}
-        result_memory = self.memory_node(state_after_agent)
-        state_after_memory = {**state_after_agent, **result_memory}
-        result_logger = self.logger_node(state_after_memory)
-        return {**state_after_memory, "log_path": result_logger.get("log_path", state.get("log_path", ""))}
+        return self._run_turn(self.agent_a, state)
 
     def _turn_b_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        result_agent = self.agent_b(state)
-        print("\n" + "=" * 80)
-        print(f"Round {state.get('current_round', '?')} - AgentB ({self.agent_b.persona_name}):")
-        print("-" * 80)
-        print(result_agent.get("current_argument", ""))
-        print("=" * 80 + "\n")
-        state_after_agent = {**state, **result_agent}
-        result_memory = self.memory_node(state_after_agent)
-        state_after_memory = {**state_after_agent, **result_memory}
-        result_logger = self.logger_node(state_after_memory)
-        return {**state_after_memory, "log_path": result_logger.get("log_path", state.get("log_path", ""))}
+        return self._run_turn(self.agent_b, state)
+
+    def _run_turn(self, agent: "AgentNode", state: Dict[str, Any]) -> Dict[str, Any]:
+        with self.tracer.span("agent", agent=agent.agent_id, round=state.get("current_round")):
+            result_agent = agent(state)
+        return self._finish_turn(agent, state, result_agent)
+
+    async def _arun_turn(self, agent: "AgentNode", state: Dict[str, Any]) -> Dict[str, Any]:
+        with self.tracer.span("agent", agent=agent.agent_id, round=state.get("current_round")):
+            result_agent = await agent.acall(state, semaphore=self.generation_semaphore)
+        return self._finish_turn(agent, state, result_agent)
+
+    def _announce_turn(self, round_num, agent: "AgentNode", argument: str):
+        if self.verbose:
+            print("\n" + "=" * 80)
+            print(f"Round {'?' if round_num is None else round_num} - {agent.agent_id} ({agent.persona_name}):")
+            print("-" * 80)
+            print(argument)
+            print("=" * 80 + "\n")
+        if self.on_event is not None:
+            self.on_event({
+                "type": "turn",
+                "round": round_num,
+                "agent": agent.agent_id,
+                "argument": argument,
+            })
+
+    def _announce_verdict(self, result: Dict[str, Any]):
+        if self.verbose:
+            print("\n" + "=" * 80)
+            print("DEBATE COMPLETE - JUDGE'S VERDICT")
+            print("=" * 80)
+            print(result.get("debate_summary", ""))
+            print("\n" + "=" * 80)
+            print(result.get("winner_justification", ""))
+        if self.on_event is not None:
+            self.on_event({
+                "type": "verdict",
+                "winner": result.get("winner"),
+                "confidence": result.get("winner_confidence"),
+            })
+
+    def _finish_turn(self, agent: "AgentNode", state: Dict[str, Any], result_agent: Dict[str, Any]) -> Dict[str, Any]:
+        if self.metrics is not None:
+            self.metrics.turns.inc()
+        with self.tracer.span("memory"):
+            result_memory = self.memory_node(ChainMap(result_agent, state))
+        if self.post_turn is not None:
+            self.post_turn.submit(self._post_turn_work, agent, dict(state), result_agent, result_memory)
+            log_path = self.logger_node.get_log_path()
+        else:
+            log_path = self._post_turn_work(agent, state, result_agent, result_memory)
+        return {
+            **result_agent,
+            **result_memory,
+            "log_path": log_path,
+        }
+
+    def _post_turn_work(
+        self,
+        agent: "AgentNode",
+        state: Dict[str, Any],
+        result_agent: Dict[str, Any],
+        result_memory: Dict[str, Any],
+    ) -> str:
+        self._announce_turn(state.get("current_round"), agent, result_agent.get("current_argument", ""))
+        with self.tracer.span("logger"):
+            if self.long_debate:
+                result_logger = self.logger_node({"node_execution": result_memory["node_execution"]})
+            else:
+                if self.post_turn is not None:
+                    state = ChainMap(self.coordinator_node.analyze(state.get("memory", [])), state)
+                result_logger = self.logger_node(ChainMap(result_memory, result_agent, state))
+        return result_logger.get("log_path", state.get("log_path", ""))
 
     def _judge_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self.post_turn is not None:
+            with self.tracer.span("post_turn_barrier"):
+                self.post_turn.barrier()
+        return self._run_judge(state)
+
+    def _run_judge(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        self._log_generation_fallbacks()
         result = self.judge_node(state)
-        print("\n" + "=" * 80)
-        print("DEBATE COMPLETE - JUDGE'S VERDICT")
-        print("=" * 80)
-        print(result.get("debate_summary", ""))
-        print("\n" + "=" * 80)
-        print(result.get("winner_justification", ""))
+        if self.metrics is not None:
+            self.metrics.warnings.inc(len(state.get("repetition_warnings", [])), type="repetition")
+            self.metrics.warnings.inc(len(state.get("coherence_warnings", [])), type="coherence")
+        self._announce_verdict(result)
         return result
 
+    def _arm_deadlines(self):
+        deadline = None if self.debate_timeout is None else time.monotonic() + self.debate_timeout
+        for agent in (self.agent_a, self.agent_b):
+            agent.deadline = deadline
+
+    def _log_generation_fallbacks(self):
+        agents = (self.agent_a, self.agent_b)
+        fallbacks = {agent.agent_id: agent.fallbacks for agent in agents if agent.fallbacks}
+        if fallbacks:
+            self.logger_node.log_warning(
+                "generation_fallback",
+                f"{sum(fallbacks.values())} generation(s) exceeded their deadline and used the template generator",
+                {"fallbacks": fallbacks, "hedges": {agent.agent_id: agent.hedges for agent in agents}},
+            )
+
     def _logger_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
         return self.logger_node(state)
 
+    async def _auser_input_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return self._user_input_wrapper(state)
+
+    async def _acoordinator_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return self._coordinator_wrapper(state)
+
+    async def _aturn_a_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._arun_turn(self.agent_a, state)
+
+    async def _aturn_b_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._arun_turn(self.agent_b, state)
+
+    async def _ajudge_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self.post_turn is not None:
+            import asyncio
+
+            with self.tracer.span("post_turn_barrier"):
+                await asyncio.get_running_loop().run_in_executor(None, self.post_turn.barrier)
+        return self._run_judge(state)
+
+    async def _alogger_wrapper(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return self._logger_wrapper(state)
+
+    def _span_args(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return {"round": state.get("current_round")}
+
+    def _export_trace(self):
+        self.logger_node.log_timing(self.tracer.get_spans(), self.tracer.summarize())
+        self.tracer.export_chrome_trace(self.trace_path)
+        if self.verbose:
+            print(f"Trace saved to: {self.trace_path}")
+
     def _route_from_coordinator(self, state: Dict[str, Any]) -> str:
         if state.get("debate_complete", False):
             return "judge"
@@ -136,10 +412,59 @@ class DebateOrchestrator:
             return "turn_b"
         return "judge"
 
-    def run(self):
-        initial_state = {
+    def _graph_config(self) -> Dict[str, Any]:
+        return {"recursion_limit": 2 * self.total_rounds + 10}
+
+    def _next_node(self, name: str, state: Dict[str, Any]):
+        if name == "coordinator":
+            return self._route_from_coordinator(state)
+        return self.LOOP_EDGES[name]
+
+    def _apply_update(self, state: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        added = False
+        for key, value in update.items():
+            if key in _STATE_KEYS:
+                added = added or key not in state
+                state[key] = value
+        if added:
+            ordered = [(key, state[key]) for key in _STATE_ORDER if key in state]
+            state.clear()
+            state.update(ordered)
+        return state
+
+    def _check_steps(self, steps: int, limit: int):
+        if steps > limit:
+            raise RecursionError(f"Debate did not reach the judge within {limit} steps")
+
+    def _run_loop(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self._loop_nodes is None:
+            self._loop_nodes = self._wrapped_nodes()
+        limit = self._graph_config()["recursion_limit"]
+        name, steps = "user_input", 0
+        while name is not None:
+            steps += 1
+            self._check_steps(steps, limit)
+            state = self._apply_update(state, self._loop_nodes[name](state))
+            name = self._next_node(name, state)
+        return state
+
+    async def _arun_loop(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self._async_loop_nodes is None:
+            self._async_loop_nodes = self._wrapped_nodes(asynchronous=True)
+        limit = self._graph_config()["recursion_limit"]
+        name, steps = "user_input", 0
+        while name is not None:
+            steps += 1
+            self._check_steps(steps, limit)
+            state = self._apply_update(state, await self._async_loop_nodes[name](state))
+            name = self._next_node(name, state)
+        return state
+
+    def _initial_state(self) -> Dict[str, Any]:
+        return {
             "topic": "",
             "current_round": 0,
+            "turn_index": 0,
             "next_agent": "",
             "current_agent": "",
             "current_argument": "",
@@ -155,21 +480,461 @@ class DebateOrchestrator:
             "log_path": "",
             "node_execution": {},
         }
+
+    def _print_header(self):
+        if not self.verbose:
+            return
         print("\n" + "=" * 80)
         print("MULTI-AGENT DEBATE SYSTEM")
         print("=" * 80)
         print(f"AgentA Persona: {self.agent_a.persona_name}")
         print(f"AgentB Persona: {self.agent_b.persona_name}")
+        print(f"Debate ID: {self.debate_id}")
         if self.seed is not None:
             print(f"Seed: {self.seed}")
         print("=" * 80)
-        final_state = self.graph.invoke(initial_state)
+
+    def _print_footer(self, final_state: Dict[str, Any]):
+        if not self.verbose:
+            return
         print(f"\nDebate log saved to: {final_state.get('log_path', 'N/A')}")
         print("\nDebate completed successfully!\n")
+
+    def _memo_fingerprint(self):
+        if self.result_store is None or self.seed is None:
+            return None
+        if self.tracer.enabled or self.profiler is not None:
+            return None
+        if self.backend is not None and not getattr(self.backend, "deterministic", False):
+            return None
+        if self.topic is None:
+            self.topic = self.user_input_node.topic = self.user_input_node.get_topic_from_cli()
+        topic, _ = self.user_input_node.prepare_topic(self.topic)
+        if topic is None:
+            return None
+        from nodes.result_store import debate_fingerprint
+
+        return debate_fingerprint(
+            topic=topic,
+            personas={"AgentA": self.agent_a.persona_name, "AgentB": self.agent_b.persona_name},
+            persona_texts={"AgentA": self.agent_a.persona, "AgentB": self.agent_b.persona},
+            seed=self.seed,
+            backend=None if self.backend is None else getattr(self.backend, "name", type(self.backend).__name__),
+            options={
+                "total_rounds": self.total_rounds,
+                "long_debate": self.long_debate,
+                "context_tokens": self.agent_a.context_packer.budget,
+                "context_retrieval": self.context_retrieval,
+            },
+        )
+
+    def _replay_memoized(self, fingerprint: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        final_state = record["final_state"]
+        agents = {self.agent_a.agent_id: self.agent_a, self.agent_b.agent_id: self.agent_b}
+        try:
+            for entry in final_state.get("memory", []):
+                agent = agents.get(entry["agent"])
+                if agent is not None:
+                    self._announce_turn(entry["round"], agent, entry["text"])
+            self._announce_verdict(final_state)
+            self.logger_node.log_memory_snapshot(final_state.get("memory", []))
+            self.logger_node.log_final_verdict({
+                "winner": final_state.get("winner"),
+                "confidence": final_state.get("winner_confidence", 0),
+                "justification": final_state.get("winner_justification", ""),
+                "analysis": final_state.get("judge_analysis", {}),
+                "memoized": True,
+                "fingerprint": fingerprint,
+                "source_debate_id": record.get("metadata", {}).get("debate_id"),
+            })
+        finally:
+            self.logger_node.close()
+            if self.metrics is not None:
+                self.metrics.debates.inc(status="memoized")
+        final_state = {**final_state, "log_path": self.logger_node.get_log_path() or ""}
+        if self.verbose:
+            print(f"\nResult reused from {self.result_store.directory} (fingerprint {fingerprint[:12]})")
+        self._print_footer(final_state)
+        return final_state
+
+    def _memoize(self, fingerprint: str, final_state: Dict[str, Any]):
+        if fingerprint is not None:
+            self.result_store.put(fingerprint, dict(final_state), metadata={"debate_id": self.debate_id})
+
+    def _begin_run(self):
+        with self._running_lock:
+            if self._running:
+                raise RuntimeError(
+                    "DebateOrchestrator is already running a debate; use one orchestrator per concurrent debate "
+                    "(see OrchestratorPool)"
+                )
+            self._running = True
+
+    def _end_run(self):
+        with self._running_lock:
+            self._running = False
+
+    def run(self):
+        self._begin_run()
+        try:
+            return self._run_debate()
+        finally:
+            self._end_run()
+
+    async def arun(self, generation_semaphore: "asyncio.Semaphore" = None):
+        self._begin_run()
+        try:
+            return await self._arun_debate(generation_semaphore)
+        finally:
+            self._end_run()
+
+    def _run_debate(self):
+        self._print_header()
+        fingerprint = self._memo_fingerprint()
+        if fingerprint is not None:
+            record = self.result_store.get(fingerprint)
+            if record is not None:
+                return self._replay_memoized(fingerprint, record)
+        if self.profiler is not None:
+            self.profiler.start()
+        self._arm_deadlines()
+        status = "error"
+        try:
+            with self.tracer.span("debate", category="debate"):
+                if self.executor == "loop":
+                    final_state = self._run_loop(self._initial_state())
+                else:
+                    final_state = self.graph.invoke(self._initial_state(), config=self._graph_config())
+            if self.tracer.enabled:
+                self._export_trace()
+            status = "ok"
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
+            if self.post_turn is not None:
+                self.post_turn.join()
+            self.logger_node.close()
+            if self.metrics is not None:
+                self.metrics.debates.inc(status=status)
+        self._memoize(fingerprint, final_state)
+        self._print_footer(final_state)
         return final_state
 
+    async def _arun_debate(self, generation_semaphore: "asyncio.Semaphore" = None):
+        self.generation_semaphore = generation_semaphore
+        self._print_header()
+        fingerprint = self._memo_fingerprint()
+        if fingerprint is not None:
+            record = self.result_store.get(fingerprint)
+            if record is not None:
+                self.generation_semaphore = None
+                return self._replay_memoized(fingerprint, record)
+        if self._async_graph is None and self.executor == "graph":
+            self._async_graph = self._build_graph(asynchronous=True)
+        self._arm_deadlines()
+        status = "error"
+        try:
+            with self.tracer.span("debate", category="debate"):
+                if self.executor == "loop":
+                    final_state = await self._arun_loop(self._initial_state())
+                else:
+                    final_state = await self._async_graph.ainvoke(self._initial_state(), config=self._graph_config())
+            if self.tracer.enabled:
+                self._export_trace()
+            status = "ok"
+        finally:
+            if self.post_turn is not None:
+                self.post_turn.join()
+            self.logger_node.close()
+            self.generation_semaphore = None
+            if self.metrics is not None:
+                self.metrics.debates.inc(status=status)
+        self._memoize(fingerprint, final_state)
+        self._print_footer(final_state)
+        return final_state
+
+    def close(self):
+        if self.post_turn is not None:
+            self.post_turn.close()
+
+
+class OrchestratorPool:
+    def __init__(self, max_idle_per_key: int = 8):
+        self.max_idle_per_key = max_idle_per_key
+        self.created = 0
+        self._idle: Dict[Any, list] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key, factory) -> DebateOrchestrator:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+            self.created += 1
+        return factory()
+
+    def release(self, key, orchestrator: DebateOrchestrator):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(orchestrator)
+                return
+        orchestrator.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for orchestrators in idle.values():
+            for orchestrator in orchestrators:
+                orchestrator.close()
+
+
+async def run_debates_concurrently(orchestrators: list, max_in_flight: int = None) -> list:
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+    return await asyncio.gather(
+        *(orchestrator.arun(generation_semaphore=semaphore) for orchestrator in orchestrators),
+        return_exceptions=True,
+    )
+
+
+def parse_sample_rates(specs: list) -> dict:
+    rates = {}
+    for spec in specs or []:
+        entry_type, sep, rate = spec.partition("=")
+        if not sep or not rate.strip().isdigit() or int(rate) < 1:
+            raise argparse.ArgumentTypeError(f"Invalid --log-sample '{spec}'. Expected TYPE=N with N >= 1")
+        rates[entry_type.strip()] = int(rate)
+    return rates
+
+
+def memo_options_from_args(args):
+    if args.memo_dir is None:
+        return None
+    return {
+        "directory": args.memo_dir,
+        "max_bytes": int(args.memo_max_mb * 1024 * 1024),
+        "max_age": args.memo_max_age * 3600.0,
+    }
+
+
+def start_metrics_exporters(args):
+    from nodes import DebateMetrics, MetricsServer, MetricsFileWriter
+
+    if args.metrics_port is None and args.metrics_file is None:
+        return None, []
+    metrics = DebateMetrics()
+    exporters = []
+    if args.metrics_port is not None:
+        server = MetricsServer(metrics, host=args.host, port=args.metrics_port).start()
+        print(f"Metrics available at http://{server.host}:{server.port}/metrics")
+        exporters.append(server)
+    if args.metrics_file is not None:
+        exporters.append(MetricsFileWriter(metrics, args.metrics_file, interval=args.metrics_interval).start())
+    return metrics, exporters
+
+
+def stop_metrics_exporters(exporters: list):
+    for exporter in exporters:
+        exporter.stop()
+
+
+def deadline_options_from_args(args):
+    return {
+        "turn_timeout": args.turn_timeout,
+        "debate_timeout": args.debate_timeout,
+        "hedge_quantile": args.hedge_quantile,
+        "generation_pool_size": args.generation_pool_size,
+    }
+
+
+def context_options_from_args(args):
+    return {"context_tokens": args.context_tokens, "context_retrieval": args.context_retrieval}
+
+
+def generation_batching_from_args(args):
+    if args.generation_batch_size is None:
+        return None
+    return {"max_batch_size": args.generation_batch_size, "max_wait": args.generation_batch_wait}
+
+
+def run_batch_from_args(args, persona_config: dict, log_options: dict):
+    import asyncio
+    from batch_runner import iter_topic_lines, run_batch, arun_batch
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_path = args.results_path or f"debate_results_{timestamp}.jsonl"
+    log_path = args.log_path or f"debate_log_{timestamp}.jsonl"
+    batch_options = {
+        "results_path": results_path,
+        "log_path": log_path,
+        "seed": args.seed,
+        "persona_config": persona_config,
+        "log_options": log_options,
+        "backend_latency": args.backend_latency,
+        "memo_options": memo_options_from_args(args),
+        "total_rounds": args.rounds,
+        "executor": args.executor,
+        "pipeline": args.pipeline,
+        "deadline_options": deadline_options_from_args(args),
+        "context_options": context_options_from_args(args),
+    }
+    started = time.perf_counter()
+    if args.use_async:
+        metrics, exporters = start_metrics_exporters(args)
+        try:
+            counts = asyncio.run(arun_batch(
+                iter_topic_lines(args.topics_file),
+                max_pending=args.max_pending or 100,
+                max_in_flight=args.max_in_flight,
+                metrics=metrics,
+                generation_batching=generation_batching_from_args(args),
+                **batch_options,
+            ))
+        finally:
+            stop_metrics_exporters(exporters)
+    else:
+        counts = run_batch(
+            iter_topic_lines(args.topics_file),
+            workers=args.workers,
+            max_pending=args.max_pending,
+            **batch_options,
+        )
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(
+        f"Batch complete: {counts['ok']} ok, {counts['error']} failed, {counts['rejected']} rejected "
+        f"({total} topics in {elapsed:.2f}s)"
+    )
+    print(f"Results saved to: {results_path}")
+    print(f"Debate log saved to: {log_path}")
+    if counts["error"]:
+        sys.exit(1)
+
+
+def tournament_from_args(args, log_options: dict):
+    from batch_runner import iter_topic_lines
+    from nodes.personas import list_personas
+    from tournament_runner import run_tournament
+
+    if args.topics_file is None:
+        print("Error: tournament mode requires --topics-file")
+        sys.exit(1)
+    personas = [p.strip() for p in args.personas.split(",") if p.strip()] if args.personas else list_personas()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_path = args.results_path or f"tournament_results_{timestamp}.jsonl"
+    log_path = args.log_path or f"tournament_log_{timestamp}.jsonl"
+
+    def report(record, leaderboard):
+        leader = leaderboard.rankings()[0]
+        print(
+            f"[{record['status']}] {record['personas'][0]} vs {record['personas'][1]}: "
+            f"{record.get('winner_persona') or record.get('error', 'draw')} "
+            f"(leader: {leader['persona']} {leader['rating']})"
+        )
+
+    started = time.perf_counter()
+    try:
+        summary = run_tournament(
+            iter_topic_lines(args.topics_file),
+            personas=personas,
+            results_path=results_path,
+            log_path=log_path,
+            leaderboard_path=args.leaderboard_path,
+            seed=args.seed,
+            log_options=log_options,
+            workers=args.workers,
+            max_pending=args.max_pending,
+            backend_latency=args.backend_latency,
+            memo_options=memo_options_from_args(args),
+            total_rounds=args.rounds,
+            executor=args.executor,
+            pipeline=args.pipeline,
+            deadline_options=deadline_options_from_args(args),
+            context_options=context_options_from_args(args),
+            on_result=report,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    counts = summary["counts"]
+    print(
+        f"\nTournament complete: {counts['ok']} ok, {counts['error']} failed, {counts['skipped']} already done, "
+        f"{len(summary['rejected'])} topics rejected ({summary['total']} pairings in {elapsed:.2f}s)"
+    )
+    print(f"{'Rank':<6}{'Persona':<20}{'Rating':>8}{'Win rate':>10}{'W-L-D':>12}")
+    for row in summary["rankings"]:
+        record = f"{row['wins']}-{row['losses']}-{row['draws']}"
+        print(f"{row['rank']:<6}{row['persona']:<20}{row['rating']:>8.1f}{row['win_rate']:>10.3f}{record:>12}")
+    print(f"\nResults saved to: {results_path}")
+    print(f"Leaderboard saved to: {summary['leaderboard_path']}")
+    if counts["error"]:
+        sys.exit(1)
+
+
+def replay_from_args(args):
+    from debate_replay import replay_log
+
+    if args.log_path is None:
+        print("Error: replay mode requires --log-path")
+        sys.exit(1)
+    started = time.perf_counter()
+    replays = replay_log(args.log_path, debate_id=args.debate_id, with_warnings=args.replay_warnings)
+    elapsed = time.perf_counter() - started
+    if not replays:
+        print(f"Error: no debate turns found in {args.log_path}")
+        sys.exit(1)
+
+    if len(replays) == 1:
+        replay = replays[0]
+        print(replay["debate_summary"])
+        print("\n" + "=" * 80)
+        print(replay["winner_justification"])
+        if args.replay_warnings:
+            print(f"\nWarnings: {len(replay['repetition_warnings'])} repetition, {len(replay['coherence_warnings'])} coherence")
+    else:
+        for replay in replays:
+            print(
+                f"{replay['debate_id']}: {replay['winner']} ({replay['winner_confidence']:.3f}) "
+                f"after {replay['turn_index']} turns"
+            )
+
+    mismatched = [r["debate_id"] for r in replays if r["matches_recorded"] is False]
+    turns = sum(r["turn_index"] for r in replays)
+    print(f"\nReplayed {len(replays)} debate(s), {turns} turns in {elapsed * 1000:.1f} ms")
+    if mismatched:
+        print(f"Verdict differs from the recorded one for: {', '.join(str(d) for d in mismatched)}")
+
+
+def serve_from_args(args, log_options: dict):
+    from debate_service import DebateService
+
+    log_path = args.log_path or f"debate_service_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    service = DebateService(
+        host=args.host,
+        port=args.port,
+        workers=args.workers or 4,
+        queue_size=args.queue_size,
+        log_path=log_path,
+        log_options=log_options,
+        backend_latency=args.backend_latency,
+        orchestrator_cls=DebateOrchestrator,
+        generation_batching=generation_batching_from_args(args),
+        total_rounds=args.rounds,
+        executor=args.executor,
+        pipeline=args.pipeline,
+        deadline_options=deadline_options_from_args(args),
+        context_options=context_options_from_args(args),
+    )
+    service.serve_forever()
+
 
 def main():
+    from nodes.logger_node import LoggerNode
+
     parser = argparse.ArgumentParser(
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=(
@@ -178,9 +943,109 @@ def main():
             "  python run_debate.py --seed 42\n"
             "  python run_debate.py --log-path logs/debate.jsonl\n"
             "  python run_debate.py --seed 123 --persona-config scientist,philosopher\n"
+            "  python run_debate.py --seed 42 --trace debate_trace.json\n"
+            "  python run_debate.py --seed 42 --profile cpu --profile-output profiles/debate\n"
+            "  python run_debate.py --topics-file topics.txt --async --metrics-port 9100\n"
+            "  python run_debate.py --seed 42 --memo-dir .debate_memo\n"
+            "  python run_debate.py serve --port 8000 --workers 4\n"
+            "  python run_debate.py tournament --topics-file topics.txt --results-path tournament.jsonl\n"
+            "  python run_debate.py replay --log-path logs/debate.jsonl\n"
+        ),
+    )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["debate", "serve", "tournament", "replay"],
+        default="debate",
+        help=(
+            "debate (default) runs one debate; serve starts the local HTTP debate service; "
+            "tournament plays every persona pairing on every topic; "
+            "replay re-judges debates recorded in --log-path"
         ),
     )
     parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic behavior")
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=None,
+        help=(
+            "Number of turns per debate (default: 8); above "
+            f"{DebateOrchestrator.LONG_DEBATE_ROUNDS} the debate runs in long-debate mode"
+        ),
+    )
+    parser.add_argument(
+        "--executor",
+        choices=DebateOrchestrator.EXECUTORS,
+        default="graph",
+        help=(
+            "graph (default) runs the compiled LangGraph graph; loop drives the same nodes in a plain "
+            "Python loop with identical output and no LangGraph per-step overhead"
+        ),
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Log, check warnings and print each turn on a background worker while the next turn generates",
+    )
+    parser.add_argument(
+        "--turn-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Latency budget for each agent turn; slower model calls are cancelled and the template generator is used",
+    )
+    parser.add_argument(
+        "--debate-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Latency budget for all model calls in a debate; once spent, remaining turns use the template generator",
+    )
+    parser.add_argument(
+        "--hedge-quantile",
+        type=float,
+        default=None,
+        metavar="Q",
+        help="Send a hedged second model request once a call runs past this latency quantile (e.g. 0.95)",
+    )
+    parser.add_argument(
+        "--generation-pool-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Threads that run budgeted sync model calls; hedging pauses while all are busy (default: 32)",
+    )
+    parser.add_argument(
+        "--context-tokens",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Token budget for the opponent history sent with each model request (default: 256)",
+    )
+    parser.add_argument(
+        "--context-retrieval",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Also pack up to K older opponent arguments most relevant to the latest one (default: 0)",
+    )
+    parser.add_argument(
+        "--generation-batch-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Coalesce model requests from concurrent debates into batches of up to N "
+            "(--async batch mode and serve mode; requires --backend-latency)"
+        ),
+    )
+    parser.add_argument(
+        "--generation-batch-wait",
+        type=float,
+        default=0.005,
+        metavar="SECONDS",
+        help="Longest a model request waits for its batch to fill before it is sent (default: 0.005)",
+    )
     parser.add_argument(
         "--log-path",
         type=str,
@@ -193,15 +1058,282 @@ def main():
         default="scientist,philosopher",
         help="Comma-separated personas for AgentA,AgentB (default: scientist,philosopher)",
     )
+    parser.add_argument(
+        "--log-max-bytes",
+        type=int,
+        default=None,
+        help="Rotate the log once the active segment reaches this many bytes",
+    )
+    parser.add_argument(
+        "--log-max-entries",
+        type=int,
+        default=None,
+        help="Rotate the log once the active segment holds this many entries",
+    )
+    parser.add_argument(
+        "--log-rotate-interval",
+        type=float,
+        default=None,
+        help="Rotate the log after this many seconds of wall-clock time",
+    )
+    parser.add_argument(
+        "--log-compress",
+        action="store_true",
+        help="Gzip rotated log segments in a background thread",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=list(LoggerNode.LEVELS),
+        default="debug",
+        help="Log verbosity: verdict, turns, full or debug (default: debug, log everything)",
+    )
+    parser.add_argument(
+        "--log-sample",
+        action="append",
+        default=[],
+        metavar="TYPE=N",
+        help="Keep one in N entries of TYPE, e.g. memory_snapshot=4 (repeatable)",
+    )
+    parser.add_argument(
+        "--log-warnings-once",
+        action="store_true",
+        help="Log each distinct warning only once per debate",
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Record per-node timing spans and write a Chrome trace_event JSON file to PATH",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cpu",
+        choices=["cpu", "mem"],
+        default=None,
+        help="Profile the debate with cProfile (cpu, default) or tracemalloc (mem), attributed per graph node",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=None,
+        metavar="PREFIX",
+        help="Prefix for profile files: PREFIX.pstats or PREFIX.tracemalloc, plus PREFIX.txt (default: debate_profile_<timestamp>)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of functions or allocation sites in the profile report (default: 20)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Expose Prometheus metrics on http://HOST:PORT/metrics while debates run",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Periodically write Prometheus text-format metrics to PATH (node_exporter textfile collector)",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        metavar="SECONDS",
+        help="How often --metrics-file is rewritten (default: 15)",
+    )
+    parser.add_argument(
+        "--memo-dir",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Reuse final states of seeded debates stored in PATH, keyed by topic, personas, seed and code version",
+    )
+    parser.add_argument(
+        "--memo-max-mb",
+        type=float,
+        default=256.0,
+        help="Evict the oldest memoized results once --memo-dir exceeds this size (default: 256)",
+    )
+    parser.add_argument(
+        "--memo-max-age",
+        type=float,
+        default=168.0,
+        metavar="HOURS",
+        help="Drop memoized results not used for this many hours (default: 168)",
+    )
+    parser.add_argument(
+        "--debate-id",
+        type=str,
+        default=None,
+        help="Identifier tagged on every log record (default: random); in replay mode, the debate to replay",
+    )
+    parser.add_argument(
+        "--log-sink",
+        action="store_true",
+        help="Send log records to a single writer process instead of appending from this process",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Run one headless debate per line of PATH ('-' reads stdin) instead of prompting",
+    )
+    parser.add_argument(
+        "--results-path",
+        type=str,
+        default=None,
+        help="Where batch mode appends one JSON result per topic (default: debate_results_<timestamp>.jsonl)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch and tournament mode (default: CPU count) or worker threads for serve mode (default: 4)",
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Serve mode bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Serve mode port (default: 8000)")
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=64,
+        help="Serve mode job queue capacity; further jobs get HTTP 429 (default: 64)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run batch debates concurrently in one event loop instead of a process pool",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Cap on concurrent generation requests across async batch debates",
+    )
+    parser.add_argument(
+        "--backend-latency",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Use the simulated model backend with this per-generation latency",
+    )
+    parser.add_argument(
+        "--personas",
+        type=str,
+        default=None,
+        help="Comma-separated personas for tournament mode (default: every file in persona_templates/)",
+    )
+    parser.add_argument(
+        "--leaderboard-path",
+        type=str,
+        default=None,
+        help="Where tournament mode rewrites the leaderboard JSON (default: <results-path>_leaderboard.json)",
+    )
+    parser.add_argument(
+        "--replay-warnings",
+        action="store_true",
+        help="Recompute coordinator repetition and coherence warnings during replay",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="Maximum debates queued or running at once in batch and tournament mode (default: 2 x workers)",
+    )
     args = parser.parse_args()
+    if args.rounds is not None and args.rounds < 1:
+        print("Error: --rounds must be at least 1")
+        sys.exit(1)
+    if args.hedge_quantile is not None and not 0 < args.hedge_quantile < 1:
+        print("Error: --hedge-quantile must be between 0 and 1")
+        sys.exit(1)
+    if args.generation_pool_size is not None and args.generation_pool_size < 1:
+        print("Error: --generation-pool-size must be at least 1")
+        sys.exit(1)
+    if args.context_tokens is not None and args.context_tokens < 1:
+        print("Error: --context-tokens must be at least 1")
+        sys.exit(1)
+    if args.context_retrieval < 0:
+        print("Error: --context-retrieval must not be negative")
+        sys.exit(1)
+    if args.generation_batch_size is not None and args.generation_batch_size < 1:
+        print("Error: --generation-batch-size must be at least 1")
+        sys.exit(1)
     personas = args.persona_config.split(",")
     if len(personas) != 2:
         print("Error: --persona-config must specify exactly 2 personas separated by comma")
         sys.exit(1)
     persona_config = {"AgentA": personas[0].strip(), "AgentB": personas[1].strip()}
-    orchestrator = DebateOrchestrator(seed=args.seed, log_path=args.log_path, persona_config=persona_config)
+    try:
+        sample_rates = parse_sample_rates(args.log_sample)
+    except argparse.ArgumentTypeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    log_options = {
+        "max_bytes": args.log_max_bytes,
+        "max_entries": args.log_max_entries,
+        "rotate_interval": args.log_rotate_interval,
+        "compress": args.log_compress,
+        "verbosity": args.log_level,
+        "sample_rates": sample_rates,
+        "warnings_once": args.log_warnings_once,
+    }
+    if args.mode == "serve":
+        serve_from_args(args, log_options)
+        return
+    if args.mode == "replay":
+        replay_from_args(args)
+        return
+    if args.mode == "tournament":
+        tournament_from_args(args, log_options)
+        return
+    if args.topics_file is not None:
+        run_batch_from_args(args, persona_config, log_options)
+        return
+    from nodes import LogSink, SimulatedBackend, NodeProfiler, DebateResultStore
+    from nodes.logger_node import rotation_options
+
+    log_path = args.log_path
+    log_sink = None
+    if args.log_sink:
+        if log_path is None:
+            log_path = f"debate_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        log_sink = LogSink(log_path, **rotation_options(log_options)).start()
+    profiler = NodeProfiler(mode=args.profile, top_n=args.profile_top) if args.profile else None
+    metrics, exporters = start_metrics_exporters(args)
+    memo_options = memo_options_from_args(args)
+    orchestrator = DebateOrchestrator(
+        seed=args.seed,
+        backend=SimulatedBackend(latency=args.backend_latency) if args.backend_latency is not None else None,
+        log_path=log_path,
+        persona_config=persona_config,
+        log_options=log_options,
+        trace_path=args.trace,
+        debate_id=args.debate_id,
+        log_sink=log_sink.writer() if log_sink else None,
+        profiler=profiler,
+        metrics=metrics,
+        result_store=DebateResultStore(**memo_options) if memo_options else None,
+        total_rounds=args.rounds,
+        executor=args.executor,
+        pipeline=args.pipeline,
+        **deadline_options_from_args(args),
+        **context_options_from_args(args),
+    )
     try:
         orchestrator.run()
+        if profiler is not None:
+            prefix = args.profile_output or f"debate_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            for path in profiler.write(prefix):
+                print(f"Profile saved to: {path}")
     except KeyboardInterrupt:
         print("\n\nDebate interrupted by user.")
         sys.exit(0)
@@ -210,6 +1342,11 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        orchestrator.close()
+        stop_metrics_exporters(exporters)
+        if log_sink is not None:
+            log_sink.stop()
 
 
 if __name__ == "__main__":
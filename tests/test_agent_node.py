@@ -1,5 +1,7 @@
 import unittest
+import asyncio
 from nodes.agent_node import AgentNode
+from nodes.backends import SimulatedBackend
 
 
 class TestAgentNode(unittest.TestCase):
@@ -79,6 +81,69 @@ class TestAgentNode(unittest.TestCase):
         self.assertIn("current_agent", result)
         self.assertIn("current_argument", result)
         self.assertEqual(result["current_agent"], "AgentA")
+    
+    
+    def test_backend_generation_matches_template(self):
+        agent = AgentNode(agent_id="AgentA", persona_name="scientist", seed=42, backend=SimulatedBackend())
+        
+        self.assertEqual(
+            agent.generate_argument("Climate Change", [], 1),
+            self.agent_a.generate_argument("Climate Change", [], 1)
+        )
+        self.assertEqual(agent.backend.calls, 1)
+    
+    def test_async_call_with_semaphore(self):
+        agent = AgentNode(agent_id="AgentA", persona_name="scientist", seed=42, backend=SimulatedBackend())
+        state = {"topic": "Test Topic", "memory": [], "current_round": 1}
+        
+        async def run():
+            return await agent.acall(state, semaphore=asyncio.Semaphore(1))
+        
+        result = asyncio.run(run())
+        self.assertEqual(result["current_agent"], "AgentA")
+        self.assertEqual(result["current_argument"], self.agent_a(state)["current_argument"])
+    
+    
+    def test_call_deduplicates_against_state_memory(self):
+        first = self.agent_a({"topic": "Test Topic", "memory": [], "current_round": 1})["current_argument"]
+        state = {
+            "topic": "Test Topic",
+            "memory": [{"round": 1, "agent": "AgentA", "text": first}],
+            "current_round": 1,
+        }
+        
+        second = self.agent_a(state)["current_argument"]
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.agent_a.previous_arguments, [])
+    
+    
+    def test_history_window_limits_duplicate_checks(self):
+        agent = AgentNode(agent_id="AgentA", persona_name="scientist", seed=42, history_window=1)
+        previous = ["Empirical evidence settles this question", "A completely different remark"]
+        
+        self.assertTrue(self.agent_a._is_duplicate_argument(previous[0], previous_arguments=previous))
+        self.assertFalse(agent._is_duplicate_argument(previous[0], previous_arguments=previous))
+    
+    
+    def test_requests_carry_packed_context_and_stable_prefix(self):
+        requests = []
+        
+        class RecordingBackend(SimulatedBackend):
+            def generate(self, request):
+                requests.append(request)
+                return super().generate(request)
+        
+        agent = AgentNode(agent_id="AgentA", persona_name="scientist", seed=42, backend=RecordingBackend(), context_tokens=40)
+        memory = [{"round": r, "agent": "AgentB", "text": f"Opposing argument number {r} about ethics"} for r in range(2, 12, 2)]
+        for round_num in (3, 5):
+            agent.generate_argument("Test Topic", memory[:round_num], round_num)
+        
+        self.assertEqual(requests[0]["prefix"], requests[1]["prefix"])
+        self.assertTrue(requests[0]["prefix"].startswith(agent.persona))
+        self.assertNotIn("Round", requests[0]["prefix"])
+        self.assertTrue(requests[1]["context"].endswith(memory[4]["text"]))
+        self.assertNotIn(memory[0]["text"], requests[1]["context"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,126 @@
+import unittest
+import asyncio
+import os
+import json
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from batch_runner import run_batch, arun_batch
+from nodes.logger_node import iter_log_entries, list_log_segments
+
+
+class TestBatchRunner(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.results_path = os.path.join(self.work_dir, "results.jsonl")
+        self.log_path = os.path.join(self.work_dir, "batch.jsonl")
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def test_batch_writes_one_result_per_topic(self):
+        topics = [
+            "The role of artificial intelligence in society\n",
+            "Climate change and technology policy\n",
+            "bad\n",
+            "Open science and public research funding\n",
+        ]
+        
+        counts = run_batch(
+            topics,
+            results_path=self.results_path,
+            log_path=self.log_path,
+            seed=42,
+            workers=2,
+            max_pending=2,
+        )
+        
+        self.assertEqual(counts, {"ok": 3, "error": 0, "rejected": 1})
+        
+        with open(self.results_path, 'r') as f:
+            records = sorted((json.loads(line) for line in f), key=lambda r: r["index"])
+        
+        self.assertEqual([r["index"] for r in records], [0, 1, 2, 3])
+        self.assertEqual(records[2]["status"], "rejected")
+        for record in (records[0], records[1], records[3]):
+            self.assertEqual(record["status"], "ok")
+            self.assertIn(record["winner"], ["AgentA", "AgentB"])
+            verdicts = [
+                e for e in iter_log_entries(self.log_path, debate_id=record["debate_id"])
+                if e["type"] == "final_verdict"
+            ]
+            self.assertEqual(len(verdicts), 1)
+    
+    def test_seeded_batch_is_reproducible(self):
+        topics = ["The role of artificial intelligence in society\n"] * 2
+        
+        run_batch(topics, results_path=self.results_path, log_path=self.log_path, seed=7, workers=2)
+        
+        with open(self.results_path, 'r') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0]["final_scores"], records[1]["final_scores"])
+    
+    
+    def test_async_batch(self):
+        topics = [f"Async batch debate topic number {i}\n" for i in range(5)] + ["bad\n"]
+        
+        counts = asyncio.run(arun_batch(
+            topics,
+            results_path=self.results_path,
+            log_path=self.log_path,
+            seed=42,
+            max_pending=3,
+            max_in_flight=2,
+            backend_latency=0.001,
+        ))
+        
+        self.assertEqual(counts, {"ok": 5, "error": 0, "rejected": 1})
+        verdicts = [e for e in iter_log_entries(self.log_path) if e["type"] == "final_verdict"]
+        self.assertEqual(len({e["debate_id"] for e in verdicts}), 5)
+    
+    def test_batches_apply_log_rotation(self):
+        topics = [f"Rotated batch debate topic number {i}\n" for i in range(3)]
+        log_options = {"max_entries": 20, "verbosity": "turns"}
+        
+        for name, run in (
+            ("process", lambda log_path: run_batch(
+                topics, results_path=self.results_path, log_path=log_path, seed=42, workers=2,
+                log_options=log_options,
+            )),
+            ("async", lambda log_path: asyncio.run(arun_batch(
+                topics, results_path=self.results_path, log_path=log_path, seed=42, log_options=log_options,
+            ))),
+        ):
+            with self.subTest(mode=name):
+                log_path = os.path.join(self.work_dir, f"{name}.jsonl")
+                run(log_path)
+                
+                segments = list_log_segments(log_path)
+                self.assertGreater(len(segments), 1)
+                verdicts = [e for e in iter_log_entries(log_path) if e["type"] == "final_verdict"]
+                self.assertEqual(len(verdicts), 3)
+    
+    def test_async_batch_with_generation_batching(self):
+        topics = [f"Batched generation debate topic {i}\n" for i in range(4)]
+        
+        counts = asyncio.run(arun_batch(
+            topics,
+            results_path=self.results_path,
+            log_path=self.log_path,
+            seed=42,
+            backend_latency=0.001,
+            generation_batching={"max_batch_size": 4, "max_wait": 0.002},
+        ))
+        
+        self.assertEqual(counts, {"ok": 4, "error": 0, "rejected": 0})
+        with open(self.results_path, 'r') as f:
+            records = [json.loads(line) for line in f]
+        self.assertTrue(all(record["status"] == "ok" for record in records))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import unittest
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.backends import SimulatedBackend
+from nodes.batching import BatchingBackend
+
+
+class RecordingBackend(SimulatedBackend):
+    
+    def __init__(self, fail: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.batch_sizes = []
+    
+    def _batch_delay(self, size: int) -> float:
+        if self.fail:
+            raise RuntimeError("server unavailable")
+        self.batch_sizes.append(size)
+        return super()._batch_delay(size)
+
+
+class PlainBackend:
+    
+    def __init__(self):
+        self.name = "PlainBackend"
+        self.calls = 0
+    
+    def generate(self, request):
+        self.calls += 1
+        return request["reference"]
+    
+    async def agenerate(self, request):
+        self.calls += 1
+        return request["reference"]
+
+
+class ShortBackend(SimulatedBackend):
+    
+    def generate_batch(self, requests):
+        return super().generate_batch(requests)[:-1]
+    
+    async def agenerate_batch(self, requests):
+        return (await super().agenerate_batch(requests))[:-1]
+
+
+def _requests(count: int):
+    return [{"agent_id": f"Agent{i % 2}", "round": i, "reference": f"reply-{i}"} for i in range(count)]
+
+
+class TestAsyncBatching(unittest.TestCase):
+    
+    def test_coalesces_concurrent_requests_up_to_max_batch_size(self):
+        inner = RecordingBackend(latency=0.01)
+        backend = BatchingBackend(inner, max_batch_size=8, max_wait=0.05)
+        
+        async def run():
+            return await asyncio.gather(*(backend.agenerate(request) for request in _requests(20)))
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(results, [f"reply-{i}" for i in range(20)])
+        self.assertEqual(inner.batch_sizes, [8, 8, 4])
+        self.assertEqual(backend.batches, 3)
+        self.assertEqual(backend.requests, 20)
+        self.assertEqual(inner.calls, 20)
+    
+    def test_partial_batch_is_sent_after_max_wait(self):
+        inner = RecordingBackend()
+        backend = BatchingBackend(inner, max_batch_size=8, max_wait=0.01)
+        
+        async def run():
+            first = await backend.agenerate(_requests(1)[0])
+            rest = await asyncio.gather(*(backend.agenerate(request) for request in _requests(3)))
+            return [first] + rest
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(results, ["reply-0", "reply-0", "reply-1", "reply-2"])
+        self.assertEqual(inner.batch_sizes, [1, 3])
+    
+    def test_errors_reach_every_request_in_the_batch(self):
+        backend = BatchingBackend(RecordingBackend(fail=True), max_batch_size=4, max_wait=0.01)
+        
+        async def run():
+            return await asyncio.gather(*(backend.agenerate(request) for request in _requests(3)), return_exceptions=True)
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+    
+    def test_short_batch_result_fails_every_request(self):
+        backend = BatchingBackend(ShortBackend(), max_batch_size=4, max_wait=0.01)
+        
+        async def run():
+            requests = (backend.agenerate(request) for request in _requests(3))
+            return await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), 1.0)
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+    
+    def test_cancelled_request_is_dropped_from_its_batch(self):
+        inner = RecordingBackend()
+        backend = BatchingBackend(inner, max_batch_size=8, max_wait=0.02)
+        
+        async def run():
+            tasks = [asyncio.ensure_future(backend.agenerate(request)) for request in _requests(3)]
+            await asyncio.sleep(0)
+            tasks[1].cancel()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(results[0], "reply-0")
+        self.assertIsInstance(results[1], asyncio.CancelledError)
+        self.assertEqual(results[2], "reply-2")
+        self.assertEqual(inner.batch_sizes, [2])
+    
+    def test_backend_without_batch_methods_is_called_per_request(self):
+        inner = PlainBackend()
+        backend = BatchingBackend(inner, max_batch_size=4, max_wait=0.01)
+        
+        async def run():
+            return await asyncio.gather(*(backend.agenerate(request) for request in _requests(4)))
+        
+        self.assertEqual(asyncio.run(run()), [f"reply-{i}" for i in range(4)])
+        self.assertEqual(backend.batches, 1)
+        self.assertEqual(inner.calls, 4)
+        self.assertEqual(backend.name, "PlainBackend")
+
+
+class TestThreadedBatching(unittest.TestCase):
+    
+    def test_routes_results_back_to_each_thread(self):
+        inner = RecordingBackend(latency=0.01)
+        backend = BatchingBackend(inner, max_batch_size=4, max_wait=0.05)
+        results = {}
+        
+        def worker(request):
+            results[request["round"]] = backend.generate(request)
+        
+        threads = [threading.Thread(target=worker, args=(request,)) for request in _requests(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        backend.close()
+        
+        self.assertEqual(results, {i: f"reply-{i}" for i in range(8)})
+        self.assertEqual(sum(inner.batch_sizes), 8)
+        self.assertLess(backend.batches, 8)
+        self.assertLessEqual(max(inner.batch_sizes), 4)
+    
+    def test_errors_are_raised_in_the_caller(self):
+        backend = BatchingBackend(RecordingBackend(fail=True), max_batch_size=2, max_wait=0.001)
+        
+        with self.assertRaises(RuntimeError):
+            backend.generate(_requests(1)[0])
+        backend.close()
+    
+    def test_short_batch_result_fails_every_caller(self):
+        backend = BatchingBackend(ShortBackend(), max_batch_size=2, max_wait=0.05)
+        errors = []
+        
+        def worker(request):
+            try:
+                backend.generate(request)
+            except RuntimeError as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(request,)) for request in _requests(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1.0)
+        backend.close()
+        
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(len(errors), 2)
+    
+    def test_closed_backend_rejects_requests(self):
+        backend = BatchingBackend(RecordingBackend(), max_batch_size=2, max_wait=0.001)
+        self.assertEqual(backend.generate(_requests(1)[0]), "reply-0")
+        backend.close()
+        
+        with self.assertRaises(RuntimeError):
+            backend.generate(_requests(1)[0])
+    
+    def test_rejects_empty_batches(self):
+        with self.assertRaises(ValueError):
+            BatchingBackend(RecordingBackend(), max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.context_packer import NO_CONTEXT, ContextPacker, count_tokens
+
+
+def _entries(texts, agent="AgentB"):
+    return [{"round": 2 * i + 2, "agent": agent, "text": text} for i, text in enumerate(texts)]
+
+
+class CountingTokenizer:
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self, text):
+        self.calls += 1
+        return count_tokens(text)
+
+
+class TestContextPacker(unittest.TestCase):
+    
+    def test_empty_memory(self):
+        self.assertEqual(ContextPacker().pack([]), NO_CONTEXT)
+    
+    def test_packs_newest_entries_within_budget_in_round_order(self):
+        entries = _entries([f"argument {i} one two three" for i in range(10)])
+        packer = ContextPacker(budget=35)
+        
+        context = packer.pack(entries)
+        lines = context.split("\n")
+        
+        self.assertEqual(lines, [f"Round {e['round']} - AgentB: {e['text']}" for e in entries[-3:]])
+        self.assertLessEqual(sum(count_tokens(line) + 1 for line in lines), 35)
+    
+    def test_token_counts_are_cached_per_entry(self):
+        tokenizer = CountingTokenizer()
+        packer = ContextPacker(budget=1000, tokenizer=tokenizer)
+        entries = _entries([f"argument {i}" for i in range(6)])
+        
+        packer.pack(entries[:3])
+        packer.pack(entries[:5])
+        packer.pack(entries)
+        
+        self.assertEqual(tokenizer.calls, 6)
+        self.assertEqual(packer.counted, 6)
+        packer.reset()
+        packer.pack(entries[:1])
+        self.assertEqual(tokenizer.calls, 7)
+    
+    def test_earlier_context_is_a_prefix_of_later_context(self):
+        packer = ContextPacker(budget=1000)
+        entries = _entries([f"argument {i}" for i in range(4)])
+        
+        self.assertTrue(packer.pack(entries).startswith(packer.pack(entries[:3])))
+    
+    def test_oversized_newest_entry_is_truncated(self):
+        entries = _entries([" ".join(["word"] * 200)])
+        
+        context = ContextPacker(budget=20).pack(entries)
+        
+        self.assertTrue(context.startswith("Round 2 - AgentB: word"))
+        self.assertTrue(context.endswith("..."))
+        self.assertLessEqual(count_tokens(context), 20)
+    
+    def test_retrieval_adds_relevant_older_entries(self):
+        texts = ["nuclear energy safety record", "filler remark alpha", "filler remark beta", "filler remark gamma",
+                 "filler remark delta", "what about nuclear energy waste"]
+        entries = _entries(texts)
+        
+        plain = ContextPacker(budget=40).pack(entries)
+        retrieved = ContextPacker(budget=40, retrieval=1).pack(entries)
+        
+        self.assertNotIn(texts[0], plain)
+        self.assertIn(texts[0], retrieved)
+        self.assertTrue(retrieved.startswith("Round 2 - AgentB: nuclear"))
+        self.assertTrue(retrieved.endswith(texts[-1]))
+    
+    def test_retrieval_reaches_entries_outside_a_windowed_slice(self):
+        texts = ["nuclear energy safety record"] + [f"filler remark {i}" for i in range(10)] + ["nuclear energy waste"]
+        entries = _entries(texts)
+        packer = ContextPacker(budget=40, retrieval=1)
+        
+        packer.pack(entries[:3])
+        context = packer.pack(entries[-4:])
+        
+        self.assertIn(texts[0], context)
+        self.assertNotIn(texts[-4], context)
+        self.assertEqual(len(context.split("\n")), 4)
+    
+    def test_rejects_empty_budget(self):
+        with self.assertRaises(ValueError):
+            ContextPacker(budget=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
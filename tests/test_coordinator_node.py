@@ -101,6 +101,54 @@ class TestCoordinatorNode(unittest.TestCase):
         warnings = self.coordinator.check_logical_coherence(memory)
         
         self.assertIsInstance(warnings, list)
+    
+    
+    def test_call_reads_turn_index_from_state(self):
+        result = self.coordinator({"memory": [], "turn_index": 3})
+        
+        self.assertEqual(result["current_round"], 4)
+        self.assertEqual(result["next_agent"], "AgentB")
+        self.assertEqual(result["turn_index"], 4)
+        self.assertEqual(self.coordinator.current_turn_index, 0)
+        
+        final = self.coordinator({"memory": [], "turn_index": 8})
+        self.assertTrue(final["debate_complete"])
+        self.assertEqual(final["turn_index"], 8)
+    
+    
+    def test_total_rounds_override(self):
+        coordinator = CoordinatorNode(total_rounds=100)
+        
+        self.assertEqual(len(coordinator.turn_order), 100)
+        self.assertEqual(coordinator.turn_order[-1], (100, "AgentB"))
+        self.assertFalse(coordinator.is_debate_complete(99))
+        self.assertTrue(coordinator.is_debate_complete(100))
+        self.assertEqual(self.coordinator.total_rounds, CoordinatorNode.TOTAL_ROUNDS)
+    
+    def test_warning_window_limits_compared_pairs(self):
+        memory = [
+            {"round": 1, "agent": "AgentA", "text": "This is my first argument about science"},
+            {"round": 3, "agent": "AgentA", "text": "An unrelated point on ethics"},
+            {"round": 5, "agent": "AgentA", "text": "This is my first argument about science"},
+        ]
+        
+        self.assertEqual(len(self.coordinator.detect_repeated_arguments(memory)), 1)
+        self.assertEqual(CoordinatorNode(warning_window=1).detect_repeated_arguments(memory), [])
+    
+    def test_deferred_analysis_runs_once_debate_completes(self):
+        coordinator = CoordinatorNode(total_rounds=3, analyze_each_turn=False)
+        memory = [
+            {"round": 1, "agent": "AgentA", "text": "This is my first argument about science"},
+            {"round": 2, "agent": "AgentB", "text": "Philosophy is important"},
+            {"round": 3, "agent": "AgentA", "text": "This is my first argument about science"},
+        ]
+        
+        midway = coordinator({"memory": memory[:2], "turn_index": 2, "repetition_warnings": []})
+        final = coordinator({"memory": memory, "turn_index": 3, "repetition_warnings": []})
+        
+        self.assertEqual(midway["repetition_warnings"], [])
+        self.assertTrue(final["debate_complete"])
+        self.assertEqual(final["repetition_warnings"][0]["agent"], "AgentA")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,207 @@
+import unittest
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.agent_node import AgentNode
+from nodes.backends import SimulatedBackend
+from nodes.deadlines import GenerationPool, LatencyTracker, acall_with_deadline, call_with_deadline, turn_deadline
+
+
+class ScheduledBackend(SimulatedBackend):
+    
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = list(delays)
+    
+    def _delay(self) -> float:
+        return self.delays.pop(0) if self.delays else 0.0
+
+
+class TestLatencyTracker(unittest.TestCase):
+    
+    def test_quantile_needs_min_samples(self):
+        tracker = LatencyTracker(window=10, min_samples=4)
+        for value in (0.3, 0.1, 0.2):
+            tracker.record(value)
+        
+        self.assertIsNone(tracker.quantile(0.95))
+        tracker.record(0.4)
+        self.assertEqual(tracker.quantile(0.5), 0.2)
+        self.assertEqual(tracker.quantile(0.95), 0.4)
+    
+    def test_window_keeps_recent_samples(self):
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for value in (9.0, 1.0, 2.0, 3.0):
+            tracker.record(value)
+        
+        self.assertEqual(len(tracker), 3)
+        self.assertEqual(tracker.quantile(1.0), 3.0)
+    
+    def test_turn_deadline_takes_the_earlier_budget(self):
+        debate_deadline = time.monotonic() + 0.01
+        
+        self.assertIsNone(turn_deadline(None, None))
+        self.assertEqual(turn_deadline(5.0, debate_deadline), debate_deadline)
+        self.assertLess(turn_deadline(0.001, time.monotonic() + 5.0), debate_deadline)
+
+
+class TestCallWithDeadline(unittest.TestCase):
+    
+    def test_returns_result_within_budget(self):
+        tracker = LatencyTracker(min_samples=1)
+        
+        result, hedged = call_with_deadline(lambda: "fast", time.monotonic() + 1.0, tracker=tracker)
+        
+        self.assertEqual(result, "fast")
+        self.assertFalse(hedged)
+        self.assertEqual(len(tracker), 1)
+    
+    def test_times_out_slow_call(self):
+        started = time.monotonic()
+        
+        with self.assertRaises(TimeoutError):
+            call_with_deadline(lambda: time.sleep(0.5), time.monotonic() + 0.05)
+        
+        self.assertLess(time.monotonic() - started, 0.3)
+    
+    def test_expired_budget_sends_nothing(self):
+        calls = []
+        
+        with self.assertRaises(TimeoutError):
+            call_with_deadline(lambda: calls.append(1), time.monotonic() - 1.0)
+        
+        self.assertEqual(calls, [])
+    
+    def test_hedged_request_wins_over_slow_first_request(self):
+        delays = [0.5, 0.0]
+        
+        def call():
+            time.sleep(delays.pop(0))
+            return "done"
+        
+        started = time.monotonic()
+        result, hedged = call_with_deadline(call, hedge_delay=0.02)
+        
+        self.assertEqual(result, "done")
+        self.assertTrue(hedged)
+        self.assertLess(time.monotonic() - started, 0.3)
+    
+    def test_abandoned_calls_are_tracked_until_they_finish(self):
+        pool = GenerationPool(2)
+        release = threading.Event()
+        
+        with self.assertRaises(TimeoutError):
+            call_with_deadline(release.wait, time.monotonic() + 0.02, pool=pool)
+        
+        self.assertEqual((pool.in_flight, pool.abandoned, pool.abandoned_total), (1, 1, 1))
+        release.set()
+        for _ in range(100):
+            if not pool.in_flight:
+                break
+            time.sleep(0.01)
+        self.assertEqual((pool.in_flight, pool.abandoned, pool.abandoned_total), (0, 0, 1))
+        pool.shutdown()
+    
+    def test_saturated_pool_skips_the_hedge(self):
+        pool = GenerationPool(1)
+        calls = []
+        
+        def call():
+            calls.append(1)
+            time.sleep(0.1)
+            return "done"
+        
+        result, hedged = call_with_deadline(call, hedge_delay=0.01, pool=pool)
+        
+        self.assertEqual(result, "done")
+        self.assertFalse(hedged)
+        self.assertEqual(calls, [1])
+        pool.shutdown()
+    
+    def test_async_timeout_cancels_call(self):
+        cancelled = []
+        
+        async def slow():
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        async def scenario():
+            with self.assertRaises(TimeoutError):
+                await acall_with_deadline(slow, time.monotonic() + 0.02)
+            await asyncio.sleep(0)
+        
+        asyncio.run(scenario())
+        self.assertEqual(cancelled, [True])
+    
+    def test_async_hedge_cancels_losing_request(self):
+        delays = [1.0, 0.0]
+        
+        async def call():
+            await asyncio.sleep(delays.pop(0))
+            return "done"
+        
+        result, hedged = asyncio.run(acall_with_deadline(call, time.monotonic() + 0.5, hedge_delay=0.02))
+        
+        self.assertEqual(result, "done")
+        self.assertTrue(hedged)
+
+
+class TestAgentDeadlines(unittest.TestCase):
+    
+    def _agent(self, backend, **kwargs):
+        return AgentNode(agent_id="AgentA", persona_name="scientist", seed=42, backend=backend, **kwargs)
+    
+    def test_slow_generation_falls_back_to_template(self):
+        agent = self._agent(ScheduledBackend([0.5]), turn_timeout=0.05)
+        reference = self._agent(None).generate_argument("Test Topic", [], 1)
+        
+        started = time.monotonic()
+        argument = agent.generate_argument("Test Topic", [], 1)
+        
+        self.assertEqual(argument, reference)
+        self.assertEqual(agent.fallbacks, 1)
+        self.assertLess(time.monotonic() - started, 0.3)
+    
+    def test_async_generation_respects_debate_deadline(self):
+        agent = self._agent(ScheduledBackend([0.5, 0.5]))
+        agent.deadline = time.monotonic() + 0.05
+        
+        result = asyncio.run(agent.acall({"topic": "Test Topic", "memory": [], "current_round": 1}))
+        
+        self.assertTrue(result["current_argument"])
+        self.assertEqual(agent.fallbacks, 1)
+    
+    def test_hedges_after_tracked_quantile(self):
+        tracker = LatencyTracker(min_samples=3)
+        for _ in range(3):
+            tracker.record(0.01)
+        backend = ScheduledBackend([0.5, 0.0])
+        agent = self._agent(backend, hedge_quantile=0.95, latency_tracker=tracker)
+        
+        started = time.monotonic()
+        agent.generate_argument("Test Topic", [], 1)
+        
+        self.assertEqual(agent.hedges, 1)
+        self.assertEqual(agent.fallbacks, 0)
+        self.assertLess(time.monotonic() - started, 0.3)
+    
+    def test_no_budget_calls_backend_inline(self):
+        backend = ScheduledBackend([])
+        agent = self._agent(backend)
+        
+        agent.generate_argument("Test Topic", [], 1)
+        
+        self.assertGreaterEqual(backend.calls, 1)
+        self.assertEqual((agent.fallbacks, agent.hedges), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from debate_replay import load_debates, replay_log
+from run_debate import DebateOrchestrator
+
+
+class TestDebateReplay(unittest.TestCase):
+    
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "debate.jsonl")
+        self.topic = "The role of artificial intelligence in society"
+    
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+    
+    def _run(self, debate_id: str, total_rounds: int = None, **log_options) -> dict:
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic=self.topic,
+            debate_id=debate_id,
+            log_options=log_options,
+            verbose=False,
+            total_rounds=total_rounds,
+        )
+        return orchestrator.run()
+    
+    def test_replay_rebuilds_memory_and_verdict(self):
+        final_state = self._run("first")
+        
+        replays = replay_log(self.log_path)
+        
+        self.assertEqual(len(replays), 1)
+        replay = replays[0]
+        self.assertEqual(replay["topic"], self.topic)
+        self.assertEqual([e["text"] for e in replay["memory"]], [e["text"] for e in final_state["memory"]])
+        self.assertTrue(replay["debate_complete"])
+        self.assertEqual(replay["debate_status"]["completed_turns"], 8)
+        self.assertEqual(replay["winner"], final_state["winner"])
+        self.assertEqual(replay["judge_analysis"]["final_scores"], final_state["judge_analysis"]["final_scores"])
+        self.assertTrue(replay["matches_recorded"])
+    
+    def test_replay_filters_shared_log_by_debate_id(self):
+        self._run("first")
+        self._run("second")
+        
+        self.assertEqual(len(load_debates(self.log_path)), 2)
+        states = load_debates(self.log_path, debate_id="second")
+        self.assertEqual(len(states), 1)
+        self.assertEqual(states[0]["debate_id"], "second")
+        self.assertEqual(len(states[0]["memory"]), 8)
+    
+    def test_replay_sizes_each_debate_from_its_log(self):
+        final_state = self._run("long", total_rounds=40)
+        self._run("short")
+        
+        states = {state["debate_id"]: state for state in load_debates(self.log_path)}
+        
+        self.assertEqual(len(states["long"]["memory"]), 40)
+        self.assertEqual(states["long"]["debate_status"]["total_rounds"], 40)
+        self.assertEqual(states["long"]["debate_status"]["remaining_turns"], 0)
+        self.assertTrue(states["long"]["debate_complete"])
+        self.assertEqual(states["short"]["debate_status"]["total_rounds"], 8)
+        self.assertEqual(replay_log(self.log_path, debate_id="long")[0]["winner"], final_state["winner"])
+    
+    def test_replay_from_turns_level_log(self):
+        final_state = self._run("turns", verbosity="turns")
+        
+        states = load_debates(self.log_path, with_warnings=True)
+        
+        self.assertEqual([e["text"] for e in states[0]["memory"]], [e["text"] for e in final_state["memory"]])
+        self.assertEqual(states[0]["repetition_warnings"], final_state["repetition_warnings"])
+    
+    def test_verdict_only_log_has_nothing_to_replay(self):
+        self._run("verdict", verbosity="verdict")
+        
+        self.assertEqual(load_debates(self.log_path), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
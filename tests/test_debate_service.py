@@ -0,0 +1,153 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from debate_service import DebateService, QueueFullError
+
+
+class TestDebateService(unittest.TestCase):
+    
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "service.jsonl")
+        self.service = None
+    
+    def tearDown(self):
+        if self.service is not None:
+            self.service.stop()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+    
+    def _start(self, run_workers=True, **kwargs):
+        self.service = DebateService(port=0, log_path=self.log_path, **kwargs)
+        return self.service.start(run_workers=run_workers)
+    
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{self.service.port}{path}",
+            data=data,
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode('utf-8')
+    
+    def test_submit_and_poll(self):
+        self._start(workers=2)
+        
+        status, body = self._request("POST", "/debates", {"topic": "Should cities ban cars downtown", "seed": 42})
+        self.assertEqual(status, 202)
+        job_id = json.loads(body)["job_id"]
+        
+        status, body = self._request("GET", f"/debates/{job_id}?wait=10")
+        self.assertEqual(status, 200)
+        job = json.loads(body)
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["turns"], 8)
+        self.assertIn(job["result"]["winner"], ["AgentA", "AgentB"])
+        self.assertEqual(len(job["result"]["transcript"]), 8)
+    
+    def test_generation_batching_across_workers(self):
+        self._start(workers=2, backend_latency=0.001, generation_batching={"max_batch_size": 4, "max_wait": 0.002})
+        
+        job_ids = []
+        for topic in ("Should cities ban cars downtown", "Should homework be abolished in schools"):
+            status, body = self._request("POST", "/debates", {"topic": topic, "seed": 42})
+            self.assertEqual(status, 202)
+            job_ids.append(json.loads(body)["job_id"])
+        
+        for job_id in job_ids:
+            status, body = self._request("GET", f"/debates/{job_id}?wait=10")
+            self.assertEqual(json.loads(body)["status"], "done")
+        self.assertEqual(self.service.backend.requests, 16)
+    
+    def test_debate_options_apply_to_every_job(self):
+        self._start(workers=1, total_rounds=4, executor="loop", pipeline=True)
+        
+        status, body = self._request("POST", "/debates", {"topic": "Should cities ban cars downtown", "seed": 42})
+        job_id = json.loads(body)["job_id"]
+        status, body = self._request("GET", f"/debates/{job_id}?wait=10")
+        
+        job = json.loads(body)
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(len(job["result"]["transcript"]), 4)
+    
+    def test_stream_events(self):
+        self._start(workers=1)
+        
+        _, body = self._request("POST", "/debates", {"topic": "Is space exploration worth the cost"})
+        job_id = json.loads(body)["job_id"]
+        
+        status, body = self._request("GET", f"/debates/{job_id}/events")
+        events = [json.loads(line) for line in body.splitlines()]
+        
+        self.assertEqual(status, 200)
+        self.assertEqual([e["type"] for e in events], ["turn"] * 8 + ["verdict", "done"])
+        self.assertEqual(events[-1]["status"], "done")
+    
+    def test_queue_full_returns_429(self):
+        self._start(queue_size=1, run_workers=False)
+        
+        status, _ = self._request("POST", "/debates", {"topic": "First debate topic in the queue"})
+        self.assertEqual(status, 202)
+        
+        status, body = self._request("POST", "/debates", {"topic": "Second debate topic in the queue"})
+        self.assertEqual(status, 429)
+        self.assertIn("full", json.loads(body)["error"])
+    
+    def test_invalid_requests(self):
+        self._start(run_workers=False)
+        
+        status, _ = self._request("POST", "/debates", {"topic": "short"})
+        self.assertEqual(status, 400)
+        
+        status, _ = self._request("POST", "/debates", {"topic": "A valid debate topic", "personas": ["one"]})
+        self.assertEqual(status, 400)
+        
+        for seed in (True, "7", 1.5):
+            status, _ = self._request("POST", "/debates", {"topic": "A valid debate topic", "seed": seed})
+            self.assertEqual(status, 400)
+        
+        status, _ = self._request("GET", "/debates/missing")
+        self.assertEqual(status, 404)
+    
+    def test_rejects_unknown_and_path_like_personas(self):
+        self._start(run_workers=False)
+        
+        for personas in (["../../etc/passwd", "scientist"], ["scientist", "persona_templates/philosopher"], ["poet", "scientist"]):
+            status, body = self._request("POST", "/debates", {"topic": "A valid debate topic", "personas": personas})
+            self.assertEqual(status, 400)
+            self.assertIn("unknown persona", json.loads(body)["error"])
+        self.assertEqual(self.service.jobs, {})
+    
+    def test_invalid_wait_returns_400(self):
+        self._start(run_workers=False)
+        job = self.service.submit({"topic": "A valid debate topic"})
+        
+        for wait in ("abc", "nan"):
+            status, _ = self._request("GET", f"/debates/{job.job_id}?wait={wait}")
+            self.assertEqual(status, 400)
+        status, body = self._request("GET", f"/debates/{job.job_id}?wait=-5")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["status"], "queued")
+    
+    def test_submit_raises_when_queue_full(self):
+        service = DebateService(queue_size=1, log_path=self.log_path)
+        service.submit({"topic": "First debate topic in the queue"})
+        
+        with self.assertRaises(QueueFullError):
+            service.submit({"topic": "Second debate topic in the queue"})
+        self.assertEqual(len(service.jobs), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from generate_dag import build_orchestrator, build_overview_dag, build_detailed_dag, render_all
+
+FAKE_DOT = """#!/usr/bin/env python3
+import sys
+with open(sys.argv[0] + ".calls", "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+source = sys.stdin.read()
+for arg in sys.argv[1:]:
+    if arg.startswith("-o"):
+        with open(arg[2:], "w") as f:
+            f.write(source)
+"""
+
+
+class TestGenerateDag(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.orchestrator = build_orchestrator()
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.fake_dot = os.path.join(self.work_dir, "dot")
+        with open(self.fake_dot, 'w', encoding='utf-8') as f:
+            f.write(FAKE_DOT)
+        os.chmod(self.fake_dot, os.stat(self.fake_dot).st_mode | stat.S_IEXEC)
+        self.old_path = os.environ.get("PATH", "")
+        os.environ["PATH"] = self.work_dir + os.pathsep + self.old_path
+    
+    def tearDown(self):
+        os.environ["PATH"] = self.old_path
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def test_overview_follows_compiled_graph(self):
+        source = build_overview_dag(self.orchestrator).source
+        
+        self.assertIn("coordinator -> turn_a", source)
+        self.assertIn("judge -> logger_final", source)
+        self.assertNotIn("\tMemory ", source)
+        self.assertNotIn("\tlogger ", source)
+    
+    def test_detailed_view_collapses_long_debates(self):
+        source = build_detailed_dag(self.orchestrator, rounds=10000, max_rounds_shown=6).source
+        
+        self.assertIn("Rounds 4-9997", source)
+        self.assertIn("round10000 -> judge", source)
+        self.assertEqual(source.count("Round "), 6)
+    
+    def test_render_all_skips_unchanged_graphs(self):
+        output = os.path.join(self.work_dir, "out", "dag")
+        jobs = [(build_overview_dag(self.orchestrator), output)]
+        
+        self.assertEqual(render_all(jobs, formats=["png", "svg"]), {output: "rendered"})
+        self.assertTrue(os.path.exists(f"{output}.png") and os.path.exists(f"{output}.svg"))
+        self.assertEqual(render_all(jobs, formats=["png", "svg"]), {output: "unchanged"})
+        self.assertEqual(render_all(jobs, formats=["png", "svg"], force=True), {output: "rendered"})
+        
+        with open(self.fake_dot + ".calls", 'r', encoding='utf-8') as f:
+            calls = f.read().splitlines()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0], f"-Tpng -o{output}.png -Tsvg -o{output}.svg")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import os
+import json
+import multiprocessing
+import shutil
+import tempfile
+from nodes.log_sink import FileLogWriter, LogSink
+from nodes.logger_node import LoggerNode, iter_log_entries, list_log_segments
+
+
+def _log_from_worker(writer, log_path, debate_id, count):
+    logger = LoggerNode(log_path=log_path, sink=writer, debate_id=debate_id)
+    for i in range(count):
+        logger.log("entry", {"i": i, "payload": "x" * 200})
+
+
+class TestLogSink(unittest.TestCase):
+    
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "shared.jsonl")
+    
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+    
+    def test_sink_writes_records_from_single_logger(self):
+        with LogSink(self.log_path) as sink:
+            logger = LoggerNode(log_path=self.log_path, sink=sink.writer(), debate_id="d1")
+            logger.log("entry", {"value": 1})
+            logger.log("entry", {"value": 2})
+        
+        entries = list(iter_log_entries(self.log_path))
+        self.assertEqual([e["data"]["value"] for e in entries], [1, 2])
+        self.assertTrue(all(e["debate_id"] == "d1" for e in entries))
+    
+    def test_concurrent_processes_do_not_tear_lines(self):
+        workers = 4
+        count = 100
+        
+        with LogSink(self.log_path, batch_size=32) as sink:
+            processes = [
+                multiprocessing.Process(
+                    target=_log_from_worker,
+                    args=(sink.writer(), self.log_path, f"debate-{n}", count),
+                )
+                for n in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+        
+        with open(self.log_path, 'r') as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), workers * count)
+        for line in lines:
+            json.loads(line)
+        
+        for n in range(workers):
+            entries = list(iter_log_entries(self.log_path, debate_id=f"debate-{n}"))
+            self.assertEqual([e["data"]["i"] for e in entries], list(range(count)))
+    
+    def test_sink_rotates_and_compresses_segments(self):
+        with LogSink(self.log_path, batch_size=8, max_entries=10, compress=True) as sink:
+            logger = LoggerNode(log_path=self.log_path, sink=sink.writer(), debate_id="d1")
+            for i in range(25):
+                logger.log("entry", {"i": i})
+        
+        segments = list_log_segments(self.log_path)
+        self.assertEqual(len(segments), 3)
+        self.assertTrue(all(segment.endswith(".jsonl.gz") for segment in segments[:-1]))
+        self.assertEqual([e["data"]["i"] for e in iter_log_entries(self.log_path)], list(range(25)))
+    
+    def test_file_writer_rotates_by_entry_count(self):
+        with FileLogWriter(self.log_path, max_entries=4) as writer:
+            logger = LoggerNode(log_path=self.log_path, sink=writer)
+            for i in range(10):
+                logger.log("entry", {"i": i})
+        
+        self.assertEqual(len(list_log_segments(self.log_path)), 3)
+        self.assertEqual([e["data"]["i"] for e in iter_log_entries(self.log_path)], list(range(10)))
+    
+    def test_debate_id_omitted_when_not_set(self):
+        logger = LoggerNode(log_path=self.log_path)
+        logger.log("entry", {})
+        
+        self.assertNotIn("debate_id", logger.log_entries[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 import os
 import json
-from nodes.logger_node import LoggerNode
+import shutil
+import tempfile
+from nodes.logger_node import LoggerNode, list_log_segments, iter_log_entries
 
 
 class TestLoggerNode(unittest.TestCase):
@@ -107,5 +109,186 @@ class TestLoggerNode(unittest.TestCase):
         self.assertEqual(all_logs[1]["data"]["data"], 2)
 
 
+
+class TestLoggerVerbosity(unittest.TestCase):
+    
+    def setUp(self):
+        self.test_log_path = "test_verbosity_log.jsonl"
+        self.state = {
+            "node_execution": {"node": "MemoryNode"},
+            "memory": [{"round": 1, "agent": "AgentA", "text": "Arg"}],
+            "repetition_warnings": [{"message": "repeated"}],
+            "coherence_warnings": [{"message": "drift"}],
+            "winner": "",
+            "winner_justification": "",
+        }
+    
+    def tearDown(self):
+        if os.path.exists(self.test_log_path):
+            os.remove(self.test_log_path)
+    
+    def _types(self, logger):
+        return [entry["type"] for entry in logger.get_all_logs()]
+    
+    def test_full_verbosity_skips_empty_verdict(self):
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="full")
+        logger(self.state)
+        
+        self.assertEqual(
+            self._types(logger),
+            ["node_execution", "memory_snapshot", "warning", "warning"]
+        )
+    
+    def test_verdict_only(self):
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="verdict")
+        logger(self.state)
+        logger({**self.state, "winner": "AgentA", "winner_justification": "Because"})
+        
+        self.assertEqual(self._types(logger), ["final_verdict"])
+    
+    def test_turns_level(self):
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="turns")
+        logger(self.state)
+        
+        self.assertEqual(self._types(logger), ["node_execution"])
+    
+    def test_state_transition_requires_debug(self):
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="full")
+        logger.log_state_transition({"a": 1}, {"a": 2})
+        self.assertEqual(self._types(logger), [])
+        
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="debug")
+        logger.log_state_transition({"a": 1}, {"a": 2})
+        self.assertEqual(self._types(logger), ["state_transition"])
+    
+    def test_disabled_warnings_are_not_serialized(self):
+        logger = LoggerNode(log_path=self.test_log_path, verbosity="turns")
+        
+        class Unserializable:
+            def __getitem__(self, key):
+                raise AssertionError("warning was serialized")
+        
+        logger({"repetition_warnings": [Unserializable()]})
+        self.assertEqual(self._types(logger), [])
+    
+    def test_sample_rate(self):
+        logger = LoggerNode(log_path=self.test_log_path, sample_rates={"memory_snapshot": 3})
+        for _ in range(7):
+            logger.log_memory_snapshot([])
+        
+        self.assertEqual(self._types(logger).count("memory_snapshot"), 3)
+    
+    def test_warnings_once(self):
+        logger = LoggerNode(log_path=self.test_log_path, warnings_once=True)
+        for _ in range(3):
+            logger.log_warning("repetition", "repeated")
+        logger.log_warning("coherence", "drift")
+        
+        self.assertEqual(self._types(logger), ["warning", "warning"])
+    
+    def test_invalid_verbosity(self):
+        with self.assertRaises(ValueError):
+            LoggerNode(log_path=self.test_log_path, verbosity="chatty")
+
+
+class TestLoggerRotation(unittest.TestCase):
+    
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "debate.jsonl")
+    
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+    
+    def test_no_limits_skip_segment_tracking(self):
+        logger = LoggerNode(log_path=self.log_path)
+        for i in range(3):
+            logger.log("entry", {"i": i})
+        
+        self.assertFalse(logger.rotation_enabled)
+        self.assertIsNone(logger.rotator._segment_inode)
+        self.assertEqual(logger.get_segments(), [self.log_path])
+    
+    def test_rotate_by_entry_count(self):
+        logger = LoggerNode(log_path=self.log_path, max_entries=2)
+        for i in range(5):
+            logger.log("entry", {"i": i})
+        
+        segments = list_log_segments(self.log_path)
+        self.assertEqual(len(segments), 3)
+        self.assertEqual(segments[-1], self.log_path)
+        self.assertTrue(segments[0].endswith("debate.00001.jsonl"))
+        
+        entries = list(iter_log_entries(self.log_path))
+        self.assertEqual([e["data"]["i"] for e in entries], [0, 1, 2, 3, 4])
+    
+    def test_rotate_by_size(self):
+        logger = LoggerNode(log_path=self.log_path, max_bytes=100)
+        for i in range(4):
+            logger.log("entry", {"payload": "x" * 80, "i": i})
+        
+        self.assertEqual(len(logger.get_segments()), 4)
+    
+    def test_rotate_by_interval(self):
+        logger = LoggerNode(log_path=self.log_path, rotate_interval=0)
+        logger.log("entry", {"i": 0})
+        logger.log("entry", {"i": 1})
+        
+        self.assertEqual(len(logger.get_segments()), 2)
+    
+    def test_compressed_segments_are_readable(self):
+        logger = LoggerNode(log_path=self.log_path, max_entries=1, compress=True)
+        for i in range(3):
+            logger.log("entry", {"i": i})
+        logger.close()
+        
+        segments = logger.get_segments()
+        self.assertTrue(segments[0].endswith(".jsonl.gz"))
+        self.assertTrue(segments[1].endswith(".jsonl.gz"))
+        
+        entries = list(iter_log_entries(self.log_path))
+        self.assertEqual([e["data"]["i"] for e in entries], [0, 1, 2])
+    
+    def test_segment_numbering_continues_across_loggers(self):
+        first = LoggerNode(log_path=self.log_path, max_entries=1)
+        first.log("entry", {"i": 0})
+        first.log("entry", {"i": 1})
+        
+        second = LoggerNode(log_path=self.log_path, max_entries=1)
+        second.log("entry", {"i": 2})
+        
+        segments = list_log_segments(self.log_path)
+        self.assertTrue(segments[1].endswith("debate.00002.jsonl"))
+        entries = list(iter_log_entries(self.log_path))
+        self.assertEqual([e["data"]["i"] for e in entries], [0, 1, 2])
+    
+    
+    def test_two_writers_share_thresholds_and_never_overwrite_segments(self):
+        first = LoggerNode(log_path=self.log_path, max_entries=2)
+        second = LoggerNode(log_path=self.log_path, max_entries=2)
+        for i in range(10):
+            (first if i % 2 == 0 else second).log("entry", {"i": i})
+        
+        entries = list(iter_log_entries(self.log_path))
+        self.assertEqual(sorted(e["data"]["i"] for e in entries), list(range(10)))
+        for segment in list_log_segments(self.log_path):
+            with open(segment, 'rb') as f:
+                self.assertLessEqual(f.read().count(b"\n"), 2)
+    
+    def test_rotate_skips_claimed_segment_names(self):
+        logger = LoggerNode(log_path=self.log_path, max_entries=1)
+        logger.log("entry", {"i": 0})
+        taken = os.path.join(self.log_dir, "debate.00001.jsonl")
+        stale = LoggerNode(log_path=self.log_path, max_entries=1)
+        with open(taken, 'w', encoding='utf-8') as f:
+            f.write('{"type": "entry", "data": {"i": -1}}\n')
+        
+        stale.log("entry", {"i": 1})
+        
+        with open(taken, 'r', encoding='utf-8') as f:
+            self.assertIn('"i": -1', f.read())
+        self.assertEqual([e["data"]["i"] for e in iter_log_entries(self.log_path)], [-1, 0, 1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.memory_index import InvertedIndex, index_terms
+
+
+class TestInvertedIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.index = InvertedIndex()
+        texts = [
+            ("Nuclear power has the best safety record per terawatt hour", "AgentA"),
+            ("Solar panels keep getting cheaper every year", "AgentB"),
+            ("Wind and solar need storage to be reliable", "AgentA"),
+            ("The ethics of nuclear waste span many generations", "AgentB"),
+            ("Markets alone will not price carbon correctly", "AgentA"),
+            ("Carbon taxes change behaviour faster than mandates", "AgentB"),
+        ]
+        for text, agent in texts:
+            self.index.add(text, agent)
+    
+    def test_terms_are_lowercased_words(self):
+        self.assertEqual(index_terms("Nuclear-power, SAFETY!"), ["nuclear", "power", "safety"])
+    
+    def test_add_assigns_sequential_ids(self):
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.add("Another argument"), 6)
+    
+    def test_search_ranks_by_bm25(self):
+        hits = self.index.search("nuclear safety", k=3)
+        
+        self.assertEqual([doc_id for doc_id, _ in hits], [0, 3])
+        self.assertGreater(hits[0][1], hits[1][1])
+    
+    def test_agent_filter(self):
+        hits = self.index.search("nuclear solar carbon", k=5, agent_filter="AgentB")
+        
+        self.assertEqual(sorted(doc_id for doc_id, _ in hits), [1, 3, 5])
+    
+    def test_k_limits_results(self):
+        self.assertEqual(len(self.index.search("nuclear solar carbon", k=2)), 2)
+        self.assertEqual(self.index.search("nuclear", k=0), [])
+        self.assertEqual(self.index.search("unrelated words"), [])
+    
+    def test_common_terms_are_ignored_when_rarer_terms_match(self):
+        index = InvertedIndex()
+        for i in range(10):
+            index.add(f"the debate continues {i}")
+        index.add("the debate about tariffs")
+        
+        hits = index.search("the debate tariffs", k=3)
+        
+        self.assertEqual([doc_id for doc_id, _ in hits], [10])
+        self.assertEqual(len(index.search("the debate", k=20)), 11)
+    
+    def test_max_postings_keeps_newest_postings(self):
+        index = InvertedIndex(max_postings=3)
+        for i in range(6):
+            index.add(f"tariffs filler{i}")
+        for i in range(6):
+            index.add(f"padding{i}")
+        
+        self.assertEqual(sorted(doc_id for doc_id, _ in index.search("tariffs", k=10)), [3, 4, 5])
+    
+    def test_clear(self):
+        self.index.clear()
+        
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.search("nuclear"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -75,6 +75,70 @@ class TestMemoryNode(unittest.TestCase):
         result = self.memory(state)
         
         self.assertEqual(len(result["memory"]), initial_size + 1)
+    
+    
+    def test_call_appends_to_state_memory(self):
+        previous = [{"round": 1, "agent": "AgentA", "text": "Earlier argument", "meta": {}}]
+        state = {
+            "current_round": 2,
+            "current_agent": "AgentB",
+            "current_argument": "Reply",
+            "memory": previous,
+        }
+        
+        result = self.memory(state)
+        
+        self.assertEqual([e["text"] for e in result["memory"]], ["Earlier argument", "Reply"])
+        self.assertEqual(len(previous), 1)
+        self.assertEqual(self.memory.memory_store, [])
+    
+    
+    def test_search_returns_relevant_entries(self):
+        self.memory.add_entry(1, "AgentA", "Nuclear power has a strong safety record")
+        self.memory.add_entry(2, "AgentB", "Nuclear waste is an ethical burden")
+        self.memory.add_entry(3, "AgentA", "Solar is getting cheaper")
+        self.memory.add_entry(4, "AgentB", "Storage makes renewables reliable")
+        
+        results = self.memory.search("nuclear waste", k=2)
+        
+        self.assertEqual([e["round"] for e in results], [2, 1])
+        self.assertEqual([e["round"] for e in self.memory.search("nuclear", agent_filter="AgentA")], [1])
+    
+    def test_search_indexes_assigned_memory_and_resets(self):
+        self.memory.memory_store = [
+            {"round": 1, "agent": "AgentA", "text": "Carbon taxes work"},
+            {"round": 2, "agent": "AgentB", "text": "Mandates work faster"},
+        ]
+        
+        self.assertEqual(self.memory.search("carbon")[0]["round"], 1)
+        self.memory.reset()
+        self.assertEqual(self.memory.search("carbon"), [])
+        self.memory.add_entry(1, "AgentA", "Carbon again")
+        self.assertEqual(len(self.memory.index), 0)
+        self.assertEqual(self.memory.search("carbon")[0]["text"], "Carbon again")
+        self.assertEqual(len(self.memory.index), 1)
+    
+    
+    def test_search_covers_state_memory(self):
+        state = {"current_round": 1, "current_agent": "AgentA", "current_argument": "Tariffs protect jobs", "memory": []}
+        memory = self.memory(state)["memory"]
+        state = {"current_round": 2, "current_agent": "AgentB", "current_argument": "Tariffs raise prices", "memory": memory}
+        memory = self.memory(state)["memory"]
+        
+        self.assertEqual(len(self.memory.index), 0)
+        self.assertEqual([e["round"] for e in self.memory.search("tariffs jobs")], [1])
+        self.assertEqual([e["round"] for e in self.memory.search("prices")], [2])
+        self.assertEqual(self.memory.memory_store, [])
+    
+    def test_sync_index_follows_windows_and_new_debates(self):
+        memory = [{"round": r, "agent": "AgentA", "text": f"point {r}"} for r in range(1, 7)]
+        self.memory.sync_index(memory[:3])
+        self.memory.sync_index(memory[2:6])
+        self.assertEqual(len(self.memory.index), 6)
+        
+        self.memory.sync_index([{"round": 1, "agent": "AgentB", "text": "fresh debate"}])
+        self.assertEqual(len(self.memory.index), 1)
+        self.assertEqual(self.memory.search("point"), [])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import urllib.request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.metrics import Counter, Histogram, DebateMetrics, MetricsServer, MetricsFileWriter
+from run_debate import DebateOrchestrator
+
+
+class TestMetricTypes(unittest.TestCase):
+    
+    def test_counter_sums_shards_across_threads(self):
+        counter = Counter("test_total", "Test counter.", ("kind",))
+        
+        def work():
+            for _ in range(1000):
+                counter.inc(kind="a")
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(2, kind="b")
+        
+        self.assertEqual(counter.value(kind="a"), 4000)
+        self.assertIn('test_total{kind="b"} 2', counter.render())
+    
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram("test_seconds", "Test histogram.", ("node",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, node="x")
+        
+        lines = histogram.render()
+        self.assertIn('test_seconds_bucket{node="x",le="0.1"} 1', lines)
+        self.assertIn('test_seconds_bucket{node="x",le="1"} 2', lines)
+        self.assertIn('test_seconds_bucket{node="x",le="+Inf"} 3', lines)
+        self.assertIn('test_seconds_count{node="x"} 3', lines)
+
+
+class TestDebateMetrics(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.metrics = DebateMetrics()
+        DebateOrchestrator(
+            seed=42,
+            log_path=os.path.join(self.work_dir, "debate.jsonl"),
+            topic="The role of artificial intelligence in society",
+            verbose=False,
+            metrics=self.metrics,
+        ).run()
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def test_orchestrator_records_debate_metrics(self):
+        self.assertEqual(self.metrics.turns.value(), 8)
+        self.assertEqual(self.metrics.debates.value(status="ok"), 1)
+        self.assertGreater(self.metrics.log_bytes.value(), 0)
+        latency = self.metrics.node_latency.totals()
+        self.assertEqual(latency[("turn_a",)][2], 4)
+        self.assertEqual(latency[("coordinator",)][2], 9)
+        self.assertIn("debate_turns_per_second", self.metrics.render())
+        self.assertIn("debate_generation_abandoned_in_flight 0", self.metrics.render())
+    
+    def test_server_and_file_exporters(self):
+        with MetricsServer(self.metrics, port=0) as server:
+            url = f"http://127.0.0.1:{server.port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode('utf-8')
+        self.assertIn("debate_turns_total 8", body)
+        
+        path = os.path.join(self.work_dir, "metrics", "debate.prom")
+        with MetricsFileWriter(self.metrics, path, interval=60):
+            pass
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertIn('debate_debates_completed_total{status="ok"} 1', f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
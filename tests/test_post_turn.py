@@ -0,0 +1,57 @@
+import unittest
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.post_turn import PostTurnWorker
+
+
+class TestPostTurnWorker(unittest.TestCase):
+    
+    def setUp(self):
+        self.worker = PostTurnWorker()
+    
+    def tearDown(self):
+        self.worker.close()
+    
+    def test_tasks_run_in_submission_order_off_the_calling_thread(self):
+        seen = []
+        
+        for index in range(50):
+            self.worker.submit(lambda i: seen.append((i, threading.get_ident())), index)
+        self.worker.barrier()
+        
+        self.assertEqual([i for i, _ in seen], list(range(50)))
+        self.assertNotIn(threading.get_ident(), {ident for _, ident in seen})
+        self.assertEqual(self.worker.submitted, 50)
+    
+    def test_barrier_waits_for_slow_tasks(self):
+        done = []
+        
+        self.worker.submit(lambda: (time.sleep(0.05), done.append(True)))
+        self.worker.barrier()
+        
+        self.assertEqual(done, [True])
+    
+    def test_barrier_reraises_first_error_and_skips_later_tasks(self):
+        later = []
+        
+        def fail():
+            raise OSError("disk full")
+        
+        self.worker.submit(fail)
+        self.worker.submit(later.append, "skipped")
+        with self.assertRaises(OSError):
+            self.worker.barrier()
+        
+        self.assertEqual(later, [])
+        self.worker.submit(later.append, "after")
+        self.worker.barrier()
+        self.assertEqual(later, ["after"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.profiling import NodeProfiler
+from run_debate import DebateOrchestrator
+
+
+class TestNodeProfiler(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.work_dir, "debate.jsonl")
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def _run(self, mode: str) -> NodeProfiler:
+        profiler = NodeProfiler(mode=mode, top_n=5)
+        DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            verbose=False,
+            profiler=profiler,
+        ).run()
+        return profiler
+    
+    def test_cpu_profile_attributes_calls_to_graph_nodes(self):
+        profiler = self._run("cpu")
+        
+        self.assertEqual(profiler.node_stats["turn_a"]["calls"], 4)
+        self.assertEqual(profiler.node_stats["turn_b"]["calls"], 4)
+        self.assertEqual(profiler.node_stats["coordinator"]["calls"], 9)
+        self.assertEqual(profiler.node_stats["judge"]["calls"], 1)
+        
+        paths = profiler.write(os.path.join(self.work_dir, "profile"))
+        self.assertTrue(paths[0].endswith(".pstats"))
+        functions = pstats.Stats(paths[0]).stats
+        self.assertTrue(any(name == "generate_argument" for _, _, name in functions))
+        with open(paths[1], 'r', encoding='utf-8') as f:
+            self.assertIn("turn_a", f.read())
+    
+    def test_mem_profile_records_peak_per_node(self):
+        profiler = self._run("mem")
+        
+        self.assertGreater(profiler.peak_bytes, 0)
+        self.assertGreater(profiler.node_stats["turn_a"]["peak_bytes"], 0)
+        paths = profiler.write(os.path.join(self.work_dir, "profile"))
+        self.assertTrue(paths[0].endswith(".tracemalloc"))
+    
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            NodeProfiler(mode="gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
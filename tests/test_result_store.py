@@ -0,0 +1,104 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nodes.result_store import DebateResultStore, debate_fingerprint
+from run_debate import DebateOrchestrator
+
+TOPIC = "The role of artificial intelligence in society"
+
+
+class TestDebateResultStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.store_dir = os.path.join(self.work_dir, "memo")
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def test_fingerprint_covers_inputs(self):
+        base = dict(topic=TOPIC, personas={"AgentA": "scientist"}, persona_texts={"AgentA": "text"}, seed=42)
+        fingerprint = debate_fingerprint(**base)
+        
+        self.assertEqual(fingerprint, debate_fingerprint(**base))
+        self.assertNotEqual(fingerprint, debate_fingerprint(**{**base, "seed": 43}))
+        self.assertNotEqual(fingerprint, debate_fingerprint(**{**base, "persona_texts": {"AgentA": "edited"}}))
+    
+    def test_put_get_and_age_eviction(self):
+        store = DebateResultStore(self.store_dir, max_age=60)
+        store.put("abc", {"winner": "AgentA"})
+        
+        self.assertEqual(store.get("abc")["final_state"], {"winner": "AgentA"})
+        self.assertIsNone(store.get("missing"))
+        
+        stale = time.time() - 120
+        os.utime(os.path.join(self.store_dir, "abc.json"), (stale, stale))
+        self.assertIsNone(store.get("abc"))
+        self.assertEqual((store.hits, store.misses), (1, 2))
+    
+    def test_size_eviction_drops_least_recently_used(self):
+        store = DebateResultStore(self.store_dir, max_entries=2)
+        for index, fingerprint in enumerate(["a", "b"]):
+            store.put(fingerprint, {"index": index})
+            stamp = time.time() - 100 + index
+            os.utime(os.path.join(self.store_dir, f"{fingerprint}.json"), (stamp, stamp))
+        store.get("a")
+        store.put("c", {"index": 2})
+        
+        self.assertEqual(sorted(os.listdir(self.store_dir)), ["a.json", "c.json"])
+        self.assertEqual(store.evicted, 1)
+
+
+class TestOrchestratorMemoization(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.work_dir, "debate.jsonl")
+        self.store = DebateResultStore(os.path.join(self.work_dir, "memo"))
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def _run(self, seed=42, on_event=None):
+        return DebateOrchestrator(
+            seed=seed,
+            log_path=self.log_path,
+            topic=TOPIC,
+            verbose=False,
+            on_event=on_event,
+            result_store=self.store,
+        ).run()
+    
+    def test_seeded_rerun_skips_graph(self):
+        first = self._run()
+        events = []
+        second = self._run(on_event=events.append)
+        
+        self.assertEqual(self.store.hits, 1)
+        self.assertEqual(second["memory"], json.loads(json.dumps(first["memory"])))
+        self.assertEqual(second["winner"], first["winner"])
+        self.assertEqual([e["type"] for e in events], ["turn"] * 8 + ["verdict"])
+        
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            verdicts = [json.loads(line)["data"] for line in f if '"final_verdict"' in line]
+        self.assertEqual(len(verdicts), 2)
+        self.assertTrue(verdicts[1]["memoized"])
+        self.assertEqual(verdicts[1]["winner"], verdicts[0]["winner"])
+    
+    def test_unseeded_runs_are_not_memoized(self):
+        self._run(seed=None)
+        self._run(seed=None)
+        
+        self.assertEqual((self.store.hits, self.store.misses), (0, 0))
+        self.assertEqual(os.listdir(self.store.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
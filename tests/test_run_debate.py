@@ -0,0 +1,322 @@
+import unittest
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from run_debate import DebateOrchestrator, OrchestratorPool, run_debates_concurrently
+from nodes.backends import SimulatedBackend
+
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T[\d:.]+")
+
+
+class TestDebateOrchestrator(unittest.TestCase):
+    
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "debate.jsonl")
+        self.orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+    
+    def test_turn_wrapper_returns_only_updated_channels(self):
+        state = {
+            "topic": "The role of artificial intelligence in society",
+            "current_round": 1,
+            "memory": [],
+            "repetition_warnings": [],
+            "coherence_warnings": [],
+            "debate_status": {},
+            "winner": "",
+        }
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            update = self.orchestrator._turn_a_wrapper(state)
+        
+        self.assertEqual(
+            set(update),
+            {"current_agent", "current_argument", "memory", "node_execution", "log_path"}
+        )
+        self.assertEqual(update["current_agent"], "AgentA")
+        self.assertEqual(len(update["memory"]), 1)
+        self.assertEqual(update["node_execution"]["node"], "MemoryNode")
+        self.assertEqual(update["log_path"], self.log_path)
+        self.assertEqual(state["memory"], [])
+    
+    
+    def test_async_run_matches_sync_run(self):
+        topic = "The role of artificial intelligence in society"
+        sync_orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic)
+        async_orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic)
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync_state = sync_orchestrator.run()
+            async_state = asyncio.run(async_orchestrator.arun())
+        
+        self.assertEqual(
+            [e["text"] for e in sync_state["memory"]],
+            [e["text"] for e in async_state["memory"]]
+        )
+        self.assertEqual(sync_state["winner"], async_state["winner"])
+    
+    def test_concurrent_debates_interleave_on_backend_latency(self):
+        backend = SimulatedBackend(latency=0.02)
+        orchestrators = [
+            DebateOrchestrator(
+                seed=42,
+                log_path=self.log_path,
+                topic=f"Concurrent debate topic number {i}",
+                backend=backend,
+            )
+            for i in range(10)
+        ]
+        
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = asyncio.run(run_debates_concurrently(orchestrators, max_in_flight=10))
+        elapsed = time.perf_counter() - started
+        
+        self.assertTrue(all(isinstance(r, dict) and r["winner"] for r in results))
+        sequential_latency = backend.calls * backend.latency
+        self.assertLess(elapsed, sequential_latency / 2)
+    
+    
+    def test_reset_reuses_compiled_graph(self):
+        topic = "The role of artificial intelligence in society"
+        orchestrator = DebateOrchestrator(seed=1, log_path=self.log_path, topic="Some earlier debate topic", verbose=False)
+        orchestrator.run()
+        graph = orchestrator.graph
+        
+        reused = orchestrator.reset(topic=topic, debate_id="second", seed=42).run()
+        fresh = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic, verbose=False).run()
+        
+        self.assertIs(orchestrator.graph, graph)
+        self.assertEqual([e["text"] for e in reused["memory"]], [e["text"] for e in fresh["memory"]])
+        self.assertEqual(reused["winner"], fresh["winner"])
+        self.assertEqual(orchestrator.logger_node.log_entries[0]["debate_id"], "second")
+    
+    def test_overlapping_runs_on_one_orchestrator_are_rejected(self):
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            backend=SimulatedBackend(latency=0.01),
+            verbose=False,
+        )
+        
+        async def overlap():
+            return await asyncio.gather(orchestrator.arun(), orchestrator.arun(), return_exceptions=True)
+        
+        first, second = asyncio.run(overlap())
+        
+        self.assertEqual(len(first["memory"]), 8)
+        self.assertIsInstance(second, RuntimeError)
+        self.assertEqual(len(orchestrator.reset(topic="Another topic for the same orchestrator").run()["memory"]), 8)
+    
+    def test_reset_is_rejected_during_a_run(self):
+        errors = []
+        
+        def on_event(event):
+            try:
+                orchestrator.reset(topic="Another topic")
+            except RuntimeError as e:
+                errors.append(e)
+        
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            verbose=False,
+            on_event=on_event,
+        )
+        final_state = orchestrator.run()
+        
+        self.assertTrue(errors)
+        self.assertEqual(final_state["topic"], "The role of artificial intelligence in society")
+    
+    def test_orchestrator_pool_reuses_released_orchestrators(self):
+        pool = OrchestratorPool(max_idle_per_key=1)
+        factory = lambda: DebateOrchestrator(log_path=self.log_path, verbose=False)
+        
+        first = pool.acquire("scientist,philosopher", factory)
+        second = pool.acquire("scientist,philosopher", factory)
+        pool.release("scientist,philosopher", first)
+        pool.release("scientist,philosopher", second)
+        
+        self.assertIs(pool.acquire("scientist,philosopher", factory), first)
+        self.assertEqual(pool.created, 2)
+    
+    def test_closing_pipelined_orchestrators_stops_their_workers(self):
+        pool = OrchestratorPool(max_idle_per_key=1)
+        factory = lambda: DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            verbose=False,
+            pipeline=True,
+        )
+        first = pool.acquire("pipelined", factory)
+        second = pool.acquire("pipelined", factory)
+        first.run()
+        second.run()
+        
+        pool.release("pipelined", first)
+        pool.release("pipelined", second)
+        self.assertIsNone(second.post_turn._thread)
+        self.assertTrue(first.post_turn._thread.is_alive())
+        
+        pool.close()
+        self.assertIsNone(first.post_turn._thread)
+        rerun = first.reset(topic="The role of artificial intelligence in society", debate_id="again").run()
+        self.assertEqual(len(rerun["memory"]), 8)
+        first.close()
+    
+    
+    def test_long_debate_runs_past_default_recursion_limit(self):
+        topic = "The role of artificial intelligence in society"
+        orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic, verbose=False, total_rounds=80)
+        
+        final_state = orchestrator.run()
+        
+        self.assertTrue(orchestrator.long_debate)
+        self.assertEqual(orchestrator._graph_config()["recursion_limit"], 170)
+        self.assertEqual(len(final_state["memory"]), 80)
+        self.assertEqual(final_state["debate_status"]["total_rounds"], 80)
+        self.assertTrue(final_state["repetition_warnings"])
+        self.assertIn(final_state["winner"], ("AgentA", "AgentB"))
+        snapshots = [e for e in orchestrator.logger_node.log_entries if e["type"] == "memory_snapshot"]
+        self.assertEqual(len(snapshots), 1)
+    
+    def test_short_debates_keep_full_history_analysis(self):
+        orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, verbose=False, total_rounds=12)
+        
+        self.assertFalse(orchestrator.long_debate)
+        self.assertTrue(orchestrator.coordinator_node.analyze_each_turn)
+        self.assertIsNone(orchestrator.agent_a.history_window)
+        self.assertEqual(len(orchestrator.coordinator_node.turn_order), 12)
+    
+    
+    def _run_normalized(self, executor: str, asynchronous: bool = False, **kwargs):
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            debate_id="conformance",
+            executor=executor,
+            **kwargs,
+        )
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            final_state = asyncio.run(orchestrator.arun()) if asynchronous else orchestrator.run()
+        normalize = lambda value: TIMESTAMP.sub("<ts>", json.dumps(value, default=str))
+        return normalize(final_state), output.getvalue(), normalize(orchestrator.logger_node.log_entries)
+    
+    def test_loop_executor_matches_graph_invoke(self):
+        for asynchronous, kwargs in ((False, {}), (True, {}), (False, {"total_rounds": 70})):
+            with self.subTest(asynchronous=asynchronous, **kwargs):
+                graph_state, graph_stdout, graph_log = self._run_normalized("graph", asynchronous, **kwargs)
+                loop_state, loop_stdout, loop_log = self._run_normalized("loop", asynchronous, **kwargs)
+                
+                self.assertEqual(loop_state, graph_state)
+                self.assertEqual(loop_stdout, graph_stdout)
+                self.assertEqual(loop_log, graph_log)
+    
+    def test_loop_executor_compiles_graph_only_on_demand(self):
+        orchestrator = DebateOrchestrator(log_path=self.log_path, verbose=False, executor="loop")
+        
+        self.assertIsNone(orchestrator._graph)
+        self.assertIn("coordinator", orchestrator.graph.get_graph().nodes)
+        with self.assertRaises(ValueError):
+            DebateOrchestrator(log_path=self.log_path, executor="threads")
+    
+    
+    def test_pipelined_post_turn_work_matches_inline(self):
+        for asynchronous, kwargs in ((False, {}), (True, {}), (False, {"executor": "loop", "total_rounds": 12})):
+            executor = kwargs.pop("executor", "graph")
+            with self.subTest(asynchronous=asynchronous, executor=executor, **kwargs):
+                inline = self._run_normalized(executor, asynchronous, **kwargs)
+                pipelined = self._run_normalized(executor, asynchronous, pipeline=True, **kwargs)
+                
+                self.assertEqual(pipelined, inline)
+    
+    def test_pipelined_turns_hand_post_turn_work_to_worker(self):
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic="The role of artificial intelligence in society",
+            verbose=False,
+            pipeline=True,
+        )
+        threads = set()
+        orchestrator.on_event = lambda event: event["type"] == "turn" and threads.add(threading.get_ident())
+        
+        orchestrator.run()
+        
+        self.assertEqual(orchestrator.post_turn.submitted, 8)
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(orchestrator.logger_node.log_entries[-1]["type"], "final_verdict")
+    
+    
+    def test_debate_deadline_falls_back_to_templates(self):
+        topic = "The role of artificial intelligence in society"
+        orchestrator = DebateOrchestrator(
+            seed=42,
+            log_path=self.log_path,
+            topic=topic,
+            verbose=False,
+            backend=SimulatedBackend(latency=0.5),
+            debate_timeout=0.1,
+        )
+        
+        started = time.perf_counter()
+        final_state = orchestrator.run()
+        elapsed = time.perf_counter() - started
+        template_state = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic, verbose=False).run()
+        
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([e["text"] for e in final_state["memory"]], [e["text"] for e in template_state["memory"]])
+        warnings = [e for e in orchestrator.logger_node.log_entries if e["type"] == "warning"]
+        fallback = [e for e in warnings if e["data"]["warning_type"] == "generation_fallback"]
+        self.assertEqual(sum(fallback[0]["data"]["details"]["fallbacks"].values()), 8)
+    
+    
+    def test_memory_index_is_built_only_when_searched(self):
+        topic = "The role of artificial intelligence in society"
+        orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic, verbose=False)
+        
+        final_state = orchestrator.run()
+        
+        self.assertEqual(len(orchestrator.memory_node.index), 0)
+        latest_a = [e for e in final_state["memory"] if e["agent"] == "AgentA"][-1]
+        self.assertEqual(orchestrator.memory_node.search(latest_a["text"], k=1, agent_filter="AgentA"), [latest_a])
+        self.assertEqual(len(orchestrator.memory_node.index), 8)
+    
+    def test_memory_node_search_covers_the_debate(self):
+        topic = "The role of artificial intelligence in society"
+        orchestrator = DebateOrchestrator(seed=42, log_path=self.log_path, topic=topic, verbose=False, context_retrieval=2)
+        
+        final_state = orchestrator.run()
+        
+        self.assertIs(orchestrator.agent_a.context_packer.memory, orchestrator.memory_node)
+        latest_b = [e for e in final_state["memory"] if e["agent"] == "AgentB"][-1]
+        results = orchestrator.memory_node.search(latest_b["text"], k=3, agent_filter="AgentB")
+        self.assertEqual(len(orchestrator.memory_node.index), len(final_state["memory"]))
+        self.assertEqual(results[0], latest_b)
+        self.assertTrue(all(e["agent"] == "AgentB" for e in results))
+        
+        orchestrator.reset(topic=topic, debate_id="second", seed=7)
+        self.assertEqual(orchestrator.memory_node.search(latest_b["text"]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import json
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from debate_replay import load_debates
+from tournament_runner import Leaderboard, iter_pairings, run_tournament
+
+
+class TestLeaderboard(unittest.TestCase):
+    
+    def test_winner_gains_rating(self):
+        leaderboard = Leaderboard()
+        leaderboard.record("scientist", "philosopher", "scientist")
+        
+        rankings = leaderboard.rankings()
+        
+        self.assertEqual(rankings[0]["persona"], "scientist")
+        self.assertEqual(rankings[0]["rating"], 1516.0)
+        self.assertEqual(rankings[1]["rating"], 1484.0)
+        self.assertEqual(rankings[0]["win_rate"], 1.0)
+    
+    def test_draw_counts_half_a_win(self):
+        leaderboard = Leaderboard()
+        leaderboard.record("scientist", "philosopher", None)
+        
+        for row in leaderboard.rankings():
+            self.assertEqual(row["draws"], 1)
+            self.assertEqual(row["win_rate"], 0.5)
+            self.assertEqual(row["rating"], 1500.0)
+    
+    def test_pairings_cover_both_sides(self):
+        pairings = list(iter_pairings(["a", "b", "c"], ["Topic one", "Topic two"]))
+        
+        self.assertEqual(len(pairings), 12)
+        self.assertEqual(len({p["pairing_id"] for p in pairings}), 12)
+
+
+class TestRunTournament(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.results_path = os.path.join(self.work_dir, "tournament.jsonl")
+        self.log_path = os.path.join(self.work_dir, "tournament_log.jsonl")
+        self.topics = ["The role of artificial intelligence in society\n", "bad\n"]
+    
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def _run(self, **kwargs):
+        return run_tournament(
+            self.topics,
+            personas=["scientist", "philosopher"],
+            results_path=self.results_path,
+            log_path=self.log_path,
+            seed=42,
+            workers=2,
+            **kwargs,
+        )
+    
+    def test_tournament_writes_results_and_leaderboard(self):
+        summary = self._run()
+        
+        self.assertEqual(summary["counts"], {"ok": 2, "error": 0, "skipped": 0})
+        self.assertEqual(len(summary["rejected"]), 1)
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 2)
+        self.assertTrue(all(r["winner_persona"] in ("scientist", "philosopher") for r in records))
+        
+        with open(summary["leaderboard_path"], 'r', encoding='utf-8') as f:
+            leaderboard = json.load(f)
+        self.assertEqual(leaderboard["completed"], 2)
+        self.assertEqual(sum(row["games"] for row in leaderboard["rankings"]), 4)
+    
+    def test_debate_options_reach_every_pairing(self):
+        summary = self._run(total_rounds=4, executor="loop", pipeline=True, context_options={"context_tokens": 64})
+        
+        self.assertEqual(summary["counts"]["ok"], 2)
+        states = load_debates(self.log_path)
+        self.assertEqual(len(states), 2)
+        self.assertTrue(all(len(state["memory"]) == 4 for state in states))
+    
+    def test_resume_skips_completed_pairings(self):
+        first = self._run()
+        second = self._run()
+        
+        self.assertEqual(second["counts"], {"ok": 0, "error": 0, "skipped": 2})
+        self.assertEqual(second["rankings"], first["rankings"])
+    
+    def test_resume_with_another_seed_plays_again(self):
+        self._run()
+        
+        summary = run_tournament(
+            self.topics,
+            personas=["scientist", "philosopher"],
+            results_path=self.results_path,
+            log_path=self.log_path,
+            seed=7,
+            workers=2,
+        )
+        
+        self.assertEqual(summary["counts"], {"ok": 2, "error": 0, "skipped": 0})
+    
+    def test_rejects_unknown_personas(self):
+        with self.assertRaises(ValueError):
+            run_tournament(self.topics, personas=["scientist", "poet"], results_path=self.results_path, log_path=self.log_path)
+        
+        self.assertFalse(os.path.exists(self.results_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
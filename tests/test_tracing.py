@@ -0,0 +1,85 @@
+import unittest
+import os
+import json
+import time
+from nodes.tracing import SpanTracer
+
+
+class TestSpanTracer(unittest.TestCase):
+    
+    def setUp(self):
+        self.tracer = SpanTracer()
+        self.trace_path = "test_trace.json"
+    
+    def tearDown(self):
+        if os.path.exists(self.trace_path):
+            os.remove(self.trace_path)
+    
+    def test_nested_spans(self):
+        with self.tracer.span("turn_a", round=1):
+            with self.tracer.span("agent"):
+                time.sleep(0.001)
+            with self.tracer.span("memory"):
+                pass
+        
+        spans = self.tracer.get_spans()
+        self.assertEqual([s["name"] for s in spans], ["turn_a", "agent", "memory"])
+        
+        turn, agent, memory = spans
+        self.assertEqual(turn["depth"], 0)
+        self.assertEqual(agent["parent"], "turn_a")
+        self.assertEqual(memory["depth"], 1)
+        self.assertEqual(turn["args"], {"round": 1})
+        self.assertGreaterEqual(turn["duration_us"], agent["duration_us"])
+        self.assertGreaterEqual(agent["start_us"], turn["start_us"])
+    
+    def test_wrap_records_span_and_returns_result(self):
+        wrapped = self.tracer.wrap("coordinator", lambda state: {"next": state["round"] + 1},
+                                   span_args=lambda state: {"round": state["round"]})
+        
+        result = wrapped({"round": 3})
+        
+        self.assertEqual(result, {"next": 4})
+        span = self.tracer.get_spans()[0]
+        self.assertEqual(span["name"], "coordinator")
+        self.assertEqual(span["args"], {"round": 3})
+    
+    def test_disabled_tracer_records_nothing(self):
+        tracer = SpanTracer(enabled=False)
+        fn = lambda state: state
+        
+        self.assertIs(tracer.wrap("node", fn), fn)
+        with tracer.span("turn"):
+            pass
+        self.assertEqual(tracer.get_spans(), [])
+    
+    def test_summarize(self):
+        for _ in range(3):
+            with self.tracer.span("judge"):
+                pass
+        
+        summary = self.tracer.summarize()
+        self.assertEqual(summary["judge"]["count"], 3)
+        self.assertGreaterEqual(summary["judge"]["total_us"], summary["judge"]["max_us"])
+    
+    def test_export_chrome_trace(self):
+        with self.tracer.span("debate", category="debate"):
+            with self.tracer.span("turn_b"):
+                pass
+        
+        self.tracer.export_chrome_trace(self.trace_path)
+        
+        with open(self.trace_path, 'r') as f:
+            trace = json.load(f)
+        
+        events = trace["traceEvents"]
+        self.assertEqual(len(events), 2)
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            for key in ("name", "cat", "ts", "dur", "pid", "tid"):
+                self.assertIn(key, event)
+        self.assertEqual(events[0]["cat"], "debate")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+import os
+import re
+import tempfile
 from nodes.user_input_node import UserInputNode
 
 
@@ -35,6 +38,69 @@ class TestUserInputNode(unittest.TestCase):
         is_valid, error = self.node.validate_topic("   ")
         self.assertFalse(is_valid)
         self.assertIn("empty", error.lower())
+    
+    
+    def test_preset_topic_skips_prompt(self):
+        node = UserInputNode(topic="  Is   <open> science   good for society  ")
+        result = node({})
+        self.assertEqual(result["topic"], "Is open science good for society")
+    
+    def test_invalid_preset_topic_raises(self):
+        node = UserInputNode(topic="short")
+        with self.assertRaises(ValueError):
+            node({})
+    
+    def test_read_topics(self):
+        lines = ["A perfectly valid debate topic\n", "\n", "tiny\n"]
+        results = list(self.node.read_topics(lines))
+        
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], (0, "A perfectly valid debate topic", "A perfectly valid debate topic", ""))
+        index, raw, topic, error = results[1]
+        self.assertEqual(index, 2)
+        self.assertIsNone(topic)
+        self.assertIn("too short", error.lower())
+    
+    
+    def test_sanitize_matches_regex_reference(self):
+        samples = [
+            "  Tabs\tand\r\nnewlines  ", "a<b>{c}\\d", "sep\x1cara\x1ftors", "non\u00a0breaking\u2003space",
+            "Caf\u00e9 <culture> debate", "", "<>{}",
+        ]
+        for text in samples:
+            expected = ' '.join(re.sub(r'[<>{}\\]', '', text).split()).strip()
+            self.assertEqual(self.node.sanitize_input(text), expected)
+    
+    def test_ingest_topics_routes_rejects(self):
+        rejects = []
+        lines = ["A perfectly valid debate topic\n", "\n", "tiny\n", "<>{}\n", "x" * 600]
+        topics = self.node.ingest_topics(lines, on_reject=lambda *reject: rejects.append(reject))
+        
+        self.assertEqual(next(topics), "A perfectly valid debate topic")
+        self.assertEqual(list(topics), [])
+        self.assertEqual([index for index, _, _ in rejects], [2, 3, 4])
+        self.assertIn("too short", rejects[0][2].lower())
+        self.assertIn("empty", rejects[1][2].lower())
+        self.assertIn("too long", rejects[2][2].lower())
+    
+    def test_ingest_topic_file_matches_read_topics(self):
+        lines = [
+            "Should  cities\tban cars <downtown>\r\n", "\n", "tiny\n", "Caf\u00e9 culture is worth   protecting\n",
+            "{}\n", "   Universal basic income should be adopted\n",
+        ] * 50 + ["Unterminated final line of the file"]
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "topics.txt")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write("".join(lines))
+            
+            node = UserInputNode()
+            node.READ_BUFFER_SIZE = 64
+            rejects = []
+            topics = list(node.ingest_topic_file(path, on_reject=lambda *reject: rejects.append(reject)))
+        
+        expected = list(self.node.read_topics(lines))
+        self.assertEqual(topics, [topic for _, _, topic, _ in expected if topic is not None])
+        self.assertEqual(rejects, [(index, raw, error) for index, raw, topic, error in expected if topic is None])
 
 
 if __name__ == '__main__':
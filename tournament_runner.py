@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import permutations
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
+
+from batch_runner import init_batch_worker, run_single_debate
+from nodes import UserInputNode, LogSink
+from nodes.logger_node import rotation_options
+from nodes.personas import check_personas, list_personas
+
+
+def pairing_id(topic: str, persona_a: str, persona_b: str, seed: Optional[int] = None) -> str:
+    topic_hash = hashlib.sha1(topic.encode('utf-8')).hexdigest()[:12]
+    return f"{persona_a}:{persona_b}:{topic_hash}:seed={seed}"
+
+
+def iter_pairings(personas: List[str], topics: Iterable[str], seed: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    for topic in topics:
+        for persona_a, persona_b in permutations(personas, 2):
+            yield {
+                "pairing_id": pairing_id(topic, persona_a, persona_b, seed),
+                "topic": topic,
+                "personas": [persona_a, persona_b],
+            }
+
+
+class Leaderboard:
+
+    def __init__(self, k_factor: float = 32.0, initial_rating: float = 1500.0):
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.standings: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, persona: str) -> Dict[str, Any]:
+        if persona not in self.standings:
+            self.standings[persona] = {
+                "persona": persona,
+                "rating": self.initial_rating,
+                "games": 0,
+                "wins": 0,
+                "losses": 0,
+                "draws": 0,
+            }
+        return self.standings[persona]
+
+    def record(self, persona_a: str, persona_b: str, winner: Optional[str]):
+        a = self._entry(persona_a)
+        b = self._entry(persona_b)
+
+        expected_a = 1.0 / (1.0 + 10 ** ((b["rating"] - a["rating"]) / 400.0))
+        if winner == persona_a:
+            score_a = 1.0
+            a["wins"] += 1
+            b["losses"] += 1
+        elif winner == persona_b:
+            score_a = 0.0
+            a["losses"] += 1
+            b["wins"] += 1
+        else:
+            score_a = 0.5
+            a["draws"] += 1
+            b["draws"] += 1
+
+        delta = self.k_factor * (score_a - expected_a)
+        a["rating"] += delta
+        b["rating"] -= delta
+        a["games"] += 1
+        b["games"] += 1
+
+    def rankings(self) -> List[Dict[str, Any]]:
+        rows = []
+        for entry in self.standings.values():
+            row = dict(entry)
+            row["rating"] = round(entry["rating"], 1)
+            row["win_rate"] = round((entry["wins"] + 0.5 * entry["draws"]) / entry["games"], 4) if entry["games"] else 0.0
+            rows.append(row)
+        rows.sort(key=lambda r: (-r["rating"], -r["win_rate"], r["persona"]))
+        for rank, row in enumerate(rows, start=1):
+            row["rank"] = rank
+        return rows
+
+    def write(self, path: str, completed: int, total: int):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"completed": completed, "total": total, "rankings": self.rankings()}, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def _winner_persona(record: Dict[str, Any]) -> Optional[str]:
+    sides = {"AgentA": record["personas"][0], "AgentB": record["personas"][1]}
+    return sides.get(record.get("winner"))
+
+
+def load_completed(results_path: str, leaderboard: Leaderboard) -> Set[str]:
+    completed = set()
+    if not os.path.exists(results_path):
+        return completed
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") != "ok" or record.get("pairing_id") in completed:
+                continue
+            completed.add(record["pairing_id"])
+            leaderboard.record(record["personas"][0], record["personas"][1], record.get("winner_persona"))
+    return completed
+
+
+def default_leaderboard_path(results_path: str) -> str:
+    root, _ = os.path.splitext(results_path)
+    return f"{root}_leaderboard.json"
+
+
+def run_tournament(
+    topics: Iterable[str],
+    personas: List[str],
+    results_path: str,
+    log_path: str,
+    leaderboard_path: Optional[str] = None,
+    seed: Optional[int] = None,
+    log_options: Optional[dict] = None,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    backend_latency: Optional[float] = None,
+    memo_options: Optional[dict] = None,
+    total_rounds: Optional[int] = None,
+    executor: str = "graph",
+    pipeline: bool = False,
+    deadline_options: Optional[dict] = None,
+    context_options: Optional[dict] = None,
+    on_result=None,
+) -> Dict[str, Any]:
+    if len(personas) < 2:
+        raise ValueError("A tournament needs at least 2 personas")
+    check_personas(personas)
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    leaderboard_path = leaderboard_path or default_leaderboard_path(results_path)
+
+    user_input = UserInputNode()
+    valid_topics = []
+    rejected = []
+    for _, raw_topic, topic, error_msg in user_input.read_topics(topics):
+        if topic is None:
+            rejected.append({"topic": raw_topic, "error": error_msg})
+        else:
+            valid_topics.append(topic)
+
+    leaderboard = Leaderboard()
+    completed = load_completed(results_path, leaderboard)
+    pairings = list(iter_pairings(personas, valid_topics, seed))
+    total = len(pairings)
+    counts = {"ok": 0, "error": 0, "skipped": 0}
+
+    results_dir = os.path.dirname(results_path)
+    if results_dir and not os.path.exists(results_dir):
+        os.makedirs(results_dir, exist_ok=True)
+
+    with open(results_path, 'a', encoding='utf-8') as results, LogSink(log_path, **rotation_options(log_options)) as sink:
+
+        def collect(future, pairing):
+            record = future.result()
+            record.update({"pairing_id": pairing["pairing_id"], "personas": pairing["personas"]})
+            if record["status"] == "ok":
+                record["winner_persona"] = _winner_persona(record)
+                leaderboard.record(pairing["personas"][0], pairing["personas"][1], record["winner_persona"])
+                completed.add(pairing["pairing_id"])
+            counts[record["status"]] += 1
+            results.write(json.dumps(record) + '\n')
+            results.flush()
+            leaderboard.write(leaderboard_path, len(completed), total)
+            if on_result is not None:
+                on_result(record, leaderboard)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_batch_worker,
+            initargs=(sink.queue,),
+        ) as pool:
+            pending = {}
+            for index, pairing in enumerate(pairings):
+                if pairing["pairing_id"] in completed:
+                    counts["skipped"] += 1
+                    continue
+
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future, pending.pop(future))
+
+                job = {
+                    "index": index,
+                    "topic": pairing["topic"],
+                    "debate_id": uuid.uuid4().hex[:12],
+                    "seed": seed,
+                    "log_path": log_path,
+                    "persona_config": {"AgentA": pairing["personas"][0], "AgentB": pairing["personas"][1]},
+                    "log_options": log_options,
+                    "backend_latency": backend_latency,
+                    "memo_options": memo_options,
+                    "total_rounds": total_rounds,
+                    "executor": executor,
+                    "pipeline": pipeline,
+                    "deadline_options": deadline_options,
+                    "context_options": context_options,
+                }
+                pending[pool.submit(run_single_debate, job)] = pairing
+
+            for future in wait(pending).done:
+                collect(future, pending.pop(future))
+
+    leaderboard.write(leaderboard_path, len(completed), total)
+    return {
+        "counts": counts,
+        "rejected": rejected,
+        "total": total,
+        "leaderboard_path": leaderboard_path,
+        "rankings": leaderboard.rankings(),
+    }